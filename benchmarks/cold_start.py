@@ -0,0 +1,152 @@
+"""
+Cold-start benchmark for Word Guessing Game
+Measures the time from process start to the first presented frame and reports where the
+import time goes; exits with status 1 when the median exceeds the budget
+
+    python benchmarks/cold_start.py --runs 5 --budget-ms 600
+
+Each run is a fresh interpreter running main() with SDL's dummy video driver (pass
+--driver to use a real one). The first display.flip() or display.update() ends the run.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+PACKAGE = "words_guessing_game_banbar1"
+
+# Median time to first frame (ms) above which the benchmark fails
+DEFAULT_BUDGET_MS = 600
+
+# Run in the child: start the game and report the moment the first frame is presented
+_CHILD = """
+import os, sys, time
+sys.path.insert(0, {src!r})
+import pygame
+
+def _first_frame(present):
+    def wrapper(*args):
+        present(*args)
+        print("FIRST_FRAME", time.monotonic(), flush=True)
+        os._exit(0)
+    return wrapper
+
+pygame.display.flip = _first_frame(pygame.display.flip)
+pygame.display.update = _first_frame(pygame.display.update)
+
+from {package}.main_game_func import main
+main()
+"""
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _child_env(driver, data_dir):
+    env = dict(os.environ)
+    env["SDL_VIDEODRIVER"] = driver
+    env["SDL_AUDIODRIVER"] = "dummy"
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    env["WORDS_GAME_DATA_DIR"] = data_dir  # Keep the player's stats and leaderboard untouched
+    return env
+
+
+def run_once(driver="dummy", import_time=False):
+    """
+    Start the game in a new process and wait for its first frame
+
+    Args:
+        driver: SDL video driver of the child process
+        import_time: Run the child with -X importtime and return its report
+
+    Returns:
+        tuple: (milliseconds from process start to the first frame, importtime report or "")
+    """
+    command = [sys.executable]
+    if import_time:
+        command += ["-X", "importtime"]
+    command += ["-c", _CHILD.format(src=SRC_DIR, package=PACKAGE)]
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        start = time.monotonic()
+        result = subprocess.run(command, env=_child_env(driver, data_dir), capture_output=True,
+                                text=True, timeout=60)
+    for line in result.stdout.splitlines():
+        if line.startswith("FIRST_FRAME "):
+            return (float(line.split()[1]) - start) * 1000, result.stderr
+    raise RuntimeError(f"the game exited without presenting a frame:\n{result.stderr}")
+
+
+def import_breakdown(report, top=10):
+    """
+    Summarize a -X importtime report
+
+    Args:
+        report: stderr of a child run with -X importtime
+        top: How many modules of the package to list
+
+    Returns:
+        dict: 'groups' maps pygame / the package / everything else to the cumulative
+        milliseconds of their top-level imports; 'modules' lists the package modules
+        with the most self time as (name, ms)
+    """
+    groups = {"pygame": 0.0, PACKAGE: 0.0, "other": 0.0}
+    modules = []
+    for line in report.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        root = name.split(".")[0]
+        if len(indent) == 1:  # Imported by the child itself, not by another module
+            groups[root if root in groups else "other"] += int(cumulative_us) / 1000
+        if root == PACKAGE:
+            modules.append((name, int(self_us) / 1000))
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return {"groups": groups, "modules": modules[:top]}
+
+
+def measure(runs=5, driver="dummy"):
+    """
+    Time several cold starts plus one run with the import breakdown
+
+    Returns:
+        dict: 'times_ms' of each run, 'median_ms', and the import breakdown
+    """
+    times = [run_once(driver)[0] for _ in range(runs)]
+    _, report = run_once(driver, import_time=True)
+    return {"times_ms": times, "median_ms": statistics.median(times), **import_breakdown(report)}
+
+
+def main(argv=None):
+    """Command line entry point; returns the exit status"""
+    parser = argparse.ArgumentParser(description="Time from process start to the first frame")
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to time")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="fail when the median time to first frame exceeds this")
+    parser.add_argument("--driver", default="dummy", help="SDL video driver (default: dummy)")
+    args = parser.parse_args(argv)
+
+    result = measure(args.runs, args.driver)
+    print("time to first frame: " + ", ".join(f"{t:.0f}" for t in result["times_ms"])
+          + f" ms (median {result['median_ms']:.0f} ms, budget {args.budget_ms:.0f} ms)")
+    print("import time (cumulative, top-level imports):")
+    for group, ms in result["groups"].items():
+        print(f"  {group:<30} {ms:8.1f} ms")
+    print(f"slowest {PACKAGE} modules (self time):")
+    for name, ms in result["modules"]:
+        print(f"  {name:<50} {ms:6.2f} ms")
+
+    if result["median_ms"] > args.budget_ms:
+        print(f"FAIL: median {result['median_ms']:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
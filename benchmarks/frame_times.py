@@ -0,0 +1,312 @@
+"""
+Frame-time benchmark for Word Guessing Game
+Renders frames headlessly for every screen in representative states, reports mean, p95 and
+p99 frame times, and exits with status 1 when a scenario got slower than the stored baseline
+
+    python benchmarks/frame_times.py --frames 60 --rounds 3 --output frame_times.json
+    python benchmarks/frame_times.py --scenario 'game:*' --threshold 0.25
+    python benchmarks/frame_times.py --update-baseline
+
+Every round runs the scenarios in a fresh interpreter; the lowest value of each metric is kept.
+A frame is what the main loop does for the screen being shown: tick the timeline, update,
+render and take the changed regions (or draw the transition). Time advances one frame
+interval per frame on a virtual clock, so every run draws the same frames. An animated
+scenario is set up again, untimed, whenever its animation finishes. The first frame after
+each setup builds the screen's background and is not timed.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+import pygame
+
+from words_guessing_game_banbar1.main_game_func import GameManager, GameState, ScreenSet
+from words_guessing_game_banbar1.ui.constants import (FPS, SCREEN_WIDTH, SCREEN_HEIGHT, ATTEMPT_CHOICES,
+                                                      LENGTH_CHOICES)
+from words_guessing_game_banbar1.ui.headless import init_headless, type_word
+from words_guessing_game_banbar1.ui.timeline import FrameClock, Timeline, VirtualTime
+from words_guessing_game_banbar1.ui.transitions import TRANSITIONS, TransitionCompositor, capture_screen
+from words_guessing_game_banbar1.functions.find import words_of_length
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frame_times_baseline.json")
+
+# Relative slowdown of a compared metric that fails the benchmark
+DEFAULT_THRESHOLD = 0.25
+# Slowdowns smaller than this (ms) are timer noise, whatever their relative size
+MIN_DELTA_MS = 0.1
+# Metrics compared with the baseline (p99 of a short run is a single frame and too noisy)
+COMPARED = ("mean_ms", "p95_ms")
+
+
+class Bench:
+    """Screens, timeline and target surface shared by the scenarios, on a virtual clock"""
+
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.time = VirtualTime()
+        self.timeline = Timeline(FrameClock(self.time))
+        self.screens = ScreenSet(timeline=self.timeline, size=size)
+        self.surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+
+    def advance(self):
+        """Move the virtual clock on by one frame"""
+        self.time.advance(1 / FPS)
+
+    def screen_frame(self, screen, game_manager):
+        """Return a callable drawing one main-loop frame of a screen"""
+        def draw():
+            self.timeline.tick()
+            screen.update(game_manager)
+            screen.render(self.surface, game_manager)
+            screen.dirty.take()
+        return draw
+
+    def start_game(self, attempts, length):
+        """Start a seeded game and return (game_manager, game screen)"""
+        game_manager = GameManager()
+        game_manager.start_game(attempts, length, seed=0)
+        screen = self.screens[GameState.PLAYING]
+        self.timeline.cancel_owner(screen)
+        screen.initialize_grid(attempts, length)
+        return game_manager, screen
+
+    def type(self, screen, game_manager, word, submit=True):
+        """Type a word into the game screen (input is ignored while a row flips; settle first)"""
+        for event in type_word(word, submit):
+            screen.handle_event(event, game_manager)
+
+    def settle(self, screen, game_manager):
+        """Run untimed frames until the screen stops animating"""
+        draw = self.screen_frame(screen, game_manager)
+        while self.timeline.active:
+            self.advance()
+            draw()
+
+
+def wrong_word(game_manager):
+    """A dictionary word of the game's length that is not the answer"""
+    return next(word for word in words_of_length(game_manager.word_length)
+                if word != game_manager.guess_word.lower())
+
+
+# Scenario setups: each takes the Bench and returns (draw one frame, whether the measured state lasts)
+
+def setup_screen(bench):
+    screen = bench.screens[GameState.SETUP]
+    return bench.screen_frame(screen, GameManager()), lambda: True
+
+
+def game_screen(length, attempts):
+    """A game with a scored guess (when there are attempts to spare) and a half-typed word"""
+    def setup(bench):
+        game_manager, screen = bench.start_game(attempts, length)
+        if attempts > 1:
+            bench.type(screen, game_manager, wrong_word(game_manager))
+            bench.settle(screen, game_manager)
+        bench.type(screen, game_manager, wrong_word(game_manager)[:length // 2], submit=False)
+        bench.settle(screen, game_manager)
+        return bench.screen_frame(screen, game_manager), lambda: True
+    return setup
+
+
+def flip(bench):
+    game_manager, screen = bench.start_game(6, 5)
+    bench.type(screen, game_manager, wrong_word(game_manager))
+    return bench.screen_frame(screen, game_manager), lambda: screen.flip_animation is not None
+
+
+def shake(bench):
+    game_manager, screen = bench.start_game(6, 5)
+    bench.type(screen, game_manager, "QQQQQ")
+    return bench.screen_frame(screen, game_manager), lambda: screen.shake_animation is not None
+
+
+def end_bounce(bench):
+    game_manager, game = bench.start_game(6, 5)
+    bench.type(game, game_manager, wrong_word(game_manager))
+    bench.settle(game, game_manager)
+    bench.type(game, game_manager, game_manager.guess_word)
+    bench.settle(game, game_manager)
+    screen = bench.screens[GameState.WIN]
+    screen.initialize_grid(6, 5)
+    return bench.screen_frame(screen, game_manager), lambda: screen.bounce_animation is not None
+
+
+def transition(kind):
+    """Setup screen to game screen, blended from snapshots as the main loop does"""
+    def setup(bench):
+        outgoing = capture_screen(bench.screens[GameState.SETUP], bench.surface.get_size(), GameManager())
+        game_manager, screen = bench.start_game(6, 5)
+        incoming = capture_screen(screen, bench.surface.get_size(), game_manager)
+        compositor = TransitionCompositor(kind, outgoing, incoming, bench.timeline)
+
+        def draw():
+            bench.timeline.tick()
+            compositor.draw(bench.surface)
+        return draw, lambda: compositor.active
+    return setup
+
+
+def scenarios():
+    """Every scenario by name, in run order"""
+    named = {"setup": setup_screen}
+    for length in LENGTH_CHOICES:
+        for attempts in ATTEMPT_CHOICES:
+            named[f"game:{length}x{attempts}"] = game_screen(length, attempts)
+    named["game:flip"] = flip
+    named["game:shake"] = shake
+    named["end:bounce"] = end_bounce
+    for kind in TRANSITIONS:
+        named[f"transition:{kind}"] = transition(kind)
+    return named
+
+
+def summarize(times):
+    """Mean, p95 and p99 of frame times in seconds, as milliseconds"""
+    cuts = statistics.quantiles(times, n=100, method="inclusive")
+    return {
+        "frames": len(times),
+        "mean_ms": round(statistics.fmean(times) * 1000, 4),
+        "p95_ms": round(cuts[94] * 1000, 4),
+        "p99_ms": round(cuts[98] * 1000, 4),
+    }
+
+
+def run_scenario(bench, setup, frames):
+    """
+    Time frames of one scenario
+
+    Returns:
+        list: Seconds taken by each timed frame
+    """
+    times = []
+    while len(times) < frames:
+        draw, running = setup(bench)
+        bench.advance()
+        draw()  # Builds the background; not timed
+        while running() and len(times) < frames:
+            bench.advance()
+            start = time.perf_counter()
+            draw()
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def measure(frames=60, pattern="*", size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    """
+    Run the scenarios whose names match a glob pattern in this process
+
+    Returns:
+        dict: Run settings and, under 'scenarios', the summary of each scenario
+    """
+    bench = Bench(size)
+    results = {}
+    for name, setup in scenarios().items():
+        if fnmatch.fnmatchcase(name, pattern):
+            results[name] = summarize(run_scenario(bench, setup, frames))
+    return {"frames": frames, "size": list(size), "scenarios": results}
+
+
+def run_round(frames=60, pattern="*"):
+    """Run measure() in a fresh headless interpreter and return its results"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    command = [sys.executable, os.path.abspath(__file__), "--worker", "--frames", str(frames), "--scenario", pattern]
+    result = subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def best_of(rounds):
+    """
+    Merge rounds, keeping the lowest value of every metric of every scenario
+
+    The speed of the same frames differs by up to a third from one interpreter to the
+    next, so one process is not a reliable measurement.
+    """
+    merged = dict(rounds[0], rounds=len(rounds), scenarios={})
+    for results in rounds:
+        for name, summary in results["scenarios"].items():
+            best = merged["scenarios"].setdefault(name, dict(summary))
+            for metric, value in summary.items():
+                best[metric] = min(best[metric], value)
+    return merged
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Find scenarios slower than the baseline
+
+    Args:
+        results: Output of measure() or best_of()
+        baseline: Earlier results
+        threshold: Relative slowdown allowed
+
+    Returns:
+        list: (scenario, metric, baseline ms, current ms) of every regression
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        for metric in COMPARED:
+            if current[metric] > before[metric] * (1 + threshold) + MIN_DELTA_MS:
+                regressions.append((name, metric, before[metric], current[metric]))
+    return regressions
+
+
+def main(argv=None):
+    """Command line entry point; returns the exit status"""
+    parser = argparse.ArgumentParser(description="Frame times of every screen, rendered headlessly")
+    parser.add_argument("--frames", type=int, default=60, help="timed frames per scenario and round")
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="processes running every scenario; the lowest value of each metric is kept")
+    parser.add_argument("--scenario", default="*", help="glob of scenario names to run (e.g. 'game:*')")
+    parser.add_argument("--output", metavar="PATH", help="write the results to this JSON file")
+    parser.add_argument("--baseline", metavar="PATH", default=BASELINE_PATH, help="results to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fail when a mean or p95 is this much slower than the baseline (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        init_headless()
+        print(json.dumps(measure(args.frames, args.scenario)))
+        return 0
+
+    results = best_of([run_round(args.frames, args.scenario) for _ in range(args.rounds)])
+    print(f"{'scenario':<24} {'mean ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, summary in results["scenarios"].items():
+        print(f"{name:<24} {summary['mean_ms']:9.3f} {summary['p95_ms']:9.3f} {summary['p99_ms']:9.3f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update-baseline to store one")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, before, after in regressions:
+        print(f"FAIL: {name} {metric} {before:.3f} -> {after:.3f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,7 +21,7 @@ class UserInputIntReader:
 
 class AttemptsReader(UserInputIntReader):
     def is_number_valid(self, input_number: int) -> bool:
-        return input_number >= 1 and input_number <= 10
+        return input_number >= 1 and input_number <= 100
 
 
 class LengthReader(UserInputIntReader):
@@ -0,0 +1,203 @@
+"""
+Append-only event log for Word Guessing Game
+Records game events as JSON lines and replays them into a GameManager
+"""
+
+import json
+import queue
+import sys
+import threading
+import time
+
+
+# Sentinel telling the writer thread to flush and exit
+_STOP = object()
+
+
+class ReplayError(Exception):
+    """Raised when a replayed event does not reproduce the logged result"""
+
+
+class EventLogWriter:
+    """Buffered append-only writer that serializes and flushes on a background thread"""
+
+    def __init__(self, path, flush_interval=0.5, buffer_size=64 * 1024):
+        """
+        Args:
+            path: Log file path (opened in append mode)
+            flush_interval: Max seconds an event may sit in the buffer before a flush
+            buffer_size: Size of the file write buffer in bytes
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self._queue = queue.SimpleQueue()
+        self._file = open(path, 'a', encoding='utf-8', buffering=buffer_size)
+        self._thread = threading.Thread(target=self._run, name="event-log-writer", daemon=True)
+        self._closed = False
+        self._thread.start()
+
+    def log(self, event_type, **data):
+        """
+        Queue an event for writing. Never touches the disk, safe to call from the frame loop
+
+        Args:
+            event_type: Event name ('start', 'key', 'guess', 'state', ...)
+            **data: JSON-serializable event fields
+        """
+        if self._closed:
+            return
+        data['type'] = event_type
+        data['t'] = time.time()
+        self._queue.put(data)
+
+    def _run(self):
+        """Writer thread: serialize queued events, flush flush_interval after the oldest unflushed one"""
+        flush_at = None  # monotonic() deadline of the oldest unflushed event, None when clean
+        while True:
+            timeout = None if flush_at is None else max(0.0, flush_at - time.monotonic())
+            try:
+                event = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                event = None
+
+            if event is _STOP:
+                break
+            if event is not None:
+                self._file.write(json.dumps(event, separators=(',', ':')) + '\n')
+                if flush_at is None:
+                    flush_at = time.monotonic() + self.flush_interval
+
+            # Checked after every event too, so steady traffic cannot hold the buffer back
+            if flush_at is not None and time.monotonic() >= flush_at:
+                self._file.flush()
+                flush_at = None
+
+        self._file.flush()
+        self._file.close()
+
+    def close(self):
+        """Flush all queued events and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+
+def iter_events(path):
+    """
+    Stream events from a log file one line at a time
+
+    Args:
+        path: Log file path
+
+    Yields:
+        dict: One decoded event per line
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class EventReplayer:
+    """Rebuilds GameManager state by re-applying logged events"""
+
+    def __init__(self, manager_factory=None, verify=True):
+        """
+        Args:
+            manager_factory: Callable returning a fresh GameManager (defaults to GameManager)
+            verify: Raise ReplayError when a replayed result differs from the log
+        """
+        if manager_factory is None:
+            from words_guessing_game_banbar1.main_game_func import GameManager
+            manager_factory = GameManager
+        self.manager = manager_factory()
+        self.verify = verify
+
+    def apply(self, event):
+        """
+        Apply one event to the game manager
+
+        Args:
+            event: Decoded event dict
+        """
+        manager = self.manager
+        event_type = event['type']
+
+        if event_type == 'start':
+            manager.start_game(event['attempts'], event['length'], seed=event['seed'],
+                               timed=event.get('timed', False))
+            if self.verify and manager.guess_word != event['word']:
+                raise ReplayError(f"Seed {event['seed']} picked '{manager.guess_word}', log has '{event['word']}'")
+
+        elif event_type == 'key':
+            if event['action'] == 'letter':
+                manager.add_letter(event['letter'])
+            else:
+                manager.remove_letter()
+
+        elif event_type == 'guess':
+            success, error = manager.submit_guess(event['word'])
+            if self.verify:
+                self._verify_guess(event, success, error)
+
+        elif event_type == 'reset':
+            manager.reset_game()
+
+    def _verify_guess(self, event, success, error):
+        """Compare a replayed guess against its logged feedback"""
+        if success != event['ok'] or error != event['error']:
+            raise ReplayError(f"Guess '{event['word']}' replayed as ({success}, '{error}')")
+        if success:
+            guess_data = self.manager.guesses[-1]
+            if (guess_data['match_indexes'] != event['match_indexes']
+                    or guess_data['right_indexes'] != event['right_indexes']):
+                raise ReplayError(f"Guess '{event['word']}' replayed with different feedback")
+
+
+def replay_games(events, manager_factory=None, verify=True):
+    """
+    Replay a stream of events, yielding the manager each time a game finishes
+
+    The same GameManager instance is reused between games, so consumers
+    should read what they need before advancing the iterator.
+
+    Args:
+        events: Iterable of event dicts (e.g. iter_events(path))
+        manager_factory: Callable returning a fresh GameManager
+        verify: Raise ReplayError on any mismatch with the log
+
+    Yields:
+        GameManager: State right after each WIN/LOSE transition
+    """
+    replayer = EventReplayer(manager_factory, verify)
+    for event in events:
+        replayer.apply(event)
+        if event['type'] == 'state' and event['to'] in ('WIN', 'LOSE'):
+            yield replayer.manager
+
+
+def main(argv=None):
+    """Replay a log file at full speed and print a short summary"""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: python -m words_guessing_game_banbar1.functions.event_log LOG_PATH")
+        return 2
+
+    games = 0
+    wins = 0
+    start = time.perf_counter()
+    for manager in replay_games(iter_events(argv[0])):
+        games += 1
+        if manager.check_win_condition():
+            wins += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"Replayed {games} game(s), {wins} win(s) in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,25 @@
 import random
 from words_guessing_game_banbar1.functions.validation import are_symbols_same
-from words_guessing_game_banbar1.functions.word_loader import english_words
- 
-def find_random_word(lenght):
-    target_words = []
-    for word in english_words:
-        if len(word) == lenght:
-            target_words.append(word)
-    return random.choice(target_words)
+from words_guessing_game_banbar1.functions.word_loader import get_english_words
+
+_words_by_length = {}
+
+
+def words_of_length(lenght):
+    """Return the sorted dictionary words of the given length (built once per length)"""
+    words = _words_by_length.get(lenght)
+    if words is None:
+        # Sorted so that a seeded random.Random always picks the same word,
+        # independent of set iteration order (PYTHONHASHSEED)
+        words = sorted(word for word in get_english_words() if len(word) == lenght)
+        _words_by_length[lenght] = words
+    return words
+
+
+def find_random_word(lenght, rng=None):
+    if rng is None:
+        rng = random
+    return rng.choice(words_of_length(lenght))
 
 
 def find_right_indexes(user_word, guess_word, match_indexes: list):
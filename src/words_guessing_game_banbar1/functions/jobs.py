@@ -0,0 +1,121 @@
+"""
+Background job executor for Word Guessing Game
+Runs expensive work off the frame loop; results are delivered back on the main thread
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for
+
+
+class Job:
+    """Handle for one submitted piece of work"""
+
+    def __init__(self, future, owner, on_done):
+        self.future = future
+        self.owner = owner
+        self.on_done = on_done
+        self.cancelled = False
+
+    @property
+    def done(self):
+        """True once the work has finished (successfully or not)"""
+        return self.future.done()
+
+    def result(self, timeout=None):
+        """
+        Return the job's result, waiting for it if necessary
+
+        Raises:
+            CancelledError: If the job was cancelled before it ran
+        """
+        return self.future.result(timeout)
+
+    def cancel(self):
+        """Cancel the job if it has not started, and drop its callback either way"""
+        self.cancelled = True
+        self.future.cancel()
+
+
+class JobExecutor:
+    """Thread (or process) pool polled once per frame by the main loop"""
+
+    def __init__(self, max_workers=2, use_processes=False):
+        """
+        Args:
+            max_workers: Pool size
+            use_processes: Use a process pool (work and results must be picklable)
+        """
+        if use_processes:
+            # Imported on demand: multiprocessing is slow to import and the game uses threads
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._jobs = []
+
+    def submit(self, fn, *args, owner=None, on_done=None, **kwargs):
+        """
+        Schedule fn(*args, **kwargs) on the pool
+
+        Args:
+            fn: Callable to run in the background
+            owner: Screen (or other object) the job belongs to, for cancel_owner()
+            on_done: Optional callback(job) run on the main thread by poll()
+
+        Returns:
+            Job: Handle that can be polled or cancelled
+        """
+        job = Job(self._pool.submit(fn, *args, **kwargs), owner, on_done)
+        self._jobs.append(job)
+        return job
+
+    def poll(self, wait=False):
+        """
+        Deliver finished jobs; call once per frame from the main thread
+
+        Args:
+            wait: Let every pending job finish first, so jobs are delivered on the frame
+                after they were submitted however long they take (reproducible scripted runs)
+
+        Returns:
+            int: Number of callbacks run
+        """
+        if not self._jobs:
+            return 0
+        if wait:
+            wait_for([job.future for job in self._jobs])
+
+        finished = [job for job in self._jobs if job.done or job.cancelled]
+        if not finished:
+            return 0
+        self._jobs = [job for job in self._jobs if not (job.done or job.cancelled)]
+
+        callbacks = 0
+        for job in finished:
+            if job.on_done is not None and not job.cancelled:
+                job.on_done(job)
+                callbacks += 1
+        return callbacks
+
+    def cancel_owner(self, owner):
+        """
+        Cancel every outstanding job of an owner (e.g. when its screen is left)
+
+        Returns:
+            int: Number of jobs cancelled
+        """
+        count = 0
+        for job in self._jobs:
+            if job.owner is owner and not job.done:
+                job.cancel()
+                count += 1
+        return count
+
+    @property
+    def pending(self):
+        """Number of jobs not yet delivered by poll()"""
+        return len(self._jobs)
+
+    def shutdown(self, wait=True):
+        """Stop the pool; with wait=True, queued work (e.g. stats writes) still completes"""
+        self._pool.shutdown(wait=wait)
+
@@ -0,0 +1,182 @@
+"""
+Speedrun leaderboard for Word Guessing Game
+Stores solve times in a local SQLite database and answers top-N / rank queries
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from words_guessing_game_banbar1.functions.storage import data_path
+
+LEADERBOARD_FILENAME = "leaderboard.db"
+
+# Width of a rank histogram bucket in microseconds (1 second)
+RANK_BUCKET_US = 1_000_000
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    length INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    time_us INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_setting_time ON results (length, attempts, time_us);
+
+-- Per-second histogram so a rank is a short SUM plus a count inside one bucket,
+-- instead of counting every faster row of the setting
+CREATE TABLE IF NOT EXISTS rank_buckets (
+    length INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (length, attempts, bucket)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS trg_results_bucket AFTER INSERT ON results
+BEGIN
+    INSERT INTO rank_buckets (length, attempts, bucket, count)
+    VALUES (NEW.length, NEW.attempts, NEW.time_us / {RANK_BUCKET_US}, 1)
+    ON CONFLICT (length, attempts, bucket) DO UPDATE SET count = count + 1;
+END;
+"""
+
+
+class LeaderboardDB:
+    """Synchronous access to the leaderboard database (one connection, one thread)"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: SQLite database file path (":memory:" for a throwaway board)
+        """
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def add_result(self, length, attempts, time_us):
+        """
+        Insert one solve time
+
+        Args:
+            length: Word length setting
+            attempts: Attempts setting
+            time_us: Solve time in microseconds
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO results (length, attempts, time_us, created_at) VALUES (?, ?, ?, ?)",
+                (length, attempts, time_us, time.time()),
+            )
+
+    def top_times(self, length, attempts, limit):
+        """
+        Return the fastest solve times of a setting
+
+        Returns:
+            list: Up to limit times in microseconds, fastest first
+        """
+        rows = self.conn.execute(
+            "SELECT time_us FROM results WHERE length = ? AND attempts = ? ORDER BY time_us LIMIT ?",
+            (length, attempts, limit),
+        )
+        return [row[0] for row in rows]
+
+    def rank_of(self, length, attempts, time_us):
+        """
+        Return the 1-based rank a time has within its setting (ties share a rank)
+        """
+        bucket = time_us // RANK_BUCKET_US
+        faster_buckets = self.conn.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM rank_buckets WHERE length = ? AND attempts = ? AND bucket < ?",
+            (length, attempts, bucket),
+        ).fetchone()[0]
+        faster_in_bucket = self.conn.execute(
+            "SELECT COUNT(*) FROM results WHERE length = ? AND attempts = ? AND time_us >= ? AND time_us < ?",
+            (length, attempts, bucket * RANK_BUCKET_US, time_us),
+        ).fetchone()[0]
+        return faster_buckets + faster_in_bucket + 1
+
+    def count(self, length, attempts):
+        """Return how many results a setting has"""
+        return self.conn.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM rank_buckets WHERE length = ? AND attempts = ?",
+            (length, attempts),
+        ).fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+
+class LeaderboardEntry:
+    """Result of submitting a time, filled in by the leaderboard thread"""
+
+    def __init__(self, length, attempts, time_us):
+        self.length = length
+        self.attempts = attempts
+        self.time_us = time_us
+        self.rank = None
+        self.total = None
+        self.top_times = []
+        self.done = False  # Set last, after all fields are filled in
+
+
+class Leaderboard:
+    """Leaderboard whose database work runs on a background thread"""
+
+    def __init__(self, path=None, top_n=5):
+        """
+        Args:
+            path: Database path (defaults to leaderboard.db in the data directory)
+            top_n: How many best times to fetch with each submission
+        """
+        if path is None:
+            path = data_path(LEADERBOARD_FILENAME)
+        self.path = path
+        self.top_n = top_n
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._thread.start()
+
+    def submit(self, length, attempts, time_us):
+        """
+        Queue a solve time for insertion and ranking
+
+        Returns:
+            LeaderboardEntry: Poll its done flag; rank and top_times are set once done
+        """
+        entry = LeaderboardEntry(length, attempts, time_us)
+        self._queue.put(entry)
+        return entry
+
+    def _run(self):
+        """Worker thread: owns the SQLite connection"""
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        db = LeaderboardDB(self.path)
+
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            db.add_result(entry.length, entry.attempts, entry.time_us)
+            entry.rank = db.rank_of(entry.length, entry.attempts, entry.time_us)
+            entry.total = db.count(entry.length, entry.attempts)
+            entry.top_times = db.top_times(entry.length, entry.attempts, self.top_n)
+            entry.done = True
+
+        db.close()
+
+    def close(self):
+        """Finish queued submissions and stop the worker thread"""
+        self._queue.put(None)
+        self._thread.join()
+
+
+def format_time(time_us):
+    """Format a solve time in microseconds as seconds, e.g. '12.34s'"""
+    return f"{time_us / 1_000_000:.2f}s"
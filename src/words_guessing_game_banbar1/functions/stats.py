@@ -0,0 +1,144 @@
+"""
+Persistent player statistics for Word Guessing Game
+Keeps running aggregates that are updated in O(1) per finished game
+"""
+
+import threading
+
+from words_guessing_game_banbar1.functions.storage import atomic_write_json, data_path, read_json
+
+STATS_FILENAME = "stats.json"
+
+
+def _setting_key(length, attempts):
+    """JSON object key for a (length, attempts) setting"""
+    return f"{length}x{attempts}"
+
+
+class PlayerStats:
+    """Games played, wins, streaks and per-setting guess distributions"""
+
+    def __init__(self, path=None, executor=None):
+        """
+        Args:
+            path: File the statistics are persisted to (None keeps them in memory only)
+            executor: Optional JobExecutor; saves then run in the background
+        """
+        self.path = path
+        self.executor = executor
+        self._write_lock = threading.Lock()
+        self._save_seq = 0      # Bumped for every save request
+        self._written_seq = 0   # Latest snapshot on disk
+        self.games_played = 0
+        self.wins = 0
+        self.current_streak = 0
+        self.max_streak = 0
+        # "LxA" -> {'played': int, 'wins': int, 'distribution': [count solved in 1..A guesses]}
+        self.settings = {}
+
+    @classmethod
+    def load(cls, path=None, executor=None):
+        """
+        Load statistics from disk, starting fresh if the file is missing or corrupt
+
+        Args:
+            path: Stats file path (defaults to stats.json in the data directory)
+            executor: Optional JobExecutor for background saves
+        """
+        if path is None:
+            path = data_path(STATS_FILENAME)
+        stats = cls(path, executor)
+        data = read_json(path)
+        if isinstance(data, dict):
+            stats.games_played = data.get('games_played', 0)
+            stats.wins = data.get('wins', 0)
+            stats.current_streak = data.get('current_streak', 0)
+            stats.max_streak = data.get('max_streak', 0)
+            stats.settings = data.get('settings', {})
+        return stats
+
+    def to_dict(self):
+        """Return the statistics as a JSON-serializable dict"""
+        return {
+            'games_played': self.games_played,
+            'wins': self.wins,
+            'current_streak': self.current_streak,
+            'max_streak': self.max_streak,
+            'settings': self.settings,
+        }
+
+    def record_game(self, length, attempts, won, guesses_used):
+        """
+        Fold one finished game into the aggregates and persist them
+
+        Args:
+            length: Word length setting
+            attempts: Attempts setting
+            won: True if the word was guessed
+            guesses_used: Number of guesses taken
+        """
+        self.games_played += 1
+        if won:
+            self.wins += 1
+            self.current_streak += 1
+            self.max_streak = max(self.max_streak, self.current_streak)
+        else:
+            self.current_streak = 0
+
+        setting = self.settings.setdefault(_setting_key(length, attempts), {
+            'played': 0,
+            'wins': 0,
+            'distribution': [0] * attempts,
+        })
+        setting['played'] += 1
+        if won:
+            setting['wins'] += 1
+            setting['distribution'][guesses_used - 1] += 1
+
+        self.save()
+
+    def save(self):
+        """Atomically write the statistics to disk (no-op for in-memory stats)
+
+        With an executor the write happens in the background on a snapshot taken now.
+        """
+        if self.path is None:
+            return
+        self._save_seq += 1
+        snapshot = self.to_dict()
+        snapshot['settings'] = {key: dict(value, distribution=list(value['distribution']))
+                                for key, value in self.settings.items()}
+        if self.executor is None:
+            self._write(self._save_seq, snapshot)
+        else:
+            self.executor.submit(self._write, self._save_seq, snapshot)
+
+    def _write(self, seq, snapshot):
+        """Write a snapshot unless a newer one has already been written"""
+        with self._write_lock:
+            if seq > self._written_seq:
+                atomic_write_json(self.path, snapshot)
+                self._written_seq = seq
+
+    @property
+    def win_rate(self):
+        """Percentage of games won, 0-100"""
+        if not self.games_played:
+            return 0
+        return round(100 * self.wins / self.games_played)
+
+    def get_distribution(self, length, attempts):
+        """
+        Return how many games of a setting were won in 1..attempts guesses
+
+        Args:
+            length: Word length setting
+            attempts: Attempts setting
+
+        Returns:
+            list: distribution[i] = wins that took i + 1 guesses
+        """
+        setting = self.settings.get(_setting_key(length, attempts))
+        if setting is None:
+            return [0] * attempts
+        return setting['distribution']
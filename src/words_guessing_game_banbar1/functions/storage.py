@@ -0,0 +1,61 @@
+"""
+Local storage helpers for Word Guessing Game
+Resolves the per-user data directory and writes files atomically
+"""
+
+import json
+import os
+import tempfile
+
+
+def get_data_dir():
+    """
+    Return the directory holding persistent game data
+
+    Uses $WORDS_GAME_DATA_DIR if set, otherwise ~/.words_guessing_game
+    """
+    return os.environ.get('WORDS_GAME_DATA_DIR') or os.path.join(os.path.expanduser("~"), ".words_guessing_game")
+
+
+def data_path(filename):
+    """Return the full path of a file inside the data directory"""
+    return os.path.join(get_data_dir(), filename)
+
+
+def atomic_write_json(path, data):
+    """
+    Write data as JSON so that readers see either the old or the new file, never a partial one
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable object
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    # Temp file must live on the same filesystem for os.replace to be atomic
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_json(path, default=None):
+    """
+    Read a JSON file, returning default if it is missing or unreadable
+
+    Args:
+        path: File path
+        default: Value returned when the file cannot be loaded
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
@@ -1,5 +1,5 @@
 import re
-from words_guessing_game_banbar1.functions.word_loader import english_words
+from words_guessing_game_banbar1.functions.word_loader import get_english_words
 
 def all_english_letters(s):
     return bool(re.fullmatch(r'[a-zA-Z]+', s))
@@ -22,7 +22,7 @@ def validate_word(user_word, lenght):
     if not check2:
         print("Your word must have only English letters")
     
-    check3 = user_word in english_words
+    check3 = user_word in get_english_words()
     if not check3:
         print("Your word must be in the English dictionary")
     return check1 and check2 and check3
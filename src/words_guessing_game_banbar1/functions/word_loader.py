@@ -1,5 +1,23 @@
 import os
 
 _words_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "words.txt")
-with open(_words_path) as f:
-    english_words = set(word.strip().lower() for word in f)
+_english_words = None
+
+
+def get_english_words():
+    """Return the dictionary, reading words.txt the first time it is needed
+
+    Read-only: shared by every game session (and every server connection).
+    """
+    global _english_words
+    if _english_words is None:
+        with open(_words_path) as f:
+            _english_words = frozenset(word.strip().lower() for word in f)
+    return _english_words
+
+
+def __getattr__(name):
+    # `from ...word_loader import english_words` keeps working (and loads the dictionary)
+    if name == "english_words":
+        return get_english_words()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,19 +4,28 @@ A Wordle-style word guessing game with graphical interface
 """
 
 import pygame
+import random
+import time
 from enum import Enum
 
 # Import UI components
 from words_guessing_game_banbar1.ui.constants import *
 from words_guessing_game_banbar1.ui.setup_screen import SetupScreen
-from words_guessing_game_banbar1.ui.game_screen import GameScreen
-from words_guessing_game_banbar1.ui.end_screen import EndScreen
-from words_guessing_game_banbar1.ui.animations import ScreenFadeTransition
+from words_guessing_game_banbar1.ui.transitions import TransitionCompositor, capture_screen
+from words_guessing_game_banbar1.ui.layout import fit_window_size
+from words_guessing_game_banbar1.ui.timeline import FrameClock, Timeline
+from words_guessing_game_banbar1.ui.input_context import InputContext
+from words_guessing_game_banbar1.ui.assets import create_asset_loader
+from words_guessing_game_banbar1.ui.text_cache import TEXT_CACHE
 
 # Import game logic functions
 from words_guessing_game_banbar1.functions.find import find_random_word, find_match_indexes, find_right_indexes
 from words_guessing_game_banbar1.functions.validation import all_english_letters, is_word_lenght_valid
-from words_guessing_game_banbar1.functions.word_loader import english_words
+from words_guessing_game_banbar1.functions.word_loader import get_english_words
+from words_guessing_game_banbar1.functions.event_log import EventLogWriter
+from words_guessing_game_banbar1.functions.stats import PlayerStats
+from words_guessing_game_banbar1.functions.leaderboard import Leaderboard
+from words_guessing_game_banbar1.functions.jobs import JobExecutor
 
 
 class GameState(Enum):
@@ -30,31 +39,124 @@ class GameState(Enum):
 class GameManager:
     """Manages game state and logic"""
 
-    def __init__(self):
-        """Initialize game manager"""
+    def __init__(self, event_log=None, stats=None, leaderboard=None):
+        """
+        Initialize game manager
+
+        Args:
+            event_log: Optional EventLogWriter receiving every game event
+            stats: Optional PlayerStats updated when a game is won or lost
+            leaderboard: Optional Leaderboard receiving timed-mode solve times
+        """
         self.state = GameState.SETUP
         self.attempts_total = 0
         self.attempts_remaining = 0
         self.word_length = 0
         self.guess_word = ""
+        self.seed = None
         self.guesses = []  # List of dicts: {'word', 'match_indexes', 'right_indexes'}
         self.current_input = ""
-
-    def start_game(self, attempts, length):
+        self.event_log = event_log
+        self.stats = stats
+        self.leaderboard = leaderboard
+
+        # Timed mode
+        self.timed = False
+        self.timer_start_ns = None   # perf_counter_ns() of the first letter
+        self.solve_time_us = None    # Set on a timed win
+        self.leaderboard_entry = None
+
+    def _log(self, event_type, **data):
+        """Forward an event to the event log, if one is attached"""
+        if self.event_log is not None:
+            self.event_log.log(event_type, **data)
+
+    def _set_state(self, new_state):
+        """Apply a game state transition and log it"""
+        if new_state != self.state:
+            self._log('state', **{'from': self.state.name, 'to': new_state.name})
+        self.state = new_state
+
+    def start_game(self, attempts, length, seed=None, timed=False, word=None):
         """
         Start a new game with specified parameters
 
         Args:
             attempts: Number of attempts allowed
             length: Length of the word to guess
+            seed: Optional seed for the word choice (random if omitted)
+            timed: Measure the solve time for the speedrun leaderboard
+            word: Word already picked with this seed (skips the lookup)
         """
+        if seed is None:
+            seed = random.getrandbits(32)
         self.attempts_total = attempts
         self.attempts_remaining = attempts
         self.word_length = length
-        self.guess_word = find_random_word(length)
+        self.seed = seed
+        self.guess_word = word if word is not None else find_random_word(length, random.Random(seed))
         self.guesses = []
         self.current_input = ""
-        self.state = GameState.PLAYING
+        self.timed = timed
+        self.timer_start_ns = None
+        self.solve_time_us = None
+        self.leaderboard_entry = None
+        self._log('start', seed=seed, word=self.guess_word, attempts=attempts, length=length, timed=timed)
+        self._set_state(GameState.PLAYING)
+
+    def start_timer(self):
+        """Start the solve timer of a timed game (called when the first letter is added)"""
+        if self.timed and self.timer_start_ns is None:
+            self.timer_start_ns = time.perf_counter_ns()
+
+    def get_elapsed_us(self):
+        """
+        Return the solve time so far in microseconds
+
+        Returns:
+            int: Final time once solved, running time while playing, 0 before the first letter
+        """
+        if self.solve_time_us is not None:
+            return self.solve_time_us
+        if self.timer_start_ns is None:
+            return 0
+        return (time.perf_counter_ns() - self.timer_start_ns) // 1000
+
+    @property
+    def timer_running(self):
+        """True while the clock of a timed game is counting"""
+        return self.timer_start_ns is not None and self.solve_time_us is None and self.state == GameState.PLAYING
+
+    def add_letter(self, letter):
+        """
+        Append a letter to the current input
+
+        Args:
+            letter: Letter typed or clicked by the user
+
+        Returns:
+            bool: True if the letter was added, False if the input is full
+        """
+        if len(self.current_input) >= self.word_length:
+            return False
+        letter = letter.upper()
+        self.start_timer()
+        self.current_input += letter
+        self._log('key', action='letter', letter=letter)
+        return True
+
+    def remove_letter(self):
+        """
+        Remove the last letter of the current input
+
+        Returns:
+            bool: True if a letter was removed, False if the input was empty
+        """
+        if not self.current_input:
+            return False
+        self.current_input = self.current_input[:-1]
+        self._log('key', action='backspace')
+        return True
 
     def submit_guess(self, user_word):
         """
@@ -66,17 +168,10 @@ class GameManager:
         Returns:
             Tuple (success: bool, error_message: str)
         """
-        # Validate word length
-        if not is_word_lenght_valid(user_word, self.word_length):
-            return False, f"Word must be {self.word_length} characters long"
-
-        # Validate only English letters
-        if not all_english_letters(user_word):
-            return False, "Word must contain only English letters"
-
-        # Validate word is in dictionary
-        if user_word.lower() not in english_words:
-            return False, "Word not in English dictionary"
+        error = self._validate_guess(user_word)
+        if error:
+            self._log('guess', word=user_word, ok=False, error=error)
+            return False, error
 
         # Word is valid, process it
         match_indexes = find_match_indexes(user_word, self.guess_word)
@@ -88,19 +183,55 @@ class GameManager:
             'match_indexes': match_indexes,
             'right_indexes': right_indexes
         })
+        self.current_input = ""
+
+        self._log('guess', word=user_word, ok=True, error="",
+                  match_indexes=match_indexes, right_indexes=right_indexes)
 
         # Decrease attempts
         self.attempts_remaining -= 1
 
         # Check win condition
         if user_word.lower() == self.guess_word.lower():
-            self.state = GameState.WIN
+            if self.timed and self.timer_start_ns is not None:
+                self.solve_time_us = (time.perf_counter_ns() - self.timer_start_ns) // 1000
+            self._set_state(GameState.WIN)
+            self._record_result(won=True)
         # Check lose condition
         elif self.attempts_remaining <= 0:
-            self.state = GameState.LOSE
+            self._set_state(GameState.LOSE)
+            self._record_result(won=False)
 
         return True, ""
 
+    def _record_result(self, won):
+        """Fold the finished game into the player statistics"""
+        if self.stats is not None:
+            self.stats.record_game(self.word_length, self.attempts_total, won, len(self.guesses))
+        if self.leaderboard is not None and self.solve_time_us is not None:
+            self.leaderboard_entry = self.leaderboard.submit(self.word_length, self.attempts_total, self.solve_time_us)
+
+    def _validate_guess(self, user_word):
+        """
+        Validate a guess against the current game rules
+
+        Returns:
+            str: Error message, or "" if the word is valid
+        """
+        # Validate word length
+        if not is_word_lenght_valid(user_word, self.word_length):
+            return f"Word must be {self.word_length} characters long"
+
+        # Validate only English letters
+        if not all_english_letters(user_word):
+            return "Word must contain only English letters"
+
+        # Validate word is in dictionary
+        if user_word.lower() not in get_english_words():
+            return "Word not in English dictionary"
+
+        return ""
+
     def check_win_condition(self):
         """
         Check if player won
@@ -115,112 +246,291 @@ class GameManager:
 
     def reset_game(self):
         """Reset game to setup screen"""
-        self.state = GameState.SETUP
+        self._log('reset')
+        self._set_state(GameState.SETUP)
         self.attempts_total = 0
         self.attempts_remaining = 0
         self.word_length = 0
         self.guess_word = ""
+        self.seed = None
         self.guesses = []
         self.current_input = ""
 
 
-def main():
-    """Main game loop"""
-    # Initialize pygame
-    pygame.init()
-    init_fonts()
+class ScreenSet:
+    """The screen of each game state, each constructed the first time its state is shown
+
+    Only the setup screen is needed for the first frame; the game and end screens (and
+    their modules) are imported and built when the player first reaches them. WIN and
+    LOSE share the end screen. Screens built after a resize get the current window size.
+    """
+
+    def __init__(self, executor=None, timeline=None, input_context=None, size=(SCREEN_WIDTH, SCREEN_HEIGHT),
+                 assets=None):
+        """
+        Args:
+            executor: JobExecutor handed to every screen
+            timeline: Timeline handed to the animated screens
+            input_context: InputContext shared by the screens
+            size: Window size the screens are laid out for
+            assets: AssetLoader whose progress the setup screen shows
+        """
+        self.executor = executor
+        self.timeline = timeline
+        self.input_context = input_context
+        self.size = size
+        self.assets = assets
+        self._screens = {}  # 'setup' / 'game' / 'end' -> screen
+
+    def __getitem__(self, state):
+        """Return the screen of a GameState, building it on first use"""
+        name = _SCREEN_NAMES[state]
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._screens[name] = self._build(name)
+        return screen
+
+    def built(self, state):
+        """Return the screen of a GameState if it has been built, else None"""
+        return self._screens.get(_SCREEN_NAMES[state])
+
+    def _build(self, name):
+        if name == 'setup':
+            return SetupScreen(self.executor, size=self.size, input_context=self.input_context, assets=self.assets)
+        if name == 'game':
+            from words_guessing_game_banbar1.ui.game_screen import GameScreen
+            return GameScreen(self.executor, self.timeline, size=self.size, input_context=self.input_context)
+        from words_guessing_game_banbar1.ui.end_screen import EndScreen
+        return EndScreen(self.executor, self.timeline, size=self.size, input_context=self.input_context)
+
+    def resize(self, size):
+        """Lay the built screens out for a new window size"""
+        self.size = size
+        for screen in self._screens.values():
+            screen.resize(size)
+
+
+_SCREEN_NAMES = {
+    GameState.SETUP: 'setup',
+    GameState.PLAYING: 'game',
+    GameState.WIN: 'end',
+    GameState.LOSE: 'end',
+}
+
+
+# Event types the loop handles; everything else is blocked
+ALLOWED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.TEXTINPUT,         # Needed for KEYDOWN to carry its unicode text
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEMOTION,       # Hover highlights
+    pygame.MOUSEWHEEL,        # Scrolling tall grids
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.VIDEORESIZE,
+]
+
+
+def main(event_log_path=None, stats_path=None, leaderboard_path=None, dirty_rects=False, idle_wait=True,
+         time_source=None, transition='fade', bitmap_fonts=False, headless=False, input_script=None,
+         record_input_path=None, text_cache_stats=False):
+    """
+    Main game loop
+
+    Args:
+        event_log_path: Optional path of an append-only event log to record the session
+        stats_path: Player statistics file (defaults to the per-user data directory)
+        leaderboard_path: Speedrun leaderboard database (defaults to the per-user data directory)
+        dirty_rects: Present only the regions that changed each frame instead of flipping the whole window
+        idle_wait: Block on input instead of redrawing at FPS while nothing is animating
+        time_source: Callable returning seconds that drives all animations
+            (defaults to time.monotonic; a VirtualTime makes them fast-forwardable)
+        transition: Screen change effect, one of ui.transitions.TRANSITIONS
+        bitmap_fonts: Draw text from the baked glyph atlas instead of FreeType
+        headless: Draw into SDL's dummy video driver instead of a window
+        input_script: ui.headless.InputScript supplying every frame's events instead of the
+            event queue; frames are not capped and animations run on its virtual clock
+        record_input_path: Optional path to record every frame's input to, for ui.input_recording replays
+        text_cache_stats: Print the text cache's hit and miss counters on exit
+    """
+    executor = JobExecutor()
+    event_log = EventLogWriter(event_log_path) if event_log_path else None
+    input_recorder = None
+    if record_input_path:
+        from words_guessing_game_banbar1.ui.input_recording import InputRecorder
+        input_recorder = InputRecorder(record_input_path, transition=transition, bitmap_fonts=bitmap_fonts)
+    stats = PlayerStats.load(stats_path, executor=executor)
+    leaderboard = Leaderboard(leaderboard_path)
+    try:
+        _run(executor, event_log, stats, leaderboard, dirty_rects, idle_wait, time_source, transition,
+             bitmap_fonts, headless, input_script, input_recorder)
+    finally:
+        # Let queued background writes (stats) finish before exiting
+        executor.shutdown(wait=True)
+        leaderboard.close()
+        if event_log is not None:
+            event_log.close()
+        if input_recorder is not None:
+            input_recorder.close()
+        if text_cache_stats:
+            print(TEXT_CACHE.summary())
+
+
+def _run(executor, event_log, stats, leaderboard, dirty_rects=False, idle_wait=True, time_source=None,
+         transition='fade', bitmap_fonts=False, headless=False, input_script=None, input_recorder=None):
+    """Run the pygame loop until the window is closed"""
+    if headless:
+        from words_guessing_game_banbar1.ui.headless import use_dummy_driver
+        use_dummy_driver()
+
+    # Initialize only the pygame modules the game uses (pygame.init() would also open
+    # audio and joystick devices before the first frame)
+    pygame.display.init()
+    init_fonts(bitmap=bitmap_fonts)
 
     # Create screen
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
     pygame.display.set_caption("Word Guessing Game")
     clock = pygame.time.Clock()
 
+    # Only events the game reacts to are queued, so anything else cannot wake an idle loop
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(ALLOWED_EVENTS)
+
     # Create game manager
-    game_manager = GameManager()
+    game_manager = GameManager(event_log=event_log, stats=stats, leaderboard=leaderboard)
+
+    # One clock for every animation, sampled once per frame
+    if input_script is not None and time_source is None:
+        time_source = input_script.time
+    timeline = Timeline(FrameClock(time_source))
 
-    # Create screens
-    setup_screen = SetupScreen()
-    game_screen = GameScreen()
-    end_screen = EndScreen()
+    # Mouse state, sampled once per frame and read by every screen (scripted input has no mouse)
+    input_context = InputContext(follow_events=input_script is not None)
 
-    screens = {
-        GameState.SETUP: setup_screen,
-        GameState.PLAYING: game_screen,
-        GameState.WIN: end_screen,
-        GameState.LOSE: end_screen
-    }
+    # Dictionary, fonts and pre-rendered images the game uses, loaded once frames are showing
+    assets = create_asset_loader(executor, screen.get_size())
+
+    # Screens are built the first time their state is shown
+    screens = ScreenSet(executor, timeline, input_context, assets=assets)
 
     # Track previous state to detect transitions
     previous_state = None
-    fade_transition = None
-    fade_pending_state = None  # State to apply at fade midpoint
-    fade_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    fade_overlay.fill((0, 0, 0))
+    screen_transition = None  # TransitionCompositor while screens are changing
 
     # Main game loop
     running = True
+    idle = False
     while running:
+        # Sample the frame time and finish completed animations (their callbacks may change state)
+        timeline.tick()
         current_state = game_manager.state
         current_screen = screens[current_state]
 
         # Handle state transitions
         if current_state != previous_state:
             if previous_state is not None:
-                # Start fade transition (skip for the initial SETUP)
-                fade_transition = ScreenFadeTransition()
-                fade_pending_state = current_state
-                # Revert to old state during fade-out phase
-                game_manager.state = previous_state
-                current_state = previous_state
-                current_screen = screens[current_state]
-            else:
-                # First state (SETUP) — initialize without fade
-                previous_state = current_state
-
-        # Handle fade midpoint: switch screens when fully black
-        if fade_transition and fade_transition.midpoint_reached:
-            fade_transition.midpoint_reached = False  # Consume the flag
-            game_manager.state = fade_pending_state
-            current_state = fade_pending_state
-            current_screen = screens[current_state]
+                # Background work of the screen being left is no longer wanted
+                if current_screen is not screens[previous_state]:
+                    executor.cancel_owner(screens[previous_state])
+
+                # Initialize the new screen
+                if current_state == GameState.PLAYING:
+                    end_screen = screens.built(GameState.WIN)
+                    prewarm = None
+                    if end_screen is not None:
+                        prewarm = end_screen.take_prewarm(game_manager.attempts_total, game_manager.word_length)
+                    current_screen.initialize_grid(game_manager.attempts_total, game_manager.word_length, prewarm)
+                elif current_state in [GameState.WIN, GameState.LOSE]:
+                    current_screen.initialize_grid(game_manager.attempts_total, game_manager.word_length)
+
+                # Both frames are captured once; the transition only blends them
+                incoming = capture_screen(current_screen, screen.get_size(), game_manager)
+                screen_transition = TransitionCompositor(transition, screen.copy(), incoming, timeline)
+            # The first state (SETUP) is shown without a transition
             previous_state = current_state
 
-            # Initialize the new screen
-            if current_state == GameState.PLAYING:
-                game_screen.initialize_grid(game_manager.attempts_total, game_manager.word_length)
-            elif current_state in [GameState.WIN, GameState.LOSE]:
-                end_screen.initialize_grid(game_manager.attempts_total, game_manager.word_length)
-
-            fade_pending_state = None
-
-        # Clear fade when done
-        if fade_transition and not fade_transition.active:
-            fade_transition = None
-
-        # Event handling (block input during fade)
-        for event in pygame.event.get():
+        # Transition finished: the new screen takes over, its animations start now that it is visible
+        if screen_transition and not screen_transition.active:
+            screen_transition = None
+            timeline.restart_owner(current_screen)
+            current_screen.dirty.invalidate()
+
+        # Event handling (block input during transitions)
+        if input_script is not None:
+            events = input_script.events(game_manager, idle)
+            if idle:
+                timeline.tick()  # A replay may have skipped ahead to its next input, like the wait below
+        elif idle:
+            # Nothing is moving: sleep until input arrives instead of redrawing unchanged frames
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+            timeline.tick()  # Animations started by this input begin now, not before the wait
+        else:
+            events = pygame.event.get()
+        input_context.sample(events)
+        if input_recorder is not None:
+            input_recorder.record(timeline.now, events, game_manager)
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
-            elif not fade_transition:
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                current_screen.dirty.invalidate()
+            elif event.type == pygame.VIDEORESIZE:
+                # Lay every screen out again for the new size (layouts are memoized per size)
+                size = fit_window_size(event.size)
+                screen = pygame.display.get_surface()
+                if screen.get_size() != size:
+                    screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+                screens.resize(size)
+                if screen_transition:
+                    # Snapshots of the old size cannot be blended into the new window
+                    screen_transition = None
+                    timeline.restart_owner(current_screen)
+            elif not screen_transition:
                 current_screen.handle_event(event, game_manager)
 
-        # Update
+        # Deliver finished background jobs, then update (scripted runs wait, so every run is the same)
+        executor.poll(wait=input_script is not None)
         current_screen.update(game_manager)
 
-        # Render
-        screen.fill(COLORS['background'])
-        current_screen.render(screen, game_manager)
-
-        # Draw fade overlay on top
-        if fade_transition and fade_transition.active:
-            alpha = fade_transition.get_alpha()
-            fade_overlay.set_alpha(alpha)
-            screen.blit(fade_overlay, (0, 0))
-
-        pygame.display.flip()
-
-        # Cap framerate
-        clock.tick(FPS)
+        # Render: the live screen, or the transition blended from its snapshots. An idle wait
+        # that ended without input changed nothing, so the presented frame is still current
+        if idle and not events and not current_screen.dirty.pending:
+            pass
+        elif screen_transition:
+            screen_transition.draw(screen)
+            pygame.display.flip()
+        else:
+            current_screen.render(screen, game_manager)
+
+            # Present: changed regions only, or the whole window when a full redraw is due
+            changed = current_screen.dirty.take()
+            if not dirty_rects or changed is None:
+                pygame.display.flip()
+            elif changed:
+                pygame.display.update(changed)
+
+        if input_script is not None:
+            input_script.frame_drawn(screen, game_manager)
+
+        # Load the next asset now that the frame is presented (background loads start on the first call).
+        # The frame that finishes loading has not shown it yet, so it does not count as idle
+        loading = not assets.done
+        assets.step()
+
+        # Go idle once nothing animates, no transition or screen switch is due and nothing is loading
+        idle = (idle_wait
+                and not screen_transition
+                and game_manager.state == previous_state
+                and executor.pending == 0
+                and not loading
+                and not current_screen.is_animating(game_manager))
+
+        # Cap framerate (scripted frames run as fast as they can be drawn)
+        if input_script is None:
+            clock.tick(FPS)
 
     # Quit
     pygame.quit()
@@ -1,4 +1,21 @@
+import argparse
+
 from words_guessing_game_banbar1.main_game_func import main
+from words_guessing_game_banbar1.ui.transitions import TRANSITIONS
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Word Guessing Game")
+    parser.add_argument("--event-log", metavar="PATH", help="append every game event to this log file")
+    parser.add_argument("--stats", metavar="PATH", help="player statistics file (default: ~/.words_guessing_game/stats.json)")
+    parser.add_argument("--leaderboard", metavar="PATH", help="speedrun leaderboard database (default: ~/.words_guessing_game/leaderboard.db)")
+    parser.add_argument("--dirty-rects", action="store_true", help="redraw only the changed parts of the window each frame")
+    parser.add_argument("--no-idle", action="store_true", help="redraw at the full frame rate even when nothing changes")
+    parser.add_argument("--transition", choices=TRANSITIONS, default="fade", help="effect used when the screen changes")
+    parser.add_argument("--bitmap-fonts", action="store_true", help="draw text from the baked glyph atlas instead of FreeType")
+    parser.add_argument("--text-cache-stats", action="store_true", help="print the text cache's hit and miss counters on exit")
+    parser.add_argument("--record-input", metavar="PATH", help="record the session's input for replays (python -m words_guessing_game_banbar1.ui.input_recording PATH)")
+    args = parser.parse_args()
+    main(event_log_path=args.event_log, stats_path=args.stats, leaderboard_path=args.leaderboard,
+         dirty_rects=args.dirty_rects, idle_wait=not args.no_idle, transition=args.transition,
+         bitmap_fonts=args.bitmap_fonts, record_input_path=args.record_input,
+         text_cache_stats=args.text_cache_stats)
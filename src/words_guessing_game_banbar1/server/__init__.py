@@ -0,0 +1,6 @@
+"""
+Server Package for Word Guessing Game
+Hosts many concurrent game sessions over a JSON-lines socket protocol
+"""
+
+from .game_server import GameServer
@@ -0,0 +1,4 @@
+from words_guessing_game_banbar1.server.game_server import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Asyncio game server for Word Guessing Game
+Hosts many GameManager sessions behind a JSON-lines protocol over TCP or a Unix socket
+
+Protocol: one JSON object per line in each direction. Requests carry an "op" and
+an optional "id" that is echoed back so clients may pipeline requests.
+
+    {"op": "new", "attempts": 6, "length": 5}         -> {"ok": true, "session": "..."}
+    {"op": "guess", "session": "...", "word": "hello"} -> {"ok": true, "valid": true, ...}
+    {"op": "state", "session": "..."}                  -> {"ok": true, "state": "PLAYING", ...}
+    {"op": "end", "session": "..."}                    -> {"ok": true}
+    {"op": "stats"}                                    -> {"ok": true, "sessions": 12, ...}
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import secrets
+import time
+from collections import OrderedDict
+
+from words_guessing_game_banbar1.main_game_func import GameManager, GameState
+
+# Setting limits, same as SetupScreen
+MIN_ATTEMPTS, MAX_ATTEMPTS = 1, 100
+MIN_LENGTH, MAX_LENGTH = 3, 11
+
+MAX_LINE_BYTES = 4096
+
+
+class Session:
+    """One hosted game"""
+
+    __slots__ = ('session_id', 'manager', 'timeout', 'last_seen')
+
+    def __init__(self, session_id, manager, timeout, now):
+        self.session_id = session_id
+        self.manager = manager
+        self.timeout = timeout
+        self.last_seen = now
+
+
+class GameServer:
+    """Session table plus the asyncio connection handler
+
+    All sessions share the module-level read-only dictionary (get_english_words() and
+    the per-length word index), so a session costs only its GameManager.
+    """
+
+    def __init__(self, max_sessions=100_000, session_timeout=300.0, client_timeout=60.0):
+        """
+        Args:
+            max_sessions: Least recently used sessions are evicted above this count
+            session_timeout: Default idle seconds before a session is evicted
+            client_timeout: Idle seconds before a silent connection is closed
+        """
+        self.max_sessions = max_sessions
+        self.session_timeout = session_timeout
+        self.client_timeout = client_timeout
+        self.sessions = OrderedDict()  # session_id -> Session, least recently used first
+        self.evicted = 0
+        self.requests = 0
+        self._server = None
+        self._sweeper = None
+
+    # ---- Request handling (synchronous, no I/O) ----
+
+    def handle_request(self, request, now=None):
+        """
+        Execute one request
+
+        Args:
+            request: Decoded request dict
+            now: Monotonic timestamp (defaults to time.monotonic())
+
+        Returns:
+            dict: Response object
+        """
+        if now is None:
+            now = time.monotonic()
+        self.requests += 1
+
+        op = request.get('op')
+        handler = self._handlers.get(op) if isinstance(op, str) else None
+        if handler is None:
+            response = {'ok': False, 'error': f"unknown op: {op}"}
+        else:
+            try:
+                response = handler(self, request, now)
+            except (KeyError, TypeError, ValueError) as e:
+                response = {'ok': False, 'error': f"bad request: {e}"}
+
+        if 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    def _op_new(self, request, now):
+        attempts = int(request.get('attempts', 6))
+        length = int(request.get('length', 5))
+        if not MIN_ATTEMPTS <= attempts <= MAX_ATTEMPTS or not MIN_LENGTH <= length <= MAX_LENGTH:
+            return {'ok': False, 'error': f"attempts must be {MIN_ATTEMPTS}-{MAX_ATTEMPTS} and length {MIN_LENGTH}-{MAX_LENGTH}"}
+
+        try:
+            timeout = float(request.get('timeout', self.session_timeout))
+        except (TypeError, ValueError):
+            timeout = math.nan
+        # NaN would never compare as idle, and a session with no time left is evicted at once
+        if not (math.isfinite(timeout) and timeout > 0):
+            return {'ok': False, 'error': "timeout must be a positive number of seconds"}
+        timeout = min(timeout, self.session_timeout)
+        manager = GameManager()
+        manager.start_game(attempts, length, seed=request.get('seed'))
+
+        session_id = secrets.token_hex(8)
+        self.sessions[session_id] = Session(session_id, manager, timeout, now)
+        while len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+            self.evicted += 1
+
+        return {'ok': True, 'session': session_id, 'attempts': attempts, 'length': length}
+
+    def _get_session(self, request, now):
+        """Look up a session and mark it as recently used"""
+        session = self.sessions.get(request['session'])
+        if session is not None:
+            session.last_seen = now
+            self.sessions.move_to_end(session.session_id)
+        return session
+
+    def _op_guess(self, request, now):
+        session = self._get_session(request, now)
+        if session is None:
+            return {'ok': False, 'error': "unknown session"}
+        manager = session.manager
+        if manager.state != GameState.PLAYING:
+            return {'ok': False, 'error': "game is over"}
+
+        valid, error = manager.submit_guess(str(request['word']))
+        response = self._describe(manager)
+        response['valid'] = valid
+        response['error'] = error
+        if valid:
+            guess_data = manager.guesses[-1]
+            response['match_indexes'] = guess_data['match_indexes']
+            response['right_indexes'] = guess_data['right_indexes']
+        return response
+
+    def _op_state(self, request, now):
+        session = self._get_session(request, now)
+        if session is None:
+            return {'ok': False, 'error': "unknown session"}
+        response = self._describe(session.manager)
+        response['guesses'] = session.manager.guesses
+        return response
+
+    def _op_end(self, request, now):
+        session = self.sessions.pop(request['session'], None)
+        return {'ok': session is not None}
+
+    def _op_stats(self, request, now):
+        return {
+            'ok': True,
+            'sessions': len(self.sessions),
+            'evicted': self.evicted,
+            'requests': self.requests,
+            'max_rss_kb': _max_rss_kb(),
+        }
+
+    _handlers = {
+        'new': _op_new,
+        'guess': _op_guess,
+        'state': _op_state,
+        'end': _op_end,
+        'stats': _op_stats,
+    }
+
+    @staticmethod
+    def _describe(manager):
+        """Common session fields; the word is only revealed once the game is over"""
+        response = {
+            'ok': True,
+            'state': manager.state.name,
+            'attempts_remaining': manager.attempts_remaining,
+        }
+        if manager.state in (GameState.WIN, GameState.LOSE):
+            response['word'] = manager.guess_word
+        return response
+
+    def evict_idle(self, now=None):
+        """
+        Drop sessions idle for longer than their timeout
+
+        Returns:
+            int: Number of sessions evicted
+        """
+        if now is None:
+            now = time.monotonic()
+        expired = [sid for sid, session in self.sessions.items() if now - session.last_seen > session.timeout]
+        for sid in expired:
+            del self.sessions[sid]
+        self.evicted += len(expired)
+        return len(expired)
+
+    # ---- Networking ----
+
+    async def _handle_client(self, reader, writer):
+        """Serve one connection: read a request line, write a response line"""
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.client_timeout)
+                except (asyncio.TimeoutError, ValueError):
+                    break  # Idle client, or a line longer than the stream limit
+                if not line:
+                    break
+
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be an object")
+                except ValueError as e:
+                    response = {'ok': False, 'error': f"bad json: {e}"}
+                else:
+                    response = self.handle_request(request)
+
+                writer.write(json.dumps(response, separators=(',', ':')).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _sweep_loop(self):
+        """Periodically evict idle sessions"""
+        interval = max(self.session_timeout / 4, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+    async def start(self, host="127.0.0.1", port=8765, unix_path=None):
+        """
+        Start listening (TCP, or a Unix socket if unix_path is given)
+
+        Returns:
+            asyncio.AbstractServer: The listening server
+        """
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle_client, unix_path, limit=MAX_LINE_BYTES)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port, limit=MAX_LINE_BYTES)
+        self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+        return self._server
+
+    async def stop(self):
+        """Stop listening and cancel the idle sweeper"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+def _max_rss_kb():
+    """Peak resident memory of this process in KiB (None where unavailable)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def _serve(args):
+    server = GameServer(args.max_sessions, args.session_timeout)
+    listener = await server.start(args.host, args.port, args.unix)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Word Guessing Game server listening on {where}")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    """Command line entry point: python -m words_guessing_game_banbar1.server"""
+    parser = argparse.ArgumentParser(description="Word Guessing Game session server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--max-sessions", type=int, default=100_000)
+    parser.add_argument("--session-timeout", type=float, default=300.0, help="idle seconds before eviction")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
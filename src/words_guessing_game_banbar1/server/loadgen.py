@@ -0,0 +1,172 @@
+"""
+Local load generator for the Word Guessing Game server
+Runs many concurrent clients and reports requests per second and p50/p99 latency
+
+    python -m words_guessing_game_banbar1.server.loadgen --clients 200 --games 50
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+
+from words_guessing_game_banbar1.functions.find import words_of_length
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list (0 for an empty list)"""
+    if not sorted_values:
+        return 0.0
+    # Rank is the ceiling of fraction * n; rounding first keeps 0.07 * 100 at rank 7, not 8
+    rank = math.ceil(round(fraction * len(sorted_values), 9))
+    index = min(len(sorted_values) - 1, max(0, rank - 1))
+    return sorted_values[index]
+
+
+class LoadReport:
+    """Latency samples collected by all clients"""
+
+    def __init__(self):
+        self.latencies = {'new': [], 'guess': []}
+        self.errors = 0
+        self.elapsed = 0.0
+
+    @property
+    def total_requests(self):
+        return sum(len(samples) for samples in self.latencies.values())
+
+    def summary(self):
+        """
+        Return the aggregate numbers
+
+        Returns:
+            dict: requests, rps, errors, and p50/p99 in milliseconds per op
+        """
+        result = {
+            'requests': self.total_requests,
+            'rps': self.total_requests / self.elapsed if self.elapsed else 0.0,
+            'errors': self.errors,
+        }
+        for op, samples in self.latencies.items():
+            samples = sorted(samples)
+            result[op] = {
+                'count': len(samples),
+                'p50_ms': percentile(samples, 0.50) * 1000,
+                'p99_ms': percentile(samples, 0.99) * 1000,
+            }
+        return result
+
+
+async def _request(reader, writer, request):
+    """Send one request line and wait for its response line"""
+    writer.write(json.dumps(request).encode() + b'\n')
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+async def _client(connect, report, games, attempts, length, keep_sessions, rng):
+    """One simulated player: play games back to back on a single connection"""
+    reader, writer = await connect()
+    words = words_of_length(length)
+    try:
+        for _ in range(games):
+            start = time.perf_counter()
+            response = await _request(reader, writer, {'op': 'new', 'attempts': attempts, 'length': length})
+            report.latencies['new'].append(time.perf_counter() - start)
+            if not response.get('ok'):
+                report.errors += 1
+                continue
+
+            session = response['session']
+            state = 'PLAYING'
+            while state == 'PLAYING':
+                start = time.perf_counter()
+                response = await _request(reader, writer, {'op': 'guess', 'session': session, 'word': rng.choice(words)})
+                report.latencies['guess'].append(time.perf_counter() - start)
+                if not response.get('ok'):
+                    report.errors += 1
+                    break
+                state = response['state']
+
+            if not keep_sessions:
+                await _request(reader, writer, {'op': 'end', 'session': session})
+    finally:
+        writer.close()
+
+
+async def run_load(connect, clients=100, games=10, attempts=6, length=5, keep_sessions=False, seed=None):
+    """
+    Drive the server with concurrent clients
+
+    Args:
+        connect: Coroutine function returning (reader, writer) for a new connection
+        clients: Number of concurrent connections
+        games: Games played by each client
+        attempts: Attempts setting of every game
+        length: Word length of every game
+        keep_sessions: Leave finished sessions on the server (to measure capacity)
+        seed: Seed for the guessed words
+
+    Returns:
+        LoadReport: Collected latencies
+    """
+    report = LoadReport()
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(connect, report, games, attempts, length, keep_sessions, random.Random(rng.random()))
+        for _ in range(clients)
+    ))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+async def _fetch_server_stats(connect):
+    reader, writer = await connect()
+    try:
+        return await _request(reader, writer, {'op': 'stats'})
+    finally:
+        writer.close()
+
+
+async def _main(args):
+    if args.unix:
+        async def connect():
+            return await asyncio.open_unix_connection(args.unix)
+    else:
+        async def connect():
+            return await asyncio.open_connection(args.host, args.port)
+
+    report = await run_load(connect, args.clients, args.games, args.attempts, args.length,
+                            args.keep_sessions, args.seed)
+    summary = report.summary()
+    server_stats = await _fetch_server_stats(connect)
+
+    print(f"{summary['requests']} requests in {report.elapsed:.2f}s  ->  {summary['rps']:.0f} req/s  "
+          f"({summary['errors']} errors)")
+    for op in ('new', 'guess'):
+        print(f"  {op:<6} n={summary[op]['count']:<8} p50={summary[op]['p50_ms']:.2f}ms  p99={summary[op]['p99_ms']:.2f}ms")
+    print(f"  server: {server_stats['sessions']} sessions, {server_stats['evicted']} evicted, "
+          f"max RSS {server_stats['max_rss_kb']} KiB")
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Load generator for the Word Guessing Game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="connect to a Unix socket instead of TCP")
+    parser.add_argument("--clients", type=int, default=100, help="concurrent connections")
+    parser.add_argument("--games", type=int, default=10, help="games per client")
+    parser.add_argument("--attempts", type=int, default=6)
+    parser.add_argument("--length", type=int, default=5)
+    parser.add_argument("--keep-sessions", action="store_true", help="do not end sessions (measure capacity)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
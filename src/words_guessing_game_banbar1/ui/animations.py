@@ -1,10 +1,9 @@
 """
 Animation classes for Word Guessing Game
-Provides tile flip, pop, shake, bounce, key press, and screen fade animations.
+Provides tile flip, pop, shake, bounce, key press, grid scroll and screen fade animations.
 """
 
 import math
-import time
 
 from .constants import (
     FLIP_DURATION, FLIP_STAGGER,
@@ -13,15 +12,48 @@ from .constants import (
     BOUNCE_DURATION, BOUNCE_STAGGER, BOUNCE_AMPLITUDE,
     KEY_PRESS_DURATION,
     FADE_DURATION,
+    SCROLL_DURATION,
 )
+from .timeline import REAL_TIME
 
 
-class TileFlipAnimation:
+class Animation:
+    """Base class: progress is measured on a clock (the timeline's frame clock once started)"""
+
+    duration = 0.0
+
+    def __init__(self, clock=None):
+        """
+        Args:
+            clock: Clock to read (defaults to real time; Timeline.start replaces it)
+        """
+        self.clock = clock if clock is not None else REAL_TIME
+        self.start_time = self.clock.now
+
+    @property
+    def elapsed(self):
+        return self.clock.now - self.start_time
+
+    @property
+    def is_complete(self):
+        return self.elapsed >= self.duration
+
+
+class Delay(Animation):
+    """Nothing to draw; completes after a duration (e.g. to hide a message)."""
+
+    def __init__(self, duration, clock=None):
+        super().__init__(clock)
+        self.duration = duration
+
+
+class TileFlipAnimation(Animation):
     """Tiles flip one-by-one to reveal their colors after a guess."""
 
-    def __init__(self, num_tiles):
+    def __init__(self, num_tiles, clock=None):
+        super().__init__(clock)
         self.num_tiles = num_tiles
-        self.start_time = time.time()
+        self.duration = (num_tiles - 1) * FLIP_STAGGER + FLIP_DURATION
 
     def get_tile_state(self, tile_index):
         """Return (scale_y, show_color) for a given tile.
@@ -29,7 +61,7 @@ class TileFlipAnimation:
         scale_y: 1.0 → 0.0 → 1.0 (vertical squash for flip effect)
         show_color: False during first half, True during second half
         """
-        elapsed = time.time() - self.start_time
+        elapsed = self.elapsed
         tile_start = tile_index * FLIP_STAGGER
         tile_elapsed = elapsed - tile_start
 
@@ -48,34 +80,27 @@ class TileFlipAnimation:
             scale = (progress - 0.5) * 2
             return scale, True
 
-    @property
-    def is_complete(self):
-        elapsed = time.time() - self.start_time
-        return elapsed >= (self.num_tiles - 1) * FLIP_STAGGER + FLIP_DURATION
-
 
-class TilePopAnimation:
+class TilePopAnimation(Animation):
     """Brief scale-up pulse when a letter is typed."""
 
-    def __init__(self):
-        self.start_time = time.time()
+    duration = POP_DURATION
 
     def get_scale(self):
-        elapsed = time.time() - self.start_time
+        elapsed = self.elapsed
         if elapsed >= POP_DURATION:
             return None  # Animation finished
         progress = elapsed / POP_DURATION
         return 1.0 + (POP_MAX_SCALE - 1.0) * math.sin(progress * math.pi)
 
 
-class RowShakeAnimation:
+class RowShakeAnimation(Animation):
     """Horizontal shake for invalid input — decaying oscillation."""
 
-    def __init__(self):
-        self.start_time = time.time()
+    duration = SHAKE_DURATION
 
     def get_offset_x(self):
-        elapsed = time.time() - self.start_time
+        elapsed = self.elapsed
         if elapsed >= SHAKE_DURATION:
             return None  # Animation finished
         progress = elapsed / SHAKE_DURATION
@@ -83,15 +108,16 @@ class RowShakeAnimation:
         return int(SHAKE_AMPLITUDE * decay * math.sin(progress * math.pi * 6))
 
 
-class WinBounceAnimation:
+class WinBounceAnimation(Animation):
     """Winning row tiles bounce up in sequence."""
 
-    def __init__(self, num_tiles):
+    def __init__(self, num_tiles, clock=None):
+        super().__init__(clock)
         self.num_tiles = num_tiles
-        self.start_time = time.time()
+        self.duration = (num_tiles - 1) * BOUNCE_STAGGER + BOUNCE_DURATION
 
     def get_tile_offset_y(self, tile_index):
-        elapsed = time.time() - self.start_time
+        elapsed = self.elapsed
         tile_start = tile_index * BOUNCE_STAGGER
         tile_elapsed = elapsed - tile_start
 
@@ -104,48 +130,66 @@ class WinBounceAnimation:
         # Damped bounce: two peaks that decrease in height
         return int(-BOUNCE_AMPLITUDE * abs(math.sin(progress * math.pi * 2)) * (1.0 - progress))
 
-    @property
-    def is_complete(self):
-        elapsed = time.time() - self.start_time
-        return elapsed >= (self.num_tiles - 1) * BOUNCE_STAGGER + BOUNCE_DURATION
-
 
-class KeyPressAnimation:
+class KeyPressAnimation(Animation):
     """Brief darkening of a virtual keyboard key when pressed."""
 
-    def __init__(self, key):
+    duration = KEY_PRESS_DURATION
+
+    def __init__(self, key, clock=None):
+        super().__init__(clock)
         self.key = key.upper()
-        self.start_time = time.time()
 
     def get_darken_amount(self):
-        elapsed = time.time() - self.start_time
+        elapsed = self.elapsed
         if elapsed >= KEY_PRESS_DURATION:
             return None  # Animation finished
         progress = elapsed / KEY_PRESS_DURATION
         return int(50 * (1.0 - progress))
 
 
-class ScreenFadeTransition:
+class ScrollAnimation(Animation):
+    """Eased scroll of a grid viewport from one offset to another."""
+
+    duration = SCROLL_DURATION
+
+    def __init__(self, start_offset, end_offset, clock=None):
+        super().__init__(clock)
+        self.start_offset = start_offset
+        self.end_offset = end_offset
+
+    def get_offset(self):
+        elapsed = self.elapsed
+        if elapsed >= SCROLL_DURATION:
+            return self.end_offset
+        t = elapsed / SCROLL_DURATION
+        # Smoothstep easing so the grid starts and stops gently
+        return self.start_offset + (self.end_offset - self.start_offset) * t * t * (3 - 2 * t)
+
+
+class ScreenFadeTransition(Animation):
     """Two-phase fade: out to black, then in from black."""
 
-    def __init__(self):
-        self.start_time = time.time()
-        self.phase = 'out'  # 'out' fading to black, 'in' fading from black
-        self.midpoint_reached = False
-        self.active = True
+    duration = 2 * FADE_DURATION
+
+    @property
+    def phase(self):
+        """'out' while fading to black, 'in' while fading from black"""
+        return 'out' if self.elapsed < FADE_DURATION else 'in'
+
+    @property
+    def midpoint_reached(self):
+        """Whether the screen is fully black and the next screen can be switched in"""
+        return self.elapsed >= FADE_DURATION
+
+    @property
+    def active(self):
+        return not self.is_complete
 
     def get_alpha(self):
-        elapsed = time.time() - self.start_time
-
-        if self.phase == 'out':
-            if elapsed >= FADE_DURATION:
-                self.phase = 'in'
-                self.start_time = time.time()
-                self.midpoint_reached = True
-                return 255
+        elapsed = self.elapsed
+        if elapsed < FADE_DURATION:
             return int(255 * (elapsed / FADE_DURATION))
-        else:
-            if elapsed >= FADE_DURATION:
-                self.active = False
-                return 0
-            return int(255 * (1.0 - elapsed / FADE_DURATION))
+        if elapsed >= self.duration:
+            return 0
+        return int(255 * (1.0 - (elapsed - FADE_DURATION) / FADE_DURATION))
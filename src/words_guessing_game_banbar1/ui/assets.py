@@ -0,0 +1,135 @@
+"""
+Asset preloading for Word Guessing Game
+Loads what the game needs after the first frame, while the setup screen is already interactive
+"""
+
+from collections import deque
+
+from . import constants
+from .constants import KEY_WIDTH, KEY_HEIGHT, LENGTH_CHOICES
+from .layout import get_layout, get_grid_layout
+from .key_atlas import get_key_atlas
+from .tile_atlas import get_atlas
+from words_guessing_game_banbar1.functions.word_loader import get_english_words
+from words_guessing_game_banbar1.functions.find import words_of_length
+
+
+class AssetLoader:
+    """Named assets loaded in the background or one per frame
+
+    Plain Python work (the dictionary and its indexes) runs on the JobExecutor.
+    Fonts and pre-rendered surfaces are built on the main thread, one asset per
+    step(), because pygame fonts and surfaces must not be used from two threads.
+    Nothing starts before the first step(), which the loop calls after presenting
+    a frame, so loading never delays the first frame.
+    """
+
+    def __init__(self, executor=None):
+        """
+        Args:
+            executor: JobExecutor for background assets (without one they load in the first step)
+        """
+        self.executor = executor
+        self.loaded = set()
+        self.total = 0
+        self.started = False
+        self._background = []  # (name, fn, after) not yet submitted
+        self._steps = deque()  # (name, fn) built on the main thread
+
+    def add(self, name, fn, background=False, after=None):
+        """
+        Register an asset
+
+        Args:
+            name: Name used by is_loaded()
+            fn: Callable loading the asset (its result is kept by fn's own cache)
+            background: Load on the executor; fn must not touch fonts or surfaces
+            after: Name of a background asset that must be loaded first
+        """
+        if background:
+            self._background.append((name, fn, after))
+        else:
+            self._steps.append((name, fn))
+        self.total += 1
+
+    def step(self):
+        """
+        Start the background loads on the first call, then build one main-thread asset
+
+        Called once per frame by the main loop.
+        """
+        if not self.started:
+            self.started = True
+            self._submit_ready()
+        if self._steps:
+            name, fn = self._steps.popleft()
+            fn()
+            self._loaded(name)
+
+    def is_loaded(self, *names):
+        """Whether every named asset has finished loading"""
+        return all(name in self.loaded for name in names)
+
+    @property
+    def done(self):
+        return len(self.loaded) == self.total
+
+    @property
+    def progress(self):
+        """Fraction of the registered assets that are loaded (1.0 when there are none)"""
+        return len(self.loaded) / self.total if self.total else 1.0
+
+    def _submit_ready(self):
+        """Submit the background assets whose prerequisite is loaded"""
+        ready = [entry for entry in self._background if entry[2] is None or entry[2] in self.loaded]
+        self._background = [entry for entry in self._background if entry not in ready]
+        for name, fn, _ in ready:
+            if self.executor is None:
+                fn()
+                self._loaded(name)
+            else:
+                self.executor.submit(fn, owner=self, on_done=lambda job, name=name: self._finished(name, job))
+
+    def _finished(self, name, job):
+        """Executor callback on the main thread"""
+        job.result()  # A failed load raises here, in the frame loop
+        self._loaded(name)
+
+    def _loaded(self, name):
+        self.loaded.add(name)
+        if any(after == name for _, _, after in self._background):
+            self._submit_ready()
+
+
+def required_assets(length):
+    """Names of the assets a game of the given word length cannot start without"""
+    return ('dictionary', f'words:{length}')
+
+
+def create_asset_loader(executor=None, size=(constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT),
+                        attempts=6, length=5):
+    """
+    Return a loader for everything the game screens use
+
+    Args:
+        executor: JobExecutor for the dictionary work
+        size: Window size the keyboard and tiles are drawn for
+        attempts: Attempts setting whose tiles are drawn ahead of time
+        length: Word length setting whose tiles are drawn ahead of time
+
+    Returns:
+        AssetLoader: Not started; the main loop drives it with step()
+    """
+    loader = AssetLoader(executor)
+
+    loader.add('dictionary', get_english_words, background=True)
+    for choice in LENGTH_CHOICES:
+        loader.add(f'words:{choice}', lambda choice=choice: words_of_length(choice),
+                   background=True, after='dictionary')
+
+    for name in constants.FONT_SIZES:
+        loader.add(f'font:{name}', lambda name=name: constants.FONTS[name])
+    layout = get_layout(size)
+    loader.add('keys', lambda: get_key_atlas((KEY_WIDTH, KEY_HEIGHT), layout.backspace_key.size))
+    loader.add('tiles', lambda: get_atlas(get_grid_layout(size, length, attempts).tile_size))
+    return loader
@@ -0,0 +1,304 @@
+"""
+Baked bitmap fonts for Word Guessing Game
+Glyphs of every UI font size are rasterized once at build time into a packed atlas plus a
+metrics table; at runtime text is composed from atlas blits without FreeType
+
+Rebuild the atlas after changing FONT_SIZES or the character set:
+
+    python -m words_guessing_game_banbar1.ui.bitmap_font
+
+The atlas is two files in ui/assets:
+    font_atlas.json  sizes, glyph rectangles (in CHARSET order) and line heights
+    font_atlas.bin   glyph coverage, one byte per atlas pixel, followed by one kerning
+                     matrix per size (len(CHARSET) ** 2 signed bytes)
+Both are read without decoding an image format; the coverage becomes the alpha of a
+white surface in pygame's native per-pixel alpha layout, so glyph blits need no conversion.
+"""
+
+import argparse
+import json
+import os
+
+import pygame
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+ATLAS_METRICS = os.path.join(ASSETS_DIR, 'font_atlas.json')
+ATLAS_DATA = os.path.join(ASSETS_DIR, 'font_atlas.bin')
+ATLAS_VERSION = 1
+ATLAS_WIDTH = 1024
+
+# Printable ASCII: letters, digits and punctuation (the UI uses lowercase text too)
+CHARSET = ''.join(chr(code) for code in range(32, 127))
+
+
+class BitmapFont:
+    """Font drawing text from pre-rasterized glyphs
+
+    Drop-in for the parts of pygame.font.Font the UI uses (render, size, get_height).
+    Glyphs are stored white; the first string drawn in a color tints a copy of the
+    glyph image once, after which every string in that color costs one blit per glyph.
+    Characters outside the atlas and non-antialiased text fall back to a FreeType font
+    opened on first use.
+    """
+
+    def __init__(self, size, image, charset, glyphs, kerning, height):
+        """
+        Args:
+            size: Point size the glyphs were baked at
+            image: Per-pixel alpha Surface holding the white glyphs of this size
+            charset: Characters in the atlas
+            glyphs: (x, y, w, h) in image of each character, in charset order
+            kerning: len(charset) ** 2 pixel adjustments between pairs (sequence of int)
+            height: Line height of the font
+        """
+        self.point_size = size
+        self.image = image
+        self.height = height
+        self._index = {char: i for i, char in enumerate(charset)}
+        self._glyphs = {char: glyphs[i] for char, i in self._index.items()}
+        self._kerning = kerning
+        self._count = len(charset)
+        self._tinted = {}     # color -> glyph image multiplied by the color
+        self._fallback = None
+
+    def get_height(self):
+        return self.height
+
+    def covers(self, text):
+        """Whether every character of text is in the atlas"""
+        index = self._index
+        return all(char in index for char in text)
+
+    def _positions(self, text):
+        """Return the x of each glyph and the total width (text must be covered)"""
+        index, glyphs, kerning, count = self._index, self._glyphs, self._kerning, self._count
+        positions = []
+        x = 0
+        previous = None
+        for char in text:
+            current = index[char]
+            if previous is not None:
+                x += kerning[previous * count + current]
+            positions.append(x)
+            x += glyphs[char][2]
+            previous = current
+        return positions, x
+
+    def size(self, text):
+        """
+        Return the (width, height) render() produces for text
+
+        Args:
+            text: String to measure
+        """
+        if not self.covers(text):
+            return self.freetype().size(text)
+        glyphs = self._glyphs
+        height = max((glyphs[char][3] for char in text), default=self.height)
+        return self._positions(text)[1], height
+
+    def render(self, text, antialias, color):
+        """
+        Draw text onto a new per-pixel alpha surface
+
+        Args:
+            text: String to draw
+            antialias: Whether to antialias the glyphs (the atlas is antialiased)
+            color: RGB tuple
+        """
+        if not antialias or not self.covers(text):
+            return self.freetype().render(text, antialias, color)
+
+        glyphs = self._glyphs
+        positions, width = self._positions(text)
+        height = max((glyphs[char][3] for char in text), default=self.height)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        source = self._tint(tuple(color))
+        # Glyph boxes may overlap after kerning: keep the stronger coverage, as FreeType does
+        flags = pygame.BLEND_RGBA_MAX
+        surface.blits([(source, (x, 0), glyphs[char], flags) for x, char in zip(positions, text)], False)
+        return surface
+
+    def _tint(self, color):
+        """Return the glyph image in color, tinting it on first use"""
+        tinted = self._tinted.get(color)
+        if tinted is None:
+            tinted = self.image.copy()
+            tinted.fill(color[:3] + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+            self._tinted[color] = tinted
+        return tinted
+
+    def freetype(self):
+        """Return the FreeType font of the same size, opening it on first use"""
+        if self._fallback is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._fallback = pygame.font.Font(None, self.point_size)
+        return self._fallback
+
+
+def bake(sizes, charset=CHARSET, width=ATLAS_WIDTH):
+    """
+    Rasterize charset at each size into one atlas
+
+    Glyphs are rendered white and packed in shelves, one band of shelves per size. The
+    kerning matrices record how far a pair's rendered width differs from the sum of its
+    glyph widths, so composed strings keep FreeType's pair spacing.
+
+    Args:
+        sizes: Iterable of point sizes
+        charset: Characters to bake
+        width: Width of the atlas in pixels
+
+    Returns:
+        tuple: (metrics dict ready for json.dump, atlas data bytes)
+    """
+    pygame.font.init()
+    white = (255, 255, 255)
+    metrics = {'version': ATLAS_VERSION, 'charset': charset, 'width': width, 'sizes': {}}
+    images = []
+    kerning = bytearray()
+    y = 0
+    for size in sorted(set(sizes), reverse=True):
+        font = pygame.font.Font(None, size)
+        glyphs = []
+        x = shelf_height = 0
+        for char in charset:
+            image = font.render(char, True, white)
+            w, h = image.get_size()
+            if x + w > width:
+                x, y = 0, y + shelf_height
+                shelf_height = 0
+            glyphs.append([x, y, w, h])
+            images.append((image, (x, y)))
+            x += w
+            shelf_height = max(shelf_height, h)
+        y += shelf_height
+
+        metrics['sizes'][str(size)] = {
+            'height': font.get_height(),
+            'glyphs': glyphs,
+            'kerning': len(kerning),
+        }
+        widths = [rect[2] for rect in glyphs]
+        for i, first in enumerate(charset):
+            for j, second in enumerate(charset):
+                delta = font.size(first + second)[0] - widths[i] - widths[j]
+                if not -128 <= delta < 128:
+                    raise ValueError(f"kerning of {first + second!r} at size {size} does not fit a byte")
+                kerning.append(delta & 0xFF)  # Stored as a signed byte
+
+    metrics['height'] = max(y, 1)
+    atlas = pygame.Surface((width, metrics['height']), pygame.SRCALPHA)
+    atlas.blits(images, False)
+    coverage = pygame.image.tobytes(atlas, 'RGBA')[3::4]
+    return metrics, coverage + kerning
+
+
+def build(sizes, metrics_path=ATLAS_METRICS, data_path=ATLAS_DATA):
+    """
+    Bake the atlas and write its two files
+
+    Args:
+        sizes: Iterable of point sizes
+        metrics_path: JSON file to write
+        data_path: Binary file to write
+
+    Returns:
+        dict: The metrics written
+    """
+    metrics, data = bake(sizes)
+    os.makedirs(os.path.dirname(metrics_path), exist_ok=True)
+    with open(metrics_path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, separators=(',', ':'))
+    with open(data_path, 'wb') as f:
+        f.write(data)
+    return metrics
+
+
+def load(sizes, metrics_path=ATLAS_METRICS, data_path=ATLAS_DATA):
+    """
+    Load baked fonts from the atlas files
+
+    Args:
+        sizes: Iterable of point sizes needed
+        metrics_path: Metrics JSON
+        data_path: Atlas data
+
+    Returns:
+        dict: point size -> BitmapFont, or None when the files are missing, from another
+        atlas version, or lack one of the sizes
+    """
+    try:
+        with open(metrics_path, encoding='utf-8') as f:
+            metrics = json.load(f)
+        with open(data_path, 'rb') as f:
+            data = f.read()
+    except (OSError, ValueError):
+        return None
+    if metrics.get('version') != ATLAS_VERSION:
+        return None
+    entries = [metrics['sizes'].get(str(size)) for size in set(sizes)]
+    if None in entries:
+        return None
+
+    charset = metrics['charset']
+    width, height = metrics['width'], metrics['height']
+    pixels = bytearray(b'\xff') * (width * height * 4)  # White glyphs...
+    pixels[3::4] = data[:width * height]                # ...with the baked coverage as alpha
+    atlas = pygame.image.frombuffer(pixels, (width, height), 'BGRA')
+    kerning = memoryview(data).cast('b')
+
+    fonts = {}
+    for size in set(sizes):
+        entry = metrics['sizes'][str(size)]
+        glyphs = entry['glyphs']
+        # Each font keeps only its own band of the atlas, so tinting copies just that band
+        top = min(y for x, y, w, h in glyphs)
+        bottom = max(y + h for x, y, w, h in glyphs)
+        image = atlas.subsurface((0, top, width, bottom - top)).copy()
+        glyphs = [(x, y - top, w, h) for x, y, w, h in glyphs]
+        start = width * height + entry['kerning']
+        fonts[size] = BitmapFont(size, image, charset, glyphs,
+                                 kerning[start:start + len(charset) ** 2], entry['height'])
+    return fonts
+
+
+def load_fonts(font_sizes, metrics_path=ATLAS_METRICS, data_path=ATLAS_DATA):
+    """
+    Return the named UI fonts, from the atlas when it is available
+
+    Args:
+        font_sizes: Dict of font name -> point size
+        metrics_path: Metrics JSON
+        data_path: Atlas data
+
+    Returns:
+        dict: font name -> BitmapFont (or pygame Font when the atlas cannot be loaded)
+    """
+    fonts = load(font_sizes.values(), metrics_path, data_path)
+    if fonts is None:
+        pygame.font.init()
+        fonts = {size: pygame.font.Font(None, size) for size in set(font_sizes.values())}
+    return {name: fonts[size] for name, size in font_sizes.items()}
+
+
+def main(argv=None):
+    """Command line entry point: bake the atlas of the UI font sizes"""
+    from .constants import FONT_SIZES
+
+    parser = argparse.ArgumentParser(description="Bake the bitmap font atlas of the Word Guessing Game UI")
+    parser.add_argument("--metrics", default=ATLAS_METRICS, help="metrics JSON to write")
+    parser.add_argument("--data", default=ATLAS_DATA, help="atlas data file to write")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    metrics = build(FONT_SIZES.values(), args.metrics, args.data)
+    print(f"atlas {metrics['width']}x{metrics['height']}, {len(metrics['charset'])} glyphs per size")
+    for size in sorted(metrics['sizes'], key=int):
+        print(f"  size {size}: line height {metrics['sizes'][size]['height']}")
+    print(f"wrote {args.metrics} and {args.data}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ import pygame
 SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 800
 FPS = 60
+IDLE_WAIT_MS = 500  # Longest the loop sleeps waiting for input when nothing is moving
 
 # Colors (Wordle-inspired dark theme)
 COLORS = {
@@ -31,6 +32,7 @@ COLORS = {
 TILE_SIZE_BASE = 70
 TILE_SPACING = 8
 TILE_BORDER_WIDTH = 2
+MIN_TILE_SIZE = 36  # Smallest readable tile; taller boards scroll instead of shrinking further
 
 # Grid positioning
 GRID_TOP_MARGIN = 120
@@ -55,37 +57,75 @@ BUTTON_BORDER_RADIUS = 8
 # Number selector dimensions
 NUMBER_BUTTON_SIZE = 50
 NUMBER_BUTTON_SPACING = 10
+NUMBER_BUTTONS_PER_ROW = 10
+
+# Game settings offered on the setup screen (the dictionary has no words longer than 11 letters)
+ATTEMPT_CHOICES = tuple(range(1, 11)) + (12, 15, 20, 25, 30, 40, 50, 60, 80, 100)
+LENGTH_CHOICES = tuple(range(3, 12))
+
+# Point size of each UI font; the baked atlas (ui/bitmap_font.py) holds these sizes
+FONT_SIZES = {
+    'title': 48,
+    'header': 36,
+    'normal': 28,
+    'tile': 36,
+    'small': 20,
+    'key': 24,
+}
 
 # Fonts (will be initialized after pygame.init())
 FONTS = None
 
-def init_fonts():
-    """Initialize pygame fonts after pygame.init() is called"""
+
+class FontTable(dict):
+    """FONTS of the FreeType path: each named font is opened the first time it is used"""
+
+    def __missing__(self, name):
+        font = self[name] = pygame.font.Font(None, FONT_SIZES[name])
+        return font
+
+
+def init_fonts(bitmap=False):
+    """Initialize pygame fonts after pygame.init() is called
+
+    Fonts are opened on first use, so the first frame only pays for the fonts it draws
+    with. With bitmap=True the fonts are loaded from the baked atlas (ui/bitmap_font.py)
+    instead of FreeType, which is then only used for characters outside the atlas or
+    when the atlas files are missing.
+    """
     global FONTS
+    if bitmap:
+        # Imported here so `python -m ...ui.bitmap_font` does not import itself via the package
+        from .bitmap_font import load_fonts
+        FONTS = load_fonts(FONT_SIZES)
+        return
     pygame.font.init()
-    FONTS = {
-        'title': pygame.font.Font(None, 48),
-        'header': pygame.font.Font(None, 36),
-        'normal': pygame.font.Font(None, 28),
-        'tile': pygame.font.Font(None, 36),
-        'small': pygame.font.Font(None, 20),
-        'key': pygame.font.Font(None, 24),
-    }
-
-def calculate_tile_size(word_length, max_attempts=6):
-    """Calculate tile size based on word length and attempts to fit screen"""
+    FONTS = FontTable()
+
+
+def calculate_tile_size(word_length, max_attempts=6, screen_width=SCREEN_WIDTH, keyboard_top=KEYBOARD_TOP_MARGIN):
+    """Calculate tile size based on word length and attempts to fit screen
+
+    screen_width and keyboard_top default to the design window; the layout engine
+    passes the values of the actual window.
+    """
     # Calculate max size based on width
-    max_width = SCREEN_WIDTH - 100  # Leave margins
+    max_width = screen_width - 100  # Leave margins
     tile_from_width = (max_width / word_length) - TILE_SPACING
 
     # Calculate max size based on height
     # Available height = keyboard start - grid top - input area
-    available_height = KEYBOARD_TOP_MARGIN - GRID_TOP_MARGIN - 70  # 70px for input area
+    available_height = keyboard_top - GRID_TOP_MARGIN - 70  # 70px for input area
     tile_from_height = (available_height / max_attempts) - TILE_SPACING
 
     # Use the smaller of the two to ensure it fits both ways
     return min(TILE_SIZE_BASE, tile_from_width, tile_from_height)
 
+def calculate_visible_rows(max_attempts, keyboard_top=KEYBOARD_TOP_MARGIN):
+    """Number of grid rows shown at once: all of them, unless their tiles would be smaller than MIN_TILE_SIZE"""
+    available_height = keyboard_top - GRID_TOP_MARGIN - 70  # Same area as calculate_tile_size
+    return max(1, min(max_attempts, int(available_height // (MIN_TILE_SIZE + TILE_SPACING))))
+
 
 # Animation timing constants (seconds)
 FLIP_DURATION = 0.3
@@ -99,3 +139,5 @@ BOUNCE_STAGGER = 0.1
 BOUNCE_AMPLITUDE = 30
 KEY_PRESS_DURATION = 0.1
 FADE_DURATION = 0.25
+ERROR_DURATION = 3.0  # Seconds an input error stays on screen
+SCROLL_DURATION = 0.2
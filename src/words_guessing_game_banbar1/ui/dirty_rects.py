@@ -0,0 +1,71 @@
+"""
+Dirty rectangle tracking for Word Guessing Game
+Components report what they show each frame; only regions that changed are sent to the display
+"""
+
+import pygame
+
+# Marks a state that differs from every other, for items that change every frame
+ANIMATING = object()
+
+
+class DirtyTracker:
+    """Collects the screen regions that changed since the last presented frame"""
+
+    def __init__(self):
+        self._previous = {}  # item -> (state, rect) of the last presented frame
+        self._current = {}
+        self._rects = []
+        self._full = True    # Nothing presented yet
+
+    def track(self, item, state, rect):
+        """
+        Report an element drawn this frame
+
+        The element is dirty if it is new, moved, or shows something different from
+        the last frame; both its old and new areas are then updated.
+
+        Args:
+            item: Hashable identity of the element (e.g. ('key', 'Q'))
+            state: Comparable snapshot of what it shows, or ANIMATING to always redraw
+            rect: Area the element covers this frame
+        """
+        rect = pygame.Rect(rect)
+        self._current[item] = (state, rect)
+        previous = self._previous.get(item)
+        if previous is None:
+            self._rects.append(rect)
+        elif state is ANIMATING or previous[0] is ANIMATING or previous != (state, rect):
+            self._rects.append(rect.union(previous[1]))
+
+    def add(self, rect):
+        """Report an area that changed this frame (e.g. damage reported by a scene group)"""
+        self._rects.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """Present the next frame in full (screen switch, fade, window exposed)"""
+        self._full = True
+
+    @property
+    def pending(self):
+        """True when damage was reported ahead of the next render (e.g. invalidate())"""
+        return self._full or bool(self._rects)
+
+    def take(self):
+        """
+        Finish the frame and return what has to be presented
+
+        Returns:
+            list or None: Changed rectangles, or None when the whole window must be flipped
+        """
+        # Elements that were not drawn this frame leave their old area behind
+        for item, (_, rect) in self._previous.items():
+            if item not in self._current:
+                self._rects.append(rect)
+
+        rects = None if self._full else self._rects
+        self._previous = self._current
+        self._current = {}
+        self._rects = []
+        self._full = False
+        return rects
@@ -3,31 +3,75 @@ End Screen for Word Guessing Game
 Displays win or loss message with replay option
 """
 
+import math
 import pygame
-from . import constants
-from .constants import COLORS, SCREEN_WIDTH, BUTTON_WIDTH
-from .ui_components import Button, Grid
+from .constants import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+from .ui_components import Button, create_grid, create_screen_layer
+from .scene import Group, TextNode
 from .animations import WinBounceAnimation
+from .prewarm import NextGamePrewarm
+from .text_cache import render_text
+from .dirty_rects import DirtyTracker
+from .timeline import Timeline
+from .layout import get_layout, get_grid_layout
+from .hit_index import HitIndex
+from .input_context import InputContext
+from words_guessing_game_banbar1.functions.leaderboard import format_time
+
+# Height of the statistics bars
+STATS_BAR_HEIGHT = 70
+# Most bars shown; longer distributions are grouped into ranges of guess counts
+MAX_STATS_BARS = 10
 
 
 class EndScreen:
     """End screen showing win/loss result"""
 
-    def __init__(self):
-        """Initialize end screen"""
-        # Create buttons
-        play_again_x = SCREEN_WIDTH // 2 - BUTTON_WIDTH - 10
-        exit_x = SCREEN_WIDTH // 2 + 10
-        button_y = 550
+    def __init__(self, executor=None, timeline=None, size=(SCREEN_WIDTH, SCREEN_HEIGHT), input_context=None):
+        """
+        Initialize end screen
 
-        self.play_again_button = Button("PLAY AGAIN", (play_again_x, button_y))
-        self.exit_button = Button("EXIT", (exit_x, button_y))
+        Args:
+            executor: Optional JobExecutor for work that must not block the frame loop
+            timeline: Timeline running the animations (ticked by the frame loop)
+            size: Window size the screen is laid out for
+            input_context: InputContext sampled by the frame loop
+        """
+        self.executor = executor
+        self.timeline = timeline if timeline is not None else Timeline()
+        self.input = input_context if input_context is not None else InputContext()
+        self.layout = get_layout(size)
+        self._create_buttons()
 
         self.grid = None
         self.bounce_animation = None
         self.bounce_row = -1
         self.bounce_started = False
 
+        # Next game with the same settings, prepared while this screen is showing
+        self.prewarm = None
+
+        # Result, answer, footer and statistics, drawn once per finished game on first render
+        self.background = None
+        # Scene graph over the background (leaderboard line, grid, buttons), built with it
+        self.scene = None
+        # Regions changed by each frame, for dirty rectangle presentation
+        self.dirty = DirtyTracker()
+
+    def _create_buttons(self):
+        """Create the buttons at the positions of the current layout"""
+        self.play_again_button = Button("PLAY AGAIN", self.layout.play_again_button)
+        self.settings_button = Button("SETTINGS", self.layout.settings_button)
+        self.exit_button = Button("EXIT", self.layout.exit_button)
+        self.hits = HitIndex(self.layout.size)
+        for button in (self.play_again_button, self.settings_button, self.exit_button):
+            button.register(self.hits)
+
+    def _create_grid(self, max_attempts, word_length):
+        """Create the final grid at its place in the current layout"""
+        self.grid = create_grid(max_attempts, word_length,
+                                get_grid_layout(self.layout.size, word_length, max_attempts, end_screen=True))
+
     def initialize_grid(self, max_attempts, word_length):
         """
         Initialize grid to display final game state
@@ -36,16 +80,60 @@ class EndScreen:
             max_attempts: Maximum number of attempts
             word_length: Length of the word
         """
-        self.grid = Grid(max_attempts, word_length)
+        self._create_grid(max_attempts, word_length)
+        self.timeline.cancel_owner(self)
         self.bounce_started = False
         self.bounce_animation = None
+        self.prewarm = None
+        self.background = None
+        self.scene = None
+
+    def resize(self, size):
+        """
+        Lay the screen out for a new window size
+
+        The prepared next game was built for the old size and is thrown away.
+
+        Args:
+            size: (width, height) of the window
+        """
+        self.layout = get_layout(size)
+        self._create_buttons()
+        if self.grid is not None:
+            self._create_grid(self.grid.max_attempts, self.grid.word_length)
+        self.prewarm = None
+        self.background = None
+        self.scene = None
+        self.dirty.invalidate()
+
+    def take_prewarm(self, attempts, length):
+        """
+        Hand over the prepared next game if it was built for these settings
+
+        Args:
+            attempts: Attempts setting of the game being started
+            length: Word length of the game being started
+
+        Returns:
+            NextGamePrewarm or None: Finished prewarm, or None if there is none or it does not match
+        """
+        prewarm = self.prewarm
+        self.prewarm = None
+        if prewarm is None or not prewarm.matches(attempts, length):
+            return None
+        prewarm.finish()
+        return prewarm
 
     def start_win_bounce(self, game_manager):
         """Start the win bounce animation on the winning row."""
         if not self.bounce_started:
             self.bounce_started = True
             self.bounce_row = len(game_manager.guesses) - 1
-            self.bounce_animation = WinBounceAnimation(game_manager.word_length)
+            self.bounce_animation = self.timeline.start(WinBounceAnimation(game_manager.word_length),
+                                                        on_done=self._bounce_done, owner=self)
+
+    def _bounce_done(self, anim):
+        self.bounce_animation = None
 
     def handle_event(self, event, game_manager):
         """
@@ -55,16 +143,20 @@ class EndScreen:
             event: Pygame event
             game_manager: GameManager instance
         """
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_pressed = pygame.mouse.get_pressed()
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            target = self.hits.hit(event.pos)
 
-            # Check play again button
-            if self.play_again_button.is_clicked(mouse_pos, mouse_pressed):
+            # Check play again button: same settings, straight into the next game
+            if target is self.play_again_button:
+                self.play_again(game_manager)
+
+            # Check settings button: back to setup, the prepared game is thrown away
+            if target is self.settings_button:
+                self.prewarm = None
                 game_manager.reset_game()
 
             # Check exit button
-            if self.exit_button.is_clicked(mouse_pos, mouse_pressed):
+            if target is self.exit_button:
                 pygame.quit()
                 exit()
 
@@ -75,31 +167,48 @@ class EndScreen:
         Args:
             game_manager: GameManager instance
         """
-        mouse_pos = pygame.mouse.get_pos()
-        self.play_again_button.update(mouse_pos)
-        self.exit_button.update(mouse_pos)
+        self.hits.hover(self.input.mouse_pos)
 
-        # Clean up finished bounce animation
-        if self.bounce_animation and self.bounce_animation.is_complete:
-            self.bounce_animation = None
+        # Prepare the next game a little each frame
+        if self.prewarm is None:
+            self._start_prewarm(game_manager)
+        self.prewarm.step()
 
-    def render(self, screen, game_manager):
+    def play_again(self, game_manager):
+        """Start the prepared next game with the same settings"""
+        if self.prewarm is None:
+            self._start_prewarm(game_manager)
+        self.prewarm.finish()
+        game_manager.start_game(self.prewarm.attempts, self.prewarm.length, seed=self.prewarm.seed,
+                                timed=self.prewarm.timed, word=self.prewarm.word)
+
+    def _start_prewarm(self, game_manager):
+        """Start preparing a game with the settings of the one just finished"""
+        self.prewarm = NextGamePrewarm(game_manager.attempts_total, game_manager.word_length, game_manager.timed,
+                                       executor=self.executor, owner=self, size=self.layout.size)
+
+    def is_animating(self, game_manager):
         """
-        Render the end screen
+        Whether the screen changes without input and needs frames at the full rate
 
         Args:
-            screen: Pygame screen surface
             game_manager: GameManager instance
         """
-        # Clear screen
-        screen.fill(COLORS['background'])
+        entry = game_manager.leaderboard_entry
+        return (self.bounce_animation is not None
+                or self.prewarm is None or not self.prewarm.ready
+                or (entry is not None and not entry.done))
 
-        # Determine if win or loss
-        is_win = game_manager.check_win_condition()
+    def _build_background(self, game_manager, is_win):
+        """
+        Draw the parts of the screen that do not change while it is showing
 
-        # Start win bounce on first render if player won
-        if is_win:
-            self.start_win_bounce(game_manager)
+        Args:
+            game_manager: GameManager instance
+            is_win: Whether the game just finished was won
+        """
+        layout = self.layout
+        layer = create_screen_layer(layout.size)
 
         # Draw result message
         if is_win:
@@ -109,45 +218,136 @@ class EndScreen:
             message = "GAME OVER"
             message_color = COLORS['error']
 
-        message_surface = constants.FONTS['title'].render(message, True, message_color)
-        message_rect = message_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        screen.blit(message_surface, message_rect)
+        message_surface = render_text('title', message, message_color)
+        message_rect = message_surface.get_rect(center=layout.end_message)
+        layer.blit(message_surface, message_rect)
 
         # Draw attempts info
-        if is_win:
+        if is_win and game_manager.solve_time_us is not None:
+            info_text = (f"Solved in {game_manager.attempts_total - game_manager.attempts_remaining} attempt(s) "
+                         f"and {format_time(game_manager.solve_time_us)}!")
+        elif is_win:
             info_text = f"You guessed the word in {game_manager.attempts_total - game_manager.attempts_remaining} attempt(s)!"
         else:
             info_text = "Better luck next time!"
 
-        info_surface = constants.FONTS['normal'].render(info_text, True, COLORS['text_white'])
-        info_rect = info_surface.get_rect(center=(SCREEN_WIDTH // 2, 130))
-        screen.blit(info_surface, info_rect)
+        info_surface = render_text('normal', info_text, COLORS['text_white'])
+        info_rect = info_surface.get_rect(center=layout.end_info)
+        layer.blit(info_surface, info_rect)
 
         # Draw the answer
         answer_text = f"The word was: {game_manager.guess_word.upper()}"
-        answer_surface = constants.FONTS['normal'].render(answer_text, True, COLORS['text_white'])
-        answer_rect = answer_surface.get_rect(center=(SCREEN_WIDTH // 2, 170))
-        screen.blit(answer_surface, answer_rect)
+        answer_surface = render_text('normal', answer_text, COLORS['text_white'])
+        answer_rect = answer_surface.get_rect(center=layout.end_answer)
+        layer.blit(answer_surface, answer_rect)
+
+        # Draw additional info
+        footer_text = "PLAY AGAIN with the same settings, SETTINGS to change them, or EXIT"
+        footer_surface = render_text('small', footer_text, COLORS['text_white'])
+        footer_rect = footer_surface.get_rect(center=layout.end_footer)
+        layer.blit(footer_surface, footer_rect)
+
+        # Draw player statistics
+        if game_manager.stats is not None:
+            self._render_stats(layer, game_manager, is_win)
+
+        self.background = layer
+        self.scene = Group(layer.get_rect(), base=layer)
+        self.leaderboard_node = self.scene.add(TextNode('small', "", COLORS['text_white'], position=layout.end_leaderboard))
+        self.leaderboard_node.visible = False
+        self.scene.add(self.grid)
+        for button in (self.play_again_button, self.settings_button, self.exit_button):
+            self.scene.add(button)
+
+    def render(self, screen, game_manager):
+        """
+        Render the end screen
+
+        Args:
+            screen: Pygame screen surface
+            game_manager: GameManager instance
+        """
+        # Determine if win or loss
+        is_win = game_manager.check_win_condition()
+
+        # Start win bounce on first render if player won
+        if is_win:
+            self.start_win_bounce(game_manager)
+
+        if self.background is None:
+            self._build_background(game_manager, is_win)
+
+        # Speedrun rank and best times (filled in by the leaderboard thread)
+        entry = game_manager.leaderboard_entry
+        if entry is not None:
+            self.leaderboard_node.set_text(self._leaderboard_text(entry))
+        self.leaderboard_node.set_state(visible=entry is not None)
+
+        # Composite: only nodes whose state changed are redrawn
+        self.grid.set_contents(game_manager.guesses, "")
+        if self.grid.scrolls:
+            # A board taller than the screen shows the rows that ended the game
+            last_row = max(len(game_manager.guesses) - 1, 0)
+            self.grid.set_scroll(self.grid.offset_showing(last_row, self.grid.scroll_y))
+        for rect in self.scene.render(screen):
+            self.dirty.add(rect)
 
-        # Build animation state for the grid
+        # Win bounce is drawn over the composited grid
         anim_state = {}
         if self.bounce_animation:
             anim_state['bounce'] = self.bounce_animation
             anim_state['bounce_row'] = self.bounce_row
+        self.grid.render_animations(screen, anim_state)
+        self.grid.track_dirty(self.dirty, anim_state)
 
-        # Render final grid state
-        if self.grid:
-            original_start_y = self.grid.start_y
-            self.grid.start_y = 220
-            self.grid.render(screen, game_manager.guesses, "", anim_state)
-            self.grid.start_y = original_start_y
+    def _leaderboard_text(self, entry):
+        """
+        Text showing the rank of this run and the best times of its setting
 
-        # Render buttons
-        self.play_again_button.render(screen)
-        self.exit_button.render(screen)
+        Args:
+            entry: LeaderboardEntry filled in by the leaderboard thread
+        """
+        if entry.done:
+            best = "  ".join(format_time(t) for t in entry.top_times)
+            return f"Rank #{entry.rank} of {entry.total}  |  Best: {best}"
+        return "Saving time..."
 
-        # Draw additional info
-        footer_text = "Click PLAY AGAIN to start a new game or EXIT to quit"
-        footer_surface = constants.FONTS['small'].render(footer_text, True, COLORS['text_white'])
-        footer_rect = footer_surface.get_rect(center=(SCREEN_WIDTH // 2, 630))
-        screen.blit(footer_surface, footer_rect)
+    def _render_stats(self, screen, game_manager, is_win):
+        """
+        Render the statistics summary and the guess distribution for the current setting
+
+        Args:
+            screen: Pygame screen surface
+            game_manager: GameManager instance
+            is_win: Whether the game just finished was won
+        """
+        layout = self.layout
+        stats = game_manager.stats
+        summary = (f"Played: {stats.games_played}  |  Win: {stats.win_rate}%  |  "
+                   f"Streak: {stats.current_streak}  |  Max: {stats.max_streak}")
+        summary_surface = render_text('small', summary, COLORS['text_white'])
+        summary_rect = summary_surface.get_rect(center=(layout.center_x, layout.stats_top))
+        screen.blit(summary_surface, summary_rect)
+
+        # Vertical bar per guess count (or range of counts), highlighting the bar this game landed in
+        distribution = stats.get_distribution(game_manager.word_length, game_manager.attempts_total)
+        group = math.ceil(len(distribution) / MAX_STATS_BARS)
+        bars = [sum(distribution[i:i + group]) for i in range(0, len(distribution), group)]
+        highlight = (len(game_manager.guesses) - 1) // group if is_win else -1
+        peak = max(max(bars), 1)
+        start_x, slot_width = layout.stats_slots(len(bars))
+        baseline_y = layout.stats_top + 30 + STATS_BAR_HEIGHT
+
+        for i, count in enumerate(bars):
+            x = start_x + i * slot_width
+            height = max(2, int(STATS_BAR_HEIGHT * count / peak))
+            color = COLORS['tile_correct'] if i == highlight else COLORS['tile_absent']
+            bar_rect = pygame.Rect(x + 4, baseline_y - height, slot_width - 8, height)
+            pygame.draw.rect(screen, color, bar_rect)
+
+            count_surface = render_text('small', str(count), COLORS['text_white'])
+            screen.blit(count_surface, count_surface.get_rect(midbottom=(bar_rect.centerx, bar_rect.top - 2)))
+            first, last = i * group + 1, min((i + 1) * group, len(distribution))
+            label = str(first) if first == last else f"{first}-{last}"
+            label_surface = render_text('small', label, COLORS['text_white'])
+            screen.blit(label_surface, label_surface.get_rect(midtop=(bar_rect.centerx, baseline_y + 4)))
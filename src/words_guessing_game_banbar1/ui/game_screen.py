@@ -4,21 +4,42 @@ Main gameplay interface with grid, input, and virtual keyboard
 """
 
 import pygame
-from . import constants
-from .constants import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT, GRID_TOP_MARGIN, TILE_SPACING
-from .ui_components import Grid, VirtualKeyboard
-from .animations import TileFlipAnimation, TilePopAnimation, RowShakeAnimation, KeyPressAnimation
+from .constants import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT, ERROR_DURATION
+from .ui_components import VirtualKeyboard, create_grid, create_screen_layer
+from .scene import Group, TextNode
+from .animations import (
+    Delay, TileFlipAnimation, TilePopAnimation, RowShakeAnimation, KeyPressAnimation, ScrollAnimation
+)
+from .text_cache import render_text
+from .dirty_rects import DirtyTracker
+from .timeline import Timeline
+from .layout import get_layout, get_grid_layout
+from .hit_index import HitIndex
+from .input_context import InputContext
+from words_guessing_game_banbar1.functions.leaderboard import format_time
 
 
 class GameScreen:
     """Main game screen with word grid and keyboard"""
 
-    def __init__(self):
-        """Initialize game screen"""
+    def __init__(self, executor=None, timeline=None, size=(SCREEN_WIDTH, SCREEN_HEIGHT), input_context=None):
+        """
+        Initialize game screen
+
+        Args:
+            executor: Optional JobExecutor for work that must not block the frame loop
+            timeline: Timeline running the animations (ticked by the frame loop)
+            size: Window size the screen is laid out for
+            input_context: InputContext sampled by the frame loop
+        """
+        self.executor = executor
+        self.timeline = timeline if timeline is not None else Timeline()
+        self.input = input_context if input_context is not None else InputContext()
+        self.layout = get_layout(size)
         self.grid = None
-        self.virtual_keyboard = VirtualKeyboard()
+        self._set_keyboard(VirtualKeyboard(self.layout))
         self.error_message = ""
-        self.error_timer = 0  # Timer to fade out error message
+        self.error_delay = None  # Hides the error message when it completes
 
         # Animation state
         self.flip_animation = None
@@ -29,34 +50,116 @@ class GameScreen:
         self.shake_animation = None
         self.shake_row = -1
         self.key_press_animation = None
-        self.pending_state = None   # Deferred WIN/LOSE during flip
         self.animating = False      # Block input during flip
 
-    def initialize_grid(self, max_attempts, word_length):
+        # Scrolling of grids too tall for the window
+        self.scroll_animation = None
+        self.scroll_target = None   # Offset the grid is scrolling to (None: not placed yet)
+        self._followed_count = -1   # Guess count and input the grid was last scrolled to show
+        self._followed_input = None
+
+        # Title and instructions, drawn once per game on first render
+        self.background = None
+        # Scene graph over the background (info bar, grid, input, error, keyboard), built with it
+        self.scene = None
+        # Regions changed by each frame, for dirty rectangle presentation
+        self.dirty = DirtyTracker()
+
+    def initialize_grid(self, max_attempts, word_length, prewarm=None):
         """
         Initialize grid with game parameters
 
         Args:
             max_attempts: Maximum number of attempts
             word_length: Length of the word
+            prewarm: Optional finished NextGamePrewarm for these settings
         """
-        self.grid = Grid(max_attempts, word_length)
-        self.virtual_keyboard.reset()
+        if prewarm is not None:
+            # Grid and keyboard were already built and pre-rendered on the end screen
+            self.grid = prewarm.grid
+            self._set_keyboard(prewarm.keyboard)
+        else:
+            self.grid = create_grid(max_attempts, word_length,
+                                    get_grid_layout(self.layout.size, word_length, max_attempts))
+            self.virtual_keyboard.reset()
         self.error_message = ""
+        self.background = None
+        self.scene = None
         self._clear_animations()
+        self._reset_scroll()
+
+    def resize(self, size):
+        """
+        Lay the screen out for a new window size; the game and its animations carry on
+
+        Args:
+            size: (width, height) of the window
+        """
+        self.layout = get_layout(size)
+        letter_states = self.virtual_keyboard.letter_states
+        self._set_keyboard(VirtualKeyboard(self.layout))
+        self.virtual_keyboard.letter_states = letter_states
+        if self.grid is not None:
+            # Tiles are refilled from the game state on the next render
+            self.grid = create_grid(self.grid.max_attempts, self.grid.word_length,
+                                    get_grid_layout(size, self.grid.word_length, self.grid.max_attempts))
+        if self.scroll_animation is not None:
+            self.timeline.cancel(self.scroll_animation)
+        self._reset_scroll()
+        self.background = None
+        self.scene = None
+        self.dirty.invalidate()
+
+    def _set_keyboard(self, keyboard):
+        """Use a keyboard, indexing its keys for clicks and hover"""
+        self.virtual_keyboard = keyboard
+        self.hits = HitIndex(self.layout.size)
+        keyboard.register(self.hits)
 
     def _clear_animations(self):
-        """Reset all animation state"""
+        """Stop all animations of this screen"""
+        self.timeline.cancel_owner(self)
         self.flip_animation = None
         self.pop_animation = None
         self.shake_animation = None
         self.key_press_animation = None
-        self.pending_state = None
+        self.error_delay = None
+        self.scroll_animation = None
         self.animating = False
 
+    def _reset_scroll(self):
+        """Place the next grid rendered at the active row without animating"""
+        self.scroll_animation = None
+        self.scroll_target = None
+        self._followed_count = -1
+        self._followed_input = None
+
+    def _start(self, attr, animation, on_done=None):
+        """
+        Run an animation on the timeline, replacing the one stored in an attribute
+
+        The attribute is cleared when the animation completes.
+
+        Args:
+            attr: Attribute holding the animation (e.g. 'pop_animation')
+            animation: Animation to start
+            on_done: Optional extra callback run on completion
+        """
+        previous = getattr(self, attr)
+        if previous is not None:
+            self.timeline.cancel(previous)
+
+        def finished(anim):
+            if getattr(self, attr) is anim:
+                setattr(self, attr, None)
+            if on_done is not None:
+                on_done(anim)
+
+        setattr(self, attr, self.timeline.start(animation, on_done=finished, owner=self))
+
     def _start_pop(self, game_manager, col):
         """Start a pop animation on the tile that just received a letter."""
-        self.pop_animation = TilePopAnimation()
+        self._start('pop_animation', TilePopAnimation())
         self.pop_row = len(game_manager.guesses)
         self.pop_col = col
 
@@ -68,6 +171,13 @@ class GameScreen:
             event: Pygame event
             game_manager: GameManager instance
         """
+        # Mouse wheel scrolls a grid that is taller than the window, even during a flip
+        if event.type == pygame.MOUSEWHEEL:
+            if self.grid is not None and self.grid.scrolls:
+                current = self.scroll_target if self.scroll_target is not None else self.grid.scroll_y
+                self._scroll_to(current - event.y * self.grid.row_pitch)
+            return
+
         # Block input during flip animation
         if self.animating:
             return
@@ -78,39 +188,32 @@ class GameScreen:
                 self._submit_guess(game_manager)
 
             elif event.key == pygame.K_BACKSPACE:
-                if game_manager.current_input:
-                    game_manager.current_input = game_manager.current_input[:-1]
+                if game_manager.remove_letter():
                     self.error_message = ""
 
             elif event.key == pygame.K_ESCAPE:
                 game_manager.reset_game()
 
             else:
-                if event.unicode.isalpha() and len(game_manager.current_input) < game_manager.word_length:
+                if event.unicode.isalpha() and game_manager.add_letter(event.unicode):
                     letter = event.unicode.upper()
-                    game_manager.current_input += letter
                     self.error_message = ""
                     # Start pop and key press animations
                     self._start_pop(game_manager, len(game_manager.current_input) - 1)
-                    self.key_press_animation = KeyPressAnimation(letter)
+                    self._start('key_press_animation', KeyPressAnimation(letter))
 
         # Handle virtual keyboard clicks
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_pressed = pygame.mouse.get_pressed()
-
-            action_type, value = self.virtual_keyboard.handle_click(mouse_pos, mouse_pressed)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            action_type, value = self.virtual_keyboard.action_for(self.hits.hit(event.pos))
 
             if action_type == 'letter':
-                if len(game_manager.current_input) < game_manager.word_length:
-                    game_manager.current_input += value
+                if game_manager.add_letter(value):
                     self.error_message = ""
                     self._start_pop(game_manager, len(game_manager.current_input) - 1)
-                    self.key_press_animation = KeyPressAnimation(value)
+                    self._start('key_press_animation', KeyPressAnimation(value))
 
             elif action_type == 'backspace':
-                if game_manager.current_input:
-                    game_manager.current_input = game_manager.current_input[:-1]
+                if game_manager.remove_letter():
                     self.error_message = ""
 
             elif action_type == 'submit':
@@ -134,60 +237,123 @@ class GameScreen:
         if not success:
             # Show error and start shake animation on the current input row
             self.error_message = error
-            self.error_timer = 180
-            self.shake_animation = RowShakeAnimation()
+            self._start('error_delay', Delay(ERROR_DURATION), on_done=self._clear_error)
+            self._start('shake_animation', RowShakeAnimation())
             self.shake_row = guess_row
         else:
             self.error_message = ""
-            game_manager.current_input = ""
+
+            # Hold a WIN/LOSE transition back until the row has flipped
+            from words_guessing_game_banbar1.main_game_func import GameState
+            final_state = game_manager.state
+            if final_state in (GameState.WIN, GameState.LOSE):
+                game_manager.state = GameState.PLAYING
+
+            def flip_done(anim):
+                self.animating = False
+                if final_state != GameState.PLAYING:
+                    game_manager.state = final_state
 
             # Start flip animation on the just-submitted row
-            self.flip_animation = TileFlipAnimation(game_manager.word_length)
+            self._start('flip_animation', TileFlipAnimation(game_manager.word_length), on_done=flip_done)
             self.flip_row = guess_row
             self.animating = True
 
-            # Defer state transition until flip animation finishes
-            from words_guessing_game_banbar1.main_game_func import GameState
-            if game_manager.state in (GameState.WIN, GameState.LOSE):
-                self.pending_state = game_manager.state
-                game_manager.state = GameState.PLAYING
-
             # Update virtual keyboard states
             self.virtual_keyboard.update_letter_states(game_manager.guesses, game_manager.guess_word)
 
+    def _scroll_to(self, offset):
+        """Start a smooth scroll of the grid to an offset"""
+        offset = self.grid.clamp_scroll(offset)
+        if offset != self.scroll_target:
+            self.scroll_target = offset
+            self._start('scroll_animation', ScrollAnimation(self.grid.scroll_y, offset), on_done=self._scroll_done)
+
+    def _scroll_done(self, anim):
+        self.grid.set_scroll(anim.end_offset)
+
+    def _follow_active_row(self, game_manager):
+        """
+        Keep the row being typed in view once the guesses or the input change
+
+        A new grid is placed directly; afterwards the grid scrolls smoothly. Scrolling
+        away with the mouse wheel lasts until the next keystroke.
+
+        Args:
+            game_manager: GameManager instance
+        """
+        guess_count = len(game_manager.guesses)
+        if guess_count == self._followed_count and game_manager.current_input == self._followed_input:
+            return
+        self._followed_count = guess_count
+        self._followed_input = game_manager.current_input
+
+        row = min(guess_count, self.grid.max_attempts - 1)
+        if self.scroll_target is None:
+            self.scroll_target = self.grid.offset_showing(row, 0)
+            self.grid.set_scroll(self.scroll_target)
+        else:
+            self._scroll_to(self.grid.offset_showing(row, self.scroll_target))
+
+    def _clear_error(self, anim):
+        """Hide the error message once its display time is over"""
+        self.error_message = ""
+
     def update(self, game_manager):
         """
         Update game screen state
 
+        Animations are finished by the timeline, which runs their callbacks.
+
+        Args:
+            game_manager: GameManager instance
+        """
+        self.hits.hover(self.input.mouse_pos)
+
+    def is_animating(self, game_manager):
+        """
+        Whether the screen changes without input and needs frames at the full rate
+
         Args:
             game_manager: GameManager instance
         """
-        # Fade out error message
-        if self.error_timer > 0:
-            self.error_timer -= 1
-            if self.error_timer == 0:
-                self.error_message = ""
-
-        # Check if flip animation completed
-        if self.flip_animation and self.flip_animation.is_complete:
-            self.flip_animation = None
-            self.animating = False
-            # Apply deferred state transition
-            if self.pending_state is not None:
-                game_manager.state = self.pending_state
-                self.pending_state = None
-
-        # Clean up finished pop animation
-        if self.pop_animation and self.pop_animation.get_scale() is None:
-            self.pop_animation = None
-
-        # Clean up finished shake animation
-        if self.shake_animation and self.shake_animation.get_offset_x() is None:
-            self.shake_animation = None
-
-        # Clean up finished key press animation
-        if self.key_press_animation and self.key_press_animation.get_darken_amount() is None:
-            self.key_press_animation = None
+        return (self.flip_animation is not None
+                or self.pop_animation is not None
+                or self.shake_animation is not None
+                or self.key_press_animation is not None
+                or self.error_delay is not None
+                or self.scroll_animation is not None
+                or game_manager.timer_running)
+
+    def _build_background(self):
+        """Draw the parts of the screen that stay the same for the whole game"""
+        layout = self.layout
+        layer = create_screen_layer(layout.size)
+
+        # Draw title
+        title_surface = render_text('header', "WORD GUESSING GAME", COLORS['text_white'])
+        title_rect = title_surface.get_rect(center=layout.game_title)
+        layer.blit(title_surface, title_rect)
+
+        # Draw instructions at bottom
+        instructions = "Type or click letters | ENTER/SUBMIT to guess | ESC to restart"
+        instructions_surface = render_text('small', instructions, COLORS['text_white'])
+        instructions_rect = instructions_surface.get_rect(center=layout.game_instructions)
+        layer.blit(instructions_surface, instructions_rect)
+
+        self.background = layer
+
+        grid_layout = self.grid.layout
+        self.scene = Group(layer.get_rect(), base=layer)
+        # The info line of a timed game changes every frame, so it stays out of the text cache
+        self.info_node = self.scene.add(TextNode('small', "", COLORS['text_white'], position=layout.game_info,
+                                                 cached=False))
+        self.scene.add(self.grid)
+        self.input_node = self.scene.add(TextNode('normal', "", COLORS['text_white'],
+                                                  position=(layout.center_x, grid_layout.input_y)))
+        self.error_node = self.scene.add(TextNode('small', "", COLORS['error'],
+                                                  position=(layout.center_x, grid_layout.error_y)))
+        self.scene.add(self.virtual_keyboard)
 
     def render(self, screen, game_manager):
         """
@@ -197,19 +363,32 @@ class GameScreen:
             screen: Pygame screen surface
             game_manager: GameManager instance
         """
-        # Clear screen
-        screen.fill(COLORS['background'])
+        if self.background is None:
+            self._build_background()
 
-        # Draw title
-        title_surface = constants.FONTS['header'].render("WORD GUESSING GAME", True, COLORS['text_white'])
-        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 40))
-        screen.blit(title_surface, title_rect)
-
-        # Draw info bar (attempts remaining)
+        # Info bar (attempts remaining)
         info_text = f"Attempts: {game_manager.attempts_remaining}/{game_manager.attempts_total}  |  Length: {game_manager.word_length}"
-        info_surface = constants.FONTS['small'].render(info_text, True, COLORS['text_white'])
-        info_rect = info_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        screen.blit(info_surface, info_rect)
+        if game_manager.timed:
+            info_text += f"  |  Time: {format_time(game_manager.get_elapsed_us())}"
+        self.info_node.set_text(info_text)
+
+        # Grid tiles, current input display (below grid) and error message
+        self.grid.set_contents(game_manager.guesses, game_manager.current_input)
+        if self.grid.scrolls:
+            self._follow_active_row(game_manager)
+            if self.scroll_animation is not None:
+                self.grid.set_scroll(self.scroll_animation.get_offset())
+        self.input_node.set_text(
+            f"Current: {game_manager.current_input}{'_' * (game_manager.word_length - len(game_manager.current_input))}")
+        self.error_node.set_text(self.error_message)
+        self.error_node.set_state(visible=bool(self.error_message))
+
+        # Virtual keyboard with key press animation
+        self.virtual_keyboard.update_keys(key_press_anim=self.key_press_animation)
+
+        # Composite: only nodes whose state changed above are redrawn
+        for rect in self.scene.render(screen):
+            self.dirty.add(rect)
 
         # Build animation state for the grid
         anim_state = {}
@@ -224,28 +403,6 @@ class GameScreen:
             anim_state['pop_row'] = self.pop_row
             anim_state['pop_col'] = self.pop_col
 
-        # Render grid if initialized
-        if self.grid:
-            self.grid.render(screen, game_manager.guesses, game_manager.current_input, anim_state)
-
-        # Render current input display (below grid)
-        input_y = GRID_TOP_MARGIN + game_manager.attempts_total * (self.grid.tile_size + TILE_SPACING) + 10
-        input_text = f"Current: {game_manager.current_input}{'_' * (game_manager.word_length - len(game_manager.current_input))}"
-        input_surface = constants.FONTS['normal'].render(input_text, True, COLORS['text_white'])
-        input_rect = input_surface.get_rect(center=(SCREEN_WIDTH // 2, input_y))
-        screen.blit(input_surface, input_rect)
-
-        # Render error message if present
-        if self.error_message:
-            error_surface = constants.FONTS['small'].render(self.error_message, True, COLORS['error'])
-            error_rect = error_surface.get_rect(center=(SCREEN_WIDTH // 2, input_y + 30))
-            screen.blit(error_surface, error_rect)
-
-        # Render virtual keyboard with key press animation
-        self.virtual_keyboard.render(screen, key_press_anim=self.key_press_animation)
-
-        # Draw instructions at bottom
-        instructions = "Type or click letters | ENTER/SUBMIT to guess | ESC to restart"
-        instructions_surface = constants.FONTS['small'].render(instructions, True, COLORS['text_white'])
-        instructions_rect = instructions_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20))
-        screen.blit(instructions_surface, instructions_rect)
+        # Animated rows are drawn over the composited grid
+        self.grid.render_animations(screen, anim_state)
+        self.grid.track_dirty(self.dirty, anim_state)
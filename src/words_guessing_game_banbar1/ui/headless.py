@@ -0,0 +1,178 @@
+"""
+Headless rendering for Word Guessing Game
+Scripted input for running main() without a window, and capture of rendered frames
+"""
+
+import os
+
+import pygame
+
+from . import constants
+from .constants import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+from .timeline import VirtualTime
+from .transitions import capture_screen
+
+
+def use_dummy_driver():
+    """Make the next pygame.display.init() use SDL's dummy video driver (no window, no display server)"""
+    if pygame.display.get_init() and pygame.display.get_driver() != 'dummy':
+        pygame.display.quit()
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+
+def init_headless(size=(SCREEN_WIDTH, SCREEN_HEIGHT), bitmap_fonts=False):
+    """
+    Set pygame up for rendering screens without a window
+
+    Args:
+        size: Size of the (invisible) display surface
+        bitmap_fonts: Draw text from the baked glyph atlas instead of FreeType
+
+    Returns:
+        pygame.Surface: The display surface, whose format offscreen surfaces are converted to
+    """
+    use_dummy_driver()
+    pygame.display.init()
+    constants.init_fonts(bitmap=bitmap_fonts)
+    return pygame.display.set_mode(size)
+
+
+class InputScript:
+    """Input of a headless main(): events given per frame, on a virtual clock
+
+    main(input_script=...) takes each frame's events from events() instead of the
+    pygame event queue and does not cap the frame rate. Every frame advances the
+    virtual time by one frame interval, so animations look the same frame by frame
+    however fast the frames are drawn. A step is an event, or a callable taking the
+    GameManager and returning events (e.g. to type the secret word). The frame after
+    the last step delivers QUIT.
+    """
+
+    def __init__(self, frame_time=1 / FPS, on_frame=None):
+        """
+        Args:
+            frame_time: Virtual seconds between frames
+            on_frame: Optional callable(frame, surface, game_manager) called after each frame is drawn
+        """
+        self.time = VirtualTime()
+        self.frame_time = frame_time
+        self.on_frame = on_frame
+        self.frame = 0
+        self.end_frame = 0
+        self.game_manager = None  # GameManager of the run, once it has started
+        self._steps = {}  # frame -> [event or callable]
+
+    def at(self, frame, *steps):
+        """
+        Queue steps for a frame (the first frame is 1)
+
+        Returns:
+            InputScript: self, so calls can be chained
+        """
+        self._steps.setdefault(frame, []).extend(steps)
+        self.end_frame = max(self.end_frame, frame + 1)
+        return self
+
+    def events(self, game_manager, idle=False):
+        """
+        Return the events of the next frame and advance the clock (called by the main loop)
+
+        Args:
+            game_manager: GameManager of the run
+            idle: Nothing is animating; a live loop would wait for input here
+        """
+        self.game_manager = game_manager
+        self.frame += 1
+        self.time.advance(self.frame_time)
+        if self.frame >= self.end_frame:
+            return [pygame.event.Event(pygame.QUIT)]
+        events = []
+        for step in self._steps.pop(self.frame, ()):
+            if callable(step):
+                events.extend(step(game_manager) or ())
+            else:
+                events.append(step)
+        return events
+
+    def frame_drawn(self, surface, game_manager):
+        """Called by the main loop once the frame is drawn"""
+        if self.on_frame is not None:
+            self.on_frame(self.frame, surface, game_manager)
+
+
+def click(pos, button=1):
+    """Mouse press at a window position"""
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)
+
+
+def key(key, unicode=''):
+    """Key press"""
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode)
+
+
+def type_word(word, submit=True):
+    """
+    Key presses typing a word
+
+    Args:
+        word: Letters to type
+        submit: Finish with Enter
+
+    Returns:
+        list: KEYDOWN events
+    """
+    events = [key(ord(letter.lower()), letter) for letter in word]
+    if submit:
+        events.append(key(pygame.K_RETURN, '\r'))
+    return events
+
+
+def render_state(game_manager, screens=None, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    """
+    Render the screen of the game manager's state into a new offscreen surface
+
+    The game and end screens are first set up for the manager's settings, as main()
+    does when the state is entered. Screens in the middle of an animation can be
+    captured with transitions.capture_screen() instead.
+
+    Args:
+        game_manager: GameManager in any state (setup, playing with guesses, won or lost)
+        screens: ScreenSet to draw with (a new one of the given size if omitted)
+        size: Window size when no ScreenSet is given
+
+    Returns:
+        pygame.Surface: The rendered frame
+    """
+    from words_guessing_game_banbar1.main_game_func import GameState, ScreenSet
+
+    if screens is None:
+        screens = ScreenSet(size=size)
+    screen = screens[game_manager.state]
+    if game_manager.state != GameState.SETUP:
+        screen.initialize_grid(game_manager.attempts_total, game_manager.word_length)
+    return capture_screen(screen, screens.size, game_manager)
+
+
+def frame_bytes(surface):
+    """
+    Pixels of a surface as a buffer, without copying
+
+    Rows are get_pitch() bytes apart, each pixel in the surface's own format. The
+    surface stays locked, so it cannot be drawn to, until the view is released.
+
+    Returns:
+        memoryview: Read-write view of the pixel memory
+    """
+    return memoryview(surface.get_view('0'))
+
+
+def frame_array(surface):
+    """
+    Pixels of a surface as a NumPy array, without copying (requires NumPy)
+
+    Returns:
+        numpy.ndarray: (width, height, 3) RGB view that writes through to the surface,
+        which stays locked until the array is released
+    """
+    import pygame.surfarray
+    return pygame.surfarray.pixels3d(surface)
@@ -0,0 +1,80 @@
+"""
+Spatial hit testing for Word Guessing Game
+A uniform grid over the window maps a point to the widget under it in constant time
+"""
+
+import pygame
+
+# Side of a grid cell in pixels; a key or button overlaps only a handful of cells
+HIT_CELL_SIZE = 40
+
+
+class HitIndex:
+    """Uniform grid over a window, each cell listing the targets that overlap it
+
+    Targets are widgets with a rect; the ones that can be hovered implement
+    set_hovered(hovered). Targets are not expected to overlap each other.
+    """
+
+    def __init__(self, size, cell_size=HIT_CELL_SIZE):
+        """
+        Args:
+            size: (width, height) of the window
+            cell_size: Side of a grid cell in pixels
+        """
+        self.size = size
+        self.cell_size = cell_size
+        self._cells = {}     # (col, row) -> list of (rect, target)
+        self.hovered = None  # Target under the mouse at the last hover()
+
+    def add(self, target, rect=None):
+        """
+        Register a target in every cell its rectangle overlaps
+
+        Args:
+            target: Widget returned by hit() for points inside the rectangle
+            rect: Area of the target (defaults to target.rect)
+        """
+        rect = pygame.Rect(target.rect if rect is None else rect)
+        size = self.cell_size
+        first_col, last_col = max(rect.left // size, 0), (rect.right - 1) // size
+        first_row, last_row = max(rect.top // size, 0), (rect.bottom - 1) // size
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                self._cells.setdefault((col, row), []).append((rect, target))
+
+    def hit(self, pos):
+        """
+        Return the target under a point, or None
+
+        Args:
+            pos: (x, y) in window coordinates
+        """
+        cell = self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if cell is not None:
+            for rect, target in cell:
+                if rect.collidepoint(pos):
+                    return target
+        return None
+
+    def hover(self, pos):
+        """
+        Move the hover to the target under a point
+
+        Only the target losing the hover and the one gaining it are told, so
+        hovering costs the same however many widgets are registered.
+
+        Args:
+            pos: (x, y) of the mouse
+
+        Returns:
+            The hovered target, or None
+        """
+        target = self.hit(pos)
+        if target is not self.hovered:
+            if self.hovered is not None:
+                self.hovered.set_hovered(False)
+            if target is not None:
+                target.set_hovered(True)
+            self.hovered = target
+        return target
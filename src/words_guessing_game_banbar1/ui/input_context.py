@@ -0,0 +1,37 @@
+"""
+Per-frame input state for Word Guessing Game
+The main loop samples the mouse once per frame; every screen reads the same values
+"""
+
+import pygame
+
+# Events that carry the mouse position
+_POSITIONED_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+class InputContext:
+    """Mouse state of the current frame, shared by the screens"""
+
+    def __init__(self, mouse_pos=(0, 0), follow_events=False):
+        """
+        Args:
+            mouse_pos: Initial mouse position (until the first sample)
+            follow_events: Take the position from the frame's mouse events instead of the
+                device (scripted input, where there is no real mouse)
+        """
+        self.mouse_pos = mouse_pos
+        self.follow_events = follow_events
+
+    def sample(self, events=()):
+        """
+        Read the mouse once for the frame being handled (called by the main loop)
+
+        Args:
+            events: Events of the frame, used when following events
+        """
+        if not self.follow_events:
+            self.mouse_pos = pygame.mouse.get_pos()
+            return
+        for event in events:
+            if event.type in _POSITIONED_EVENTS:
+                self.mouse_pos = event.pos
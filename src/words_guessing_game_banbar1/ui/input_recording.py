@@ -0,0 +1,284 @@
+"""
+Input recording for Word Guessing Game
+Records the input of real play and replays it into a headless main() at full speed
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import zlib
+from collections import deque
+
+import pygame
+
+from .constants import FPS
+from .headless import InputScript, frame_bytes
+from words_guessing_game_banbar1.functions.event_log import ReplayError
+
+RECORDING_VERSION = 1
+
+
+def _event_types():
+    """Event type of each name the main loop can receive"""
+    from words_guessing_game_banbar1.main_game_func import ALLOWED_EVENTS
+    return {pygame.event.event_name(event_type): event_type for event_type in ALLOWED_EVENTS}
+
+
+def encode_event(event):
+    """
+    Convert a pygame event to a JSON-serializable dict
+
+    Attributes that are not plain values (e.g. the window of an event) are dropped.
+    """
+    data = {'type': pygame.event.event_name(event.type)}
+    for name, value in event.dict.items():
+        if isinstance(value, tuple):
+            data[name] = list(value)
+        elif isinstance(value, (bool, int, float, str)):
+            data[name] = value
+    return data
+
+
+def decode_event(data, event_types):
+    """
+    Rebuild a pygame event from encode_event() output
+
+    Args:
+        data: Encoded event
+        event_types: Event type by name (see _event_types())
+    """
+    attributes = {name: tuple(value) if isinstance(value, list) else value
+                  for name, value in data.items() if name != 'type'}
+    return pygame.event.Event(event_types[data['type']], attributes)
+
+
+def game_summary(game_manager):
+    """
+    The parts of a GameManager a replay must reproduce
+
+    Solve times are left out: they are measured in real time.
+    """
+    return {
+        'state': game_manager.state.name,
+        'word': game_manager.guess_word,
+        'attempts': game_manager.attempts_total,
+        'attempts_remaining': game_manager.attempts_remaining,
+        'length': game_manager.word_length,
+        'guesses': [guess['word'] for guess in game_manager.guesses],
+        'input': game_manager.current_input,
+    }
+
+
+class InputRecorder:
+    """Writes every frame's input during real play, with the frame time
+
+    The file is JSON lines: a header with the random seed and the settings that change
+    what is drawn, one line per frame that had input, and the final game state. The
+    global random generator is seeded here, so the words picked during play follow
+    from the recorded seed.
+    """
+
+    def __init__(self, path, seed=None, **settings):
+        """
+        Args:
+            path: Recording file (overwritten)
+            seed: Seed of the words picked (random if omitted)
+            **settings: main() settings a replay must use (transition, bitmap_fonts)
+        """
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        random.seed(self.seed)
+        self.start = None  # Time of the first frame
+        self.game_manager = None
+        self._file = open(path, 'w', encoding='utf-8')
+        self._write({'type': 'header', 'version': RECORDING_VERSION, 'seed': self.seed, 'fps': FPS, **settings})
+
+    def _write(self, data):
+        self._file.write(json.dumps(data, separators=(',', ':')) + '\n')
+
+    def record(self, now, events, game_manager):
+        """
+        Record the input of a frame (called by the main loop)
+
+        Args:
+            now: Frame time of the timeline
+            events: Events the frame handles
+            game_manager: GameManager of the session
+        """
+        if self.start is None:
+            self.start = now
+        self.game_manager = game_manager
+        if events:
+            self._write({'t': round(now - self.start, 6), 'events': [encode_event(event) for event in events]})
+
+    def close(self):
+        """Write the final game state and close the file"""
+        if self._file.closed:
+            return
+        if self.game_manager is not None:
+            self._write({'type': 'end', 'state': game_summary(self.game_manager)})
+        self._file.close()
+
+
+def load_recording(path):
+    """
+    Read a recording
+
+    Returns:
+        tuple: (header dict, list of (time, events), final state dict or None if the
+        session did not end cleanly)
+    """
+    event_types = _event_types()
+    header, frames, final_state = None, [], None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            data = json.loads(line)
+            kind = data.get('type')
+            if header is None and kind != 'header':
+                raise ReplayError(f"{path} is not an input recording")
+            if kind == 'header':
+                if data['version'] != RECORDING_VERSION:
+                    raise ReplayError(f"Unsupported recording version {data['version']}")
+                header = data
+            elif kind == 'end':
+                final_state = data['state']
+            else:
+                frames.append((data['t'], [decode_event(event, event_types) for event in data['events']]))
+    if header is None:
+        raise ReplayError(f"{path} is empty")
+    return header, frames, final_state
+
+
+class InputReplay(InputScript):
+    """Input script that plays a recording back on the virtual clock
+
+    Each recorded frame's events are handed over, together, on the first frame whose
+    virtual time has reached theirs. While the game is idle the clock skips straight
+    to the next recorded input, as the live loop would sleep until it, so long pauses
+    cost nothing. QUIT follows the last input if the recording has none.
+    """
+
+    def __init__(self, path, on_frame=None):
+        """
+        Args:
+            path: Recording made by InputRecorder
+            on_frame: Optional callable(frame, surface, game_manager) called after each frame is drawn
+        """
+        self.header, frames, self.final_state = load_recording(path)
+        super().__init__(frame_time=1 / self.header['fps'], on_frame=on_frame)
+        self._frames = deque(frames)
+
+    @property
+    def elapsed(self):
+        """Virtual time since the first frame, comparable to the recorded times"""
+        return self.time() - self.frame_time
+
+    def events(self, game_manager, idle=False):
+        """Return the recorded events that are due and advance the clock (called by the main loop)"""
+        self.game_manager = game_manager
+        self.frame += 1
+        self.time.advance(self.frame_time)
+        if not self._frames:
+            return [pygame.event.Event(pygame.QUIT)]
+        due, events = self._frames[0]
+        if idle and due > self.elapsed:
+            self.time.advance(due - self.elapsed)
+        if due > self.elapsed:
+            return []
+        self._frames.popleft()
+        return events
+
+
+def frame_checksum(surface):
+    """CRC-32 of a frame's pixels"""
+    with frame_bytes(surface) as view:
+        return zlib.crc32(view)
+
+
+def replay(path, checksums=None, headless=True):
+    """
+    Replay a recording into main() as fast as frames can be drawn and check the result
+
+    Statistics and leaderboard go to a temporary directory, so the player's own are
+    untouched. Checksums are only comparable on the same platform and pygame build,
+    and timed games show real solve times, which differ between runs.
+
+    Args:
+        path: Recording made by InputRecorder
+        checksums: Optional list of frame checksums of an earlier replay to compare with
+        headless: Draw into SDL's dummy video driver instead of a window
+
+    Returns:
+        dict: 'frames', 'seconds' (wall time), 'state' (game_summary of the end) and
+        'checksums' of every frame
+
+    Raises:
+        ReplayError: If the final game state or a frame checksum differs
+    """
+    from words_guessing_game_banbar1.main_game_func import main
+
+    frame_sums = []
+    script = InputReplay(path, on_frame=lambda frame, surface, game_manager: frame_sums.append(frame_checksum(surface)))
+    random.seed(script.header['seed'])
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as data_dir:
+        try:
+            main(stats_path=os.path.join(data_dir, 'stats.json'),
+                 leaderboard_path=os.path.join(data_dir, 'leaderboard.db'),
+                 transition=script.header.get('transition', 'fade'),
+                 bitmap_fonts=script.header.get('bitmap_fonts', False),
+                 headless=headless, input_script=script)
+        except SystemExit:
+            pass  # The end screen's EXIT button exits the game
+    seconds = time.perf_counter() - start
+
+    state = game_summary(script.game_manager)
+    if script.final_state is not None and state != script.final_state:
+        differences = ", ".join(f"{key}: {script.final_state[key]!r} -> {state[key]!r}"
+                                for key in state if state[key] != script.final_state.get(key))
+        raise ReplayError(f"Replay ended in a different game state ({differences})")
+    if checksums is not None:
+        for frame, (expected, actual) in enumerate(zip(checksums, frame_sums), start=1):
+            if expected != actual:
+                raise ReplayError(f"Frame {frame} differs from the stored checksums")
+        if len(checksums) != len(frame_sums):
+            raise ReplayError(f"Replay drew {len(frame_sums)} frames, the stored checksums have {len(checksums)}")
+    return {'frames': len(frame_sums), 'seconds': seconds, 'state': state, 'checksums': frame_sums}
+
+
+def main(argv=None):
+    """Command line entry point: python -m words_guessing_game_banbar1.ui.input_recording RECORDING"""
+    parser = argparse.ArgumentParser(description="Replay a recorded session headlessly and check its outcome")
+    parser.add_argument("recording", help="file written by run_game.py --record-input")
+    parser.add_argument("--checksums", metavar="PATH",
+                        help="compare every frame with this checksum file (written if it does not exist)")
+    parser.add_argument("--window", action="store_true", help="show the replay in a window")
+    args = parser.parse_args(argv)
+
+    stored = None
+    if args.checksums and os.path.exists(args.checksums):
+        with open(args.checksums, encoding='utf-8') as f:
+            stored = json.load(f)
+    try:
+        result = replay(args.recording, stored, headless=not args.window)
+    except ReplayError as e:
+        print(f"FAIL: {e}")
+        return 1
+    if args.checksums and stored is None:
+        with open(args.checksums, 'w', encoding='utf-8') as f:
+            json.dump(result['checksums'], f)
+
+    state = result['state']
+    print(f"Replayed {result['frames']} frames in {result['seconds']:.2f}s: "
+          f"{state['state']} with {len(state['guesses'])} guess(es), word {state['word'] or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Pre-rendered virtual keyboard keys for Word Guessing Game
+Every key is drawn once in each of its looks, so showing a key is one blit
+"""
+
+import pygame
+
+from .constants import COLORS
+from .text_cache import render_text
+from .tile_atlas import LETTERS
+
+KEY_STATES = ('unused', 'absent', 'present', 'correct')
+KEY_LOOKS = ('normal', 'hover', 'pressed', 'pressed_hover')
+
+STATE_COLORS = {
+    'unused': 'key_unused',
+    'absent': 'tile_absent',
+    'present': 'tile_present',
+    'correct': 'tile_correct',
+}
+
+PRESS_DARKEN = 50    # Darkening of a pressed key
+HOVER_BRIGHTEN = 30  # Brightening of a hovered key
+
+
+def key_color(state, look):
+    """
+    Return the fill color of a letter key
+
+    Args:
+        state: Letter state from KEY_STATES
+        look: Interaction look from KEY_LOOKS
+    """
+    color = COLORS[STATE_COLORS[state]]
+    if look in ('pressed', 'pressed_hover'):
+        color = tuple(max(c - PRESS_DARKEN, 0) for c in color)
+    if look in ('hover', 'pressed_hover'):
+        color = tuple(min(c + HOVER_BRIGHTEN, 255) for c in color)
+    return color
+
+
+def draw_key(screen, rect, letter, color):
+    """Draw one letter key"""
+    pygame.draw.rect(screen, color, rect, border_radius=4)
+    pygame.draw.rect(screen, COLORS['border'], rect, 2, border_radius=4)
+    text_surface = render_text('key', letter, COLORS['text_white'])
+    text_rect = text_surface.get_rect(center=rect.center)
+    screen.blit(text_surface, text_rect)
+
+
+def draw_backspace(screen, rect, backspace_color):
+    """Draw the backspace button with its arrow icon"""
+    pygame.draw.rect(screen, backspace_color, rect, border_radius=4)
+    pygame.draw.rect(screen, COLORS['border'], rect, 2, border_radius=4)
+
+    # Draw backspace arrow icon (← with X)
+    cx, cy = rect.center
+    arrow_size = 12
+    # Draw arrow pointing left with tail
+    arrow_points = [
+        (cx - arrow_size, cy),           # Arrow tip (left)
+        (cx - arrow_size + 8, cy - 8),   # Top of arrow head
+        (cx - arrow_size + 8, cy - 4),   # Top inner
+        (cx + arrow_size - 4, cy - 4),   # Top right
+        (cx + arrow_size - 4, cy + 4),   # Bottom right
+        (cx - arrow_size + 8, cy + 4),   # Bottom inner
+        (cx - arrow_size + 8, cy + 8),   # Bottom of arrow head
+    ]
+    pygame.draw.polygon(screen, COLORS['text_white'], arrow_points)
+    # Draw small X on the arrow body
+    x_offset = 6
+    x_size = 4
+    pygame.draw.line(screen, backspace_color, ((cx + x_offset - x_size)-5, cy - x_size), ((cx + x_offset + x_size)-5, cy + x_size), 2)
+    pygame.draw.line(screen, backspace_color, ((cx + x_offset + x_size)-5, cy - x_size), ((cx + x_offset - x_size)-5, cy + x_size), 2)
+
+
+class KeyAtlas:
+    """All key images for one key size"""
+
+    def __init__(self, key_size, backspace_size):
+        """
+        Args:
+            key_size: (width, height) of a letter key
+            backspace_size: (width, height) of the backspace key
+        """
+        self.key_size = key_size
+        self.backspace_size = backspace_size
+        self._keys = {}
+        for letter in LETTERS:
+            for state in KEY_STATES:
+                for look in KEY_LOOKS:
+                    self._keys[(letter, state, look)] = self._build(
+                        key_size, draw_key, letter, key_color(state, look))
+        self._backspace = (
+            self._build(backspace_size, draw_backspace, COLORS['button_primary']),
+            self._build(backspace_size, draw_backspace, COLORS['button_hover']),
+        )
+
+    @staticmethod
+    def _build(size, draw, *args):
+        """Draw one key into its own display-format surface"""
+        surface = pygame.Surface(size)
+        surface.fill(COLORS['background'])
+        draw(surface, surface.get_rect(), *args)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def key(self, letter, state, look='normal'):
+        """
+        Return the image of a letter key
+
+        Args:
+            letter: Letter A-Z
+            state: Letter state from KEY_STATES
+            look: Interaction look from KEY_LOOKS
+        """
+        return self._keys[(letter, state, look)]
+
+    def backspace(self, hovered=False):
+        """Return the image of the backspace key"""
+        return self._backspace[hovered]
+
+
+_atlases = {}  # (key_size, backspace_size) -> KeyAtlas
+
+
+def get_key_atlas(key_size, backspace_size):
+    """
+    Return the key atlas for the given key sizes, building it the first time
+
+    Args:
+        key_size: (width, height) of a letter key
+        backspace_size: (width, height) of the backspace key
+    """
+    atlas = _atlases.get((key_size, backspace_size))
+    if atlas is None:
+        atlas = KeyAtlas(key_size, backspace_size)
+        _atlases[(key_size, backspace_size)] = atlas
+    return atlas
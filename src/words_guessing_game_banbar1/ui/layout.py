@@ -0,0 +1,179 @@
+"""
+Layout engine for Word Guessing Game
+Computes the position of every component for a window size and game setting, memoized
+"""
+
+from functools import lru_cache
+
+import pygame
+
+from .constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SPACING, GRID_TOP_MARGIN,
+    KEYBOARD_ROWS, KEY_WIDTH, KEY_HEIGHT, KEY_SPACING, KEYBOARD_TOP_MARGIN,
+    BUTTON_WIDTH, calculate_tile_size, calculate_visible_rows
+)
+
+# The screens are designed for SCREEN_WIDTH x SCREEN_HEIGHT; the window can grow but not shrink below it
+MIN_WINDOW_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+# Design positions on the end screen
+END_GRID_TOP = 220   # Top of the final grid (below the result text and leaderboard line)
+END_BUTTONS_TOP = 550
+STATS_TOP = 665      # Statistics panel below the footer
+
+# Width of the OK and backspace keys at the ends of the last keyboard row
+WIDE_KEY_WIDTH = 65
+
+# Stats chart on the end screen: widest bar slot and the margin kept at each side of the window
+STATS_SLOT_WIDTH = 50
+STATS_MARGIN = 50
+
+
+def fit_window_size(size):
+    """Clamp a requested window size to MIN_WINDOW_SIZE"""
+    return (max(size[0], MIN_WINDOW_SIZE[0]), max(size[1], MIN_WINDOW_SIZE[1]))
+
+
+class ScreenLayout:
+    """Positions on the setup, game and end screens for one window size
+
+    The design column (SCREEN_WIDTH wide) is centered horizontally. The setup and
+    end screens are also centered vertically; the game screen keeps its header at
+    the top and its keyboard at the bottom, and the grid gets the height in between.
+    """
+
+    def __init__(self, size):
+        """
+        Args:
+            size: (width, height) of the window, at least MIN_WINDOW_SIZE
+        """
+        self.size = size
+        width, height = size
+        self.offset_x = (width - SCREEN_WIDTH) // 2
+        self.offset_y = (height - SCREEN_HEIGHT) // 2
+        self.center_x = self.offset_x + SCREEN_WIDTH // 2
+        cx, dy = self.center_x, self.offset_y
+
+        # Setup screen
+        self.setup_title = (cx, 60 + dy)
+        self.setup_subtitle = (cx, 100 + dy)
+        self.attempts_selector = (cx, 150 + dy)  # Two rows of choices
+        self.length_selector = (cx, 350 + dy)
+        self.timed_button = (cx - BUTTON_WIDTH // 2, 460 + dy)
+        self.start_button = (cx - BUTTON_WIDTH // 2, 530 + dy)
+        self.setup_progress = pygame.Rect(cx - BUTTON_WIDTH // 2, 596 + dy, BUTTON_WIDTH, 8)
+        self.setup_instructions_top = 650 + dy
+
+        # Game screen: header at the top, keyboard and instructions at the bottom
+        self.game_title = (cx, 40)
+        self.game_info = (cx, 80)
+        self.game_instructions = (cx, height - 20)
+        self.keyboard_top = KEYBOARD_TOP_MARGIN + height - SCREEN_HEIGHT
+        self._layout_keyboard()
+
+        # End screen
+        self.end_message = (cx, 80 + dy)
+        self.end_info = (cx, 130 + dy)
+        self.end_answer = (cx, 170 + dy)
+        self.end_leaderboard = (cx, 197 + dy)
+        self.end_grid_top = END_GRID_TOP + dy
+        settings_x = cx - BUTTON_WIDTH // 2
+        self.play_again_button = (settings_x - BUTTON_WIDTH - 20, END_BUTTONS_TOP + dy)
+        self.settings_button = (settings_x, END_BUTTONS_TOP + dy)
+        self.exit_button = (settings_x + BUTTON_WIDTH + 20, END_BUTTONS_TOP + dy)
+        self.end_footer = (cx, 630 + dy)
+        self.stats_top = STATS_TOP + dy
+        self.stats_width = width - 2 * STATS_MARGIN
+
+    def stats_slots(self, count):
+        """
+        Slots of the end screen's stats chart, centered in the window
+
+        Args:
+            count: Number of bars
+
+        Returns:
+            tuple: (x of the first slot, width of each slot)
+        """
+        slot_width = min(STATS_SLOT_WIDTH, self.stats_width // count)
+        return self.center_x - slot_width * count // 2, slot_width
+
+    def _layout_keyboard(self):
+        """Key rectangles: letter rows centered, OK and backspace at the ends of the last row"""
+        self.keys = []
+        for row_idx, row in enumerate(KEYBOARD_ROWS):
+            row_width = len(row) * (KEY_WIDTH + KEY_SPACING) - KEY_SPACING
+            x_offset = self.offset_x + (SCREEN_WIDTH - row_width) // 2
+            y = self.keyboard_top + row_idx * (KEY_HEIGHT + KEY_SPACING)
+            for col_idx, letter in enumerate(row):
+                x = x_offset + col_idx * (KEY_WIDTH + KEY_SPACING)
+                self.keys.append((letter, pygame.Rect(x, y, KEY_WIDTH, KEY_HEIGHT)))
+
+        last_row_y = self.keyboard_top + (len(KEYBOARD_ROWS) - 1) * (KEY_HEIGHT + KEY_SPACING)
+        last_row_width = len(KEYBOARD_ROWS[-1]) * (KEY_WIDTH + KEY_SPACING) - KEY_SPACING
+        last_row_start_x = self.offset_x + (SCREEN_WIDTH - last_row_width) // 2
+        last_row_end_x = last_row_start_x + last_row_width
+        self.submit_key = pygame.Rect(last_row_start_x - WIDE_KEY_WIDTH - KEY_SPACING, last_row_y,
+                                      WIDE_KEY_WIDTH, KEY_HEIGHT)
+        self.backspace_key = pygame.Rect(last_row_end_x + KEY_SPACING, last_row_y, WIDE_KEY_WIDTH, KEY_HEIGHT)
+        self.keyboard_bounds = self.submit_key.unionall([rect for _, rect in self.keys] + [self.backspace_key])
+
+
+class GridLayout:
+    """Tile size and position of a guess grid
+
+    When the rows do not fit at MIN_TILE_SIZE, only visible_rows of them are shown
+    and the grid scrolls; height is then the height of that viewport.
+    """
+
+    def __init__(self, window_width, word_length, max_attempts, top, fit_width, keyboard_top):
+        """
+        Args:
+            window_width: Width of the window the grid is centered in
+            word_length: Length of the word (columns)
+            max_attempts: Maximum number of attempts (rows)
+            top: Top of the grid on screen
+            fit_width: Width the grid has to fit in
+            keyboard_top: Top of the keyboard the grid has to stay above
+        """
+        self.visible_rows = calculate_visible_rows(max_attempts, keyboard_top)
+        self.scrolls = self.visible_rows < max_attempts
+        self.tile_size = calculate_tile_size(word_length, self.visible_rows, fit_width, keyboard_top)
+        self.width = word_length * (self.tile_size + TILE_SPACING) - TILE_SPACING
+        self.height = self.visible_rows * (self.tile_size + TILE_SPACING) - TILE_SPACING
+        self.content_height = max_attempts * (self.tile_size + TILE_SPACING) - TILE_SPACING
+        self.start_x = (window_width - self.width) // 2
+        self.start_y = top
+        # Current input line and error message below a game grid
+        self.input_y = top + self.visible_rows * (self.tile_size + TILE_SPACING) + 10
+        self.error_y = self.input_y + 30
+
+
+@lru_cache(maxsize=8)
+def get_layout(size=MIN_WINDOW_SIZE):
+    """
+    Return the screen layout for a window size, computing it only once per size
+
+    Args:
+        size: (width, height) of the window
+    """
+    return ScreenLayout(tuple(size))
+
+
+@lru_cache(maxsize=64)
+def get_grid_layout(size, word_length, max_attempts, end_screen=False):
+    """
+    Return the grid layout for a window size and game setting, computing it only once
+
+    Args:
+        size: (width, height) of the window
+        word_length: Length of the word
+        max_attempts: Maximum number of attempts
+        end_screen: Layout of the final grid on the end screen instead of the game grid
+    """
+    layout = get_layout(size)
+    if end_screen:
+        # The end screen keeps its design proportions and is only centered in the window
+        return GridLayout(size[0], word_length, max_attempts, layout.end_grid_top,
+                          SCREEN_WIDTH, KEYBOARD_TOP_MARGIN)
+    return GridLayout(size[0], word_length, max_attempts, GRID_TOP_MARGIN, size[0], layout.keyboard_top)
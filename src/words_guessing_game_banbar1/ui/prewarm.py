@@ -0,0 +1,79 @@
+"""
+Speculative preparation of the next game for Word Guessing Game
+Built while the end screen is showing so PLAY AGAIN starts with zero setup cost
+"""
+
+import random
+
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from .layout import get_layout, get_grid_layout
+from .ui_components import VirtualKeyboard, create_grid
+from words_guessing_game_banbar1.functions.find import find_random_word
+
+
+class NextGamePrewarm:
+    """Next word, grid and pre-rendered surfaces for a game with the same settings"""
+
+    def __init__(self, attempts, length, timed=False, executor=None, owner=None, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        """
+        Args:
+            attempts: Attempts setting of the next game
+            length: Word length of the next game
+            timed: Timed mode of the next game
+            executor: Optional JobExecutor picking the word in the background
+            owner: Owner of the background job (cancelled with its screen)
+            size: Window size the grid and keyboard are laid out for
+        """
+        self.attempts = attempts
+        self.length = length
+        self.timed = timed
+        self.size = size
+        self.seed = random.getrandbits(32)
+        self.word = None
+        self.grid = None
+        self.keyboard = None
+
+        # Word choice is plain Python and runs on the executor; surfaces are built on
+        # the main thread, one step per frame, so no single frame pays for all of it
+        self._word_job = None
+        if executor is not None:
+            self._word_job = executor.submit(self._pick_word, owner=owner)
+        else:
+            self._pick_word()
+        self._steps = self._build_steps()
+        self._steps_done = False
+
+    def _pick_word(self):
+        self.word = find_random_word(self.length, random.Random(self.seed))
+
+    def _build_steps(self):
+        self.grid = create_grid(self.attempts, self.length, get_grid_layout(self.size, self.length, self.attempts))
+        yield
+        self.grid.prerender_empty()
+        yield
+        self.keyboard = VirtualKeyboard(get_layout(self.size))
+        yield
+        self.keyboard.prerender()
+
+    def step(self):
+        """Advance the preparation by one unit of work (called once per frame)"""
+        if not self._steps_done and next(self._steps, False) is False:
+            self._steps_done = True
+
+    @property
+    def ready(self):
+        return self._steps_done and self.word is not None
+
+    def finish(self):
+        """Complete any remaining work immediately"""
+        while not self._steps_done:
+            self.step()
+        if self.word is None:
+            if self._word_job is not None and not self._word_job.cancelled:
+                self._word_job.result()
+            else:
+                self._pick_word()
+
+    def matches(self, attempts, length):
+        """Whether this prewarm was built for the given settings"""
+        return self.attempts == attempts and self.length == length
@@ -0,0 +1,237 @@
+"""
+Retained scene graph for Word Guessing Game
+Nodes cache their rendered surface and are only redrawn when their state changes
+"""
+
+import pygame
+
+from . import constants
+from .constants import COLORS
+from .text_cache import render_text
+
+# Returned when nothing changed, so an idle frame allocates no list
+NO_DAMAGE = ()
+
+
+class Node:
+    """Element that draws itself once into a cached surface and redraws only when invalidated"""
+
+    def __init__(self, rect):
+        """
+        Args:
+            rect: Screen area the node covers
+        """
+        self.rect = pygame.Rect(rect)
+        self.parent = None
+        self.visible = True
+        self.dirty = True
+        self._surface = None
+        self._drawn_rect = None  # Where the parent last composited this node
+
+    def invalidate(self):
+        """Mark the node (and every group containing it) as needing a redraw"""
+        node = self
+        while node is not None:
+            node.dirty = True
+            node = node.parent
+
+    def set_state(self, **state):
+        """
+        Update attributes, invalidating the node only if one of them actually changed
+
+        Returns:
+            bool: True if anything changed
+        """
+        changed = False
+        for name, value in state.items():
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed = True
+        if changed:
+            self.invalidate()
+        return changed
+
+    def draw(self, surface):
+        """
+        Paint the node into its own surface (local coordinates, background already filled)
+
+        Args:
+            surface: Surface of the node's size
+        """
+        raise NotImplementedError
+
+    def get_surface(self):
+        """Return the node's image, redrawing it first if its state changed"""
+        if self.dirty or self._surface is None:
+            if self._surface is None or self._surface.get_size() != self.rect.size:
+                self._surface = pygame.Surface(self.rect.size)
+            self._surface.fill(COLORS['background'])
+            self.draw(self._surface)
+            self.dirty = False
+        return self._surface
+
+    def render(self, screen):
+        """Draw the node directly onto a surface"""
+        screen.blit(self.get_surface(), self.rect)
+
+
+class TextNode(Node):
+    """Single line of text anchored at a point"""
+
+    def __init__(self, font_name, text, color, anchor='center', position=(0, 0), cached=True):
+        """
+        Args:
+            font_name: Key into FONTS
+            text: Initial text
+            color: Text color
+            anchor: Rect attribute the position refers to ('center', 'midtop', ...)
+            position: Anchor point on screen
+            cached: Render through the shared text cache; pass False for text that changes
+                every frame (e.g. a running clock), which would only evict the static strings
+        """
+        super().__init__((0, 0, 0, 0))
+        self.font_name = font_name
+        self.color = color
+        self.anchor = anchor
+        self.position = position
+        self.cached = cached
+        self.text = None
+        self.set_text(text)
+
+    def _render(self):
+        if self.cached:
+            return render_text(self.font_name, self.text, self.color)
+        return constants.FONTS[self.font_name].render(self.text, True, self.color)
+
+    def set_text(self, text, color=None):
+        """Change the text (and optionally its color), re-measuring only when it differs"""
+        color = self.color if color is None else color
+        if text == self.text and color == self.color:
+            return
+        self.text = text
+        self.color = color
+        surface = self._render()
+        if not self.cached:
+            self._surface = surface
+        self.rect = surface.get_rect(**{self.anchor: self.position})
+        self.invalidate()
+
+    def get_surface(self):
+        # Cached text is shared through the text cache; uncached text keeps the surface set_text made
+        self.dirty = False
+        return self._render() if self.cached else self._surface
+
+
+class Group(Node):
+    """Node compositing its children over a base image, redrawing only the areas that changed
+
+    Children use screen coordinates and must not overlap the group's edges. A group
+    itself never moves.
+    """
+
+    def __init__(self, rect, base=None):
+        """
+        Args:
+            rect: Screen area of the group
+            base: Optional surface under the children (defaults to the background color)
+        """
+        super().__init__(rect)
+        self.children = []
+        self.base = base
+        self._full = True
+        self._blit_args = None
+
+    def add(self, child):
+        """Append a child node (drawn above earlier children) and return it"""
+        child.parent = self
+        child._drawn_rect = None
+        self.children.append(child)
+        self._full = True
+        self.invalidate()
+        return child
+
+    def set_base(self, base):
+        """Replace the image under the children; the whole group is redrawn"""
+        self.base = base
+        self._full = True
+        self.invalidate()
+
+    def _restore(self, area):
+        """Paint the base over an area given in local coordinates"""
+        if self.base is None:
+            self._surface.fill(COLORS['background'], area)
+        else:
+            self._surface.blit(self.base, area, area)
+
+    def composite(self):
+        """
+        Bring the cached image up to date
+
+        Returns:
+            Sequence of screen rectangles that changed since the previous call
+        """
+        if not self.dirty and not self._full:
+            return NO_DAMAGE
+
+        if self._surface is None:
+            self._surface = pygame.Surface(self.rect.size)
+            self._full = True
+
+        offset = (-self.rect.x, -self.rect.y)
+        if self._full:
+            self._restore(self._surface.get_rect())
+            for child in self.children:
+                if child.visible:
+                    self._surface.blit(child.get_surface(), child.rect.move(offset))
+                    child._drawn_rect = child.rect.copy()
+                else:
+                    child._drawn_rect = None
+            self._full = False
+            self.dirty = False
+            return [self.rect.copy()]
+
+        # Collect the areas whose content changed: a redrawn, moved, shown or hidden child
+        damaged = []
+        for child in self.children:
+            if isinstance(child, Group):
+                if child.dirty:
+                    damaged.extend(child.composite())
+                continue
+            if not child.dirty and child.visible == (child._drawn_rect is not None) \
+                    and (not child.visible or child.rect == child._drawn_rect):
+                continue
+            if child._drawn_rect is not None:
+                damaged.append(child._drawn_rect)
+            if child.visible and child.rect != child._drawn_rect:
+                damaged.append(child.rect.copy())
+            child._drawn_rect = child.rect.copy() if child.visible else None
+
+        # Repaint each damaged area: base first, then every visible child touching it
+        for area in damaged:
+            local = area.move(offset)
+            self._surface.set_clip(local)
+            self._restore(local)
+            for child in self.children:
+                if child.visible and child.rect.colliderect(area):
+                    self._surface.blit(child.get_surface(), child.rect.move(offset))
+            self._surface.set_clip(None)
+
+        self.dirty = False
+        return damaged
+
+    def get_surface(self):
+        self.composite()
+        return self._surface
+
+    def render(self, screen):
+        """
+        Composite the group and draw it onto a surface
+
+        Returns:
+            Sequence of screen rectangles that changed since the previous frame
+        """
+        damaged = self.composite()
+        if self._blit_args is None or self._blit_args[0][0] is not self._surface:
+            self._blit_args = ((self._surface, self.rect),)
+        screen.blits(self._blit_args, False)  # No result rect to allocate
+        return damaged
@@ -4,40 +4,99 @@ Allows player to select number of attempts and word length
 """
 
 import pygame
-from . import constants
-from .constants import COLORS, SCREEN_WIDTH, BUTTON_WIDTH
-from .ui_components import Button, NumberSelector
+from .constants import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT, ATTEMPT_CHOICES, LENGTH_CHOICES
+from .ui_components import Button, NumberSelector, ProgressBar, create_screen_layer
+from .scene import Group
+from .text_cache import render_text
+from .dirty_rects import DirtyTracker
+from .layout import get_layout
+from .hit_index import HitIndex
+from .input_context import InputContext
+from .assets import required_assets
 
 
 class SetupScreen:
     """Setup screen for configuring game parameters"""
 
-    def __init__(self):
-        """Initialize setup screen with default values"""
+    def __init__(self, executor=None, size=(SCREEN_WIDTH, SCREEN_HEIGHT), input_context=None, assets=None):
+        """
+        Initialize setup screen with default values
+
+        Args:
+            executor: Optional JobExecutor for work that must not block the frame loop
+            size: Window size the screen is laid out for
+            input_context: InputContext sampled by the frame loop
+            assets: Optional AssetLoader whose progress is shown; a game starts once
+                the assets it needs are loaded
+        """
+        self.executor = executor
+        self.input = input_context if input_context is not None else InputContext()
+        self.assets = assets
+        self.start_requested = False  # START GAME clicked while the game's assets were loading
         self.selected_attempts = 6  # Default attempts
         self.selected_length = 5    # Default word length
+        self.timed = False          # Speedrun mode
+
+        # Title, labels and instructions never change; drawn once on first render
+        self.background = None
+        # Scene graph of the widgets over the background, built with it
+        self.scene = None
+        # Regions changed by each frame, for dirty rectangle presentation
+        self.dirty = DirtyTracker()
+
+        self.layout = get_layout(size)
+        self._create_widgets(self.selected_attempts, self.selected_length)
+
+    def _create_widgets(self, attempts, length):
+        """Create the selectors and buttons at the positions of the current layout"""
+        layout = self.layout
 
         # Create number selectors
         self.attempts_selector = NumberSelector(
-            min_val=1,
-            max_val=10,
-            default_val=self.selected_attempts,
-            position=(SCREEN_WIDTH // 2, 200),
-            label="Number of Attempts (1-10)"
+            min_val=ATTEMPT_CHOICES[0],
+            max_val=ATTEMPT_CHOICES[-1],
+            default_val=attempts,
+            position=layout.attempts_selector,
+            label=f"Number of Attempts ({ATTEMPT_CHOICES[0]}-{ATTEMPT_CHOICES[-1]})",
+            values=ATTEMPT_CHOICES
         )
 
         self.length_selector = NumberSelector(
-            min_val=3,
-            max_val=11,
-            default_val=self.selected_length,
-            position=(SCREEN_WIDTH // 2, 350),
-            label="Word Length (3-11)"
+            min_val=LENGTH_CHOICES[0],
+            max_val=LENGTH_CHOICES[-1],
+            default_val=length,
+            position=layout.length_selector,
+            label=f"Word Length ({LENGTH_CHOICES[0]}-{LENGTH_CHOICES[-1]})",
+            values=LENGTH_CHOICES
         )
 
-        # Create start button
-        start_btn_x = SCREEN_WIDTH // 2 - BUTTON_WIDTH // 2
-        start_btn_y = 500
-        self.start_button = Button("START GAME", (start_btn_x, start_btn_y))
+        # Create timed mode toggle and start button
+        self.timed_button = Button(self._timed_label(), layout.timed_button)
+        self.start_button = Button("START GAME", layout.start_button)
+        self.progress_bar = ProgressBar(layout.setup_progress)
+        self.progress_bar.visible = False
+
+        # Clicks and hover are found through a spatial index over the widgets
+        self.hits = HitIndex(layout.size)
+        for widget in (self.attempts_selector, self.length_selector, self.timed_button, self.start_button):
+            widget.register(self.hits)
+
+    def resize(self, size):
+        """
+        Lay the screen out for a new window size, keeping the current selections
+
+        Args:
+            size: (width, height) of the window
+        """
+        self.layout = get_layout(size)
+        self._create_widgets(self.attempts_selector.selected, self.length_selector.selected)
+        self.background = None
+        self.scene = None
+        self.dirty.invalidate()
+
+    def _timed_label(self):
+        """Label of the timed mode toggle"""
+        return "TIMED: ON" if self.timed else "TIMED: OFF"
 
     def handle_event(self, event, game_manager):
         """
@@ -47,69 +106,110 @@ class SetupScreen:
             event: Pygame event
             game_manager: GameManager instance
         """
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_pressed = pygame.mouse.get_pressed()
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            target = self.hits.hit(event.pos)
 
             # Check number selectors
-            self.attempts_selector.handle_click(mouse_pos, mouse_pressed)
-            self.length_selector.handle_click(mouse_pos, mouse_pressed)
+            self.attempts_selector.handle_hit(target)
+            self.length_selector.handle_hit(target)
+
+            # Check timed mode toggle
+            if target is self.timed_button:
+                self.timed = not self.timed
+                self.timed_button.set_state(text=self._timed_label())
 
             # Check start button
-            if self.start_button.is_clicked(mouse_pos, mouse_pressed):
+            if target is self.start_button:
                 # Update game manager with selected values
                 self.selected_attempts = self.attempts_selector.selected
                 self.selected_length = self.length_selector.selected
 
-                # Start the game
-                game_manager.start_game(self.selected_attempts, self.selected_length)
+                # Start the game, or as soon as the words of this length are loaded
+                if self._assets_ready(self.selected_length):
+                    self._start(game_manager)
+                else:
+                    self.start_requested = True
 
-    def update(self, game_manager):
-        """
-        Update setup screen state
+    def _assets_ready(self, length):
+        """Whether a game of the given word length can start without waiting for loading"""
+        return self.assets is None or self.assets.is_loaded(*required_assets(length))
 
-        Args:
-            game_manager: GameManager instance
-        """
-        mouse_pos = pygame.mouse.get_pos()
-        self.start_button.update(mouse_pos)
+    def _start(self, game_manager):
+        self.start_requested = False
+        game_manager.start_game(self.selected_attempts, self.selected_length, timed=self.timed)
 
-    def render(self, screen, game_manager):
+    def update(self, game_manager):
         """
-        Render the setup screen
+        Update setup screen state
 
         Args:
-            screen: Pygame screen surface
             game_manager: GameManager instance
         """
-        # Clear screen
-        screen.fill(COLORS['background'])
+        self.hits.hover(self.input.mouse_pos)
+        if self.assets is not None:
+            self._update_loading(game_manager)
+
+    def _update_loading(self, game_manager):
+        """Show the loading progress and start a requested game once its assets are in"""
+        self.progress_bar.set_progress(self.assets.progress)
+        self.progress_bar.set_state(visible=not self.assets.done)
+        ready = self._assets_ready(self.length_selector.selected)
+        self.start_button.set_state(text="START GAME" if ready else "LOADING...")
+        if self.start_requested and self._assets_ready(self.selected_length):
+            self._start(game_manager)
+
+    def is_animating(self, game_manager):
+        """The setup screen only changes in response to input (the loop stays awake while assets load)"""
+        return False
+
+    def _build_background(self):
+        """Draw the static parts of the screen into an offscreen layer"""
+        layout = self.layout
+        layer = create_screen_layer(layout.size)
 
         # Draw title
-        title_surface = constants.FONTS['title'].render("WELCOME TO WORDLE!", True, COLORS['text_white'])
-        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        screen.blit(title_surface, title_rect)
+        title_surface = render_text('title', "WELCOME TO WORDLE!", COLORS['text_white'])
+        title_rect = title_surface.get_rect(center=layout.setup_title)
+        layer.blit(title_surface, title_rect)
 
         # Draw subtitle
-        subtitle_surface = constants.FONTS['small'].render("Configure your game settings", True, COLORS['text_white'])
-        subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, 120))
-        screen.blit(subtitle_surface, subtitle_rect)
+        subtitle_surface = render_text('small', "Configure your game settings", COLORS['text_white'])
+        subtitle_rect = subtitle_surface.get_rect(center=layout.setup_subtitle)
+        layer.blit(subtitle_surface, subtitle_rect)
 
-        # Render number selectors
-        self.attempts_selector.render(screen)
-        self.length_selector.render(screen)
-
-        # Render start button
-        self.start_button.render(screen)
+        # Selector labels
+        self.attempts_selector.render_label(layer)
+        self.length_selector.render_label(layer)
 
         # Draw instructions at bottom
         instructions = [
             "Select the number of attempts and word length,",
-            "then click START GAME to begin!"
+            "then click START GAME to begin!",
+            "Turn TIMED on to race the clock for the leaderboard."
         ]
-        y_offset = 650
+        y_offset = layout.setup_instructions_top
         for instruction in instructions:
-            text_surface = constants.FONTS['small'].render(instruction, True, COLORS['text_white'])
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            screen.blit(text_surface, text_rect)
+            text_surface = render_text('small', instruction, COLORS['text_white'])
+            text_rect = text_surface.get_rect(center=(layout.center_x, y_offset))
+            layer.blit(text_surface, text_rect)
             y_offset += 25
+
+        self.background = layer
+        self.scene = Group(layer.get_rect(), base=layer)
+        for widget in (self.attempts_selector, self.length_selector, self.timed_button, self.start_button,
+                       self.progress_bar):
+            self.scene.add(widget)
+
+    def render(self, screen, game_manager):
+        """
+        Render the setup screen
+
+        Args:
+            screen: Pygame screen surface
+            game_manager: GameManager instance
+        """
+        # Static layer plus widgets; only widgets whose state changed are redrawn
+        if self.background is None:
+            self._build_background()
+        for rect in self.scene.render(screen):
+            self.dirty.add(rect)
@@ -0,0 +1,81 @@
+"""
+Rendered text cache for Word Guessing Game
+Keeps recently rendered text surfaces so static strings are rasterized only once
+"""
+
+from collections import OrderedDict
+
+from . import constants
+
+
+class TextCache:
+    """Bounded LRU cache of font.render() results"""
+
+    def __init__(self, max_entries=512):
+        """
+        Args:
+            max_entries: Surfaces kept before the least recently used one is evicted
+        """
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()  # (font, text, color, antialias) -> Surface
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Return the rendered surface for a string, rasterizing it only on a miss
+
+        The returned surface is shared: blit it, never draw on it.
+
+        Args:
+            font: pygame Font to render with
+            text: String to render
+            color: RGB tuple
+            antialias: Whether to antialias the glyphs
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop every cached surface (counters are kept)"""
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def summary(self):
+        """One-line report of the hit and miss counters"""
+        lookups = self.hits + self.misses
+        hit_rate = 100 * self.hits / lookups if lookups else 0
+        return (f"text cache: {self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate), "
+                f"{self.evictions} evictions, {len(self)}/{self.max_entries} entries")
+
+
+# Shared by all UI components
+TEXT_CACHE = TextCache()
+
+
+def render_text(font_name, text, color, antialias=True):
+    """
+    Render text with one of the named FONTS through the shared cache
+
+    Args:
+        font_name: Key in constants.FONTS ('title', 'header', 'normal', 'tile', 'small', 'key')
+        text: String to render
+        color: RGB tuple
+        antialias: Whether to antialias the glyphs
+    """
+    return TEXT_CACHE.render(constants.FONTS[font_name], text, color, antialias)
@@ -0,0 +1,77 @@
+"""
+Pre-rendered tile atlas for Word Guessing Game
+Every (color_type, letter) tile is drawn once per tile size, so drawing a tile is one blit
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+COLOR_TYPES = ('empty', 'absent', 'present', 'correct')
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Atlases kept for recently used tile sizes (current game, prewarmed game, end screen)
+MAX_ATLASES = 4
+
+
+class TileAtlas:
+    """All tile images for one tile size"""
+
+    def __init__(self, tile_size):
+        """
+        Args:
+            tile_size: Tile size in pixels as returned by calculate_tile_size
+        """
+        self.tile_size = tile_size
+        self._tiles = {}
+        for color_type in COLOR_TYPES:
+            self._build(color_type, '')
+            for letter in LETTERS:
+                self._build(color_type, letter)
+
+    def _build(self, color_type, letter):
+        """Draw one tile into its own display-format surface"""
+        from .ui_components import LetterTile
+
+        size = int(self.tile_size)
+        surface = pygame.Surface((size, size))
+        LetterTile(letter, color_type, self.tile_size, (0, 0)).render(surface)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self._tiles[(color_type, letter)] = surface
+        return surface
+
+    def get(self, color_type, letter):
+        """
+        Return the surface of a tile, drawing it first if it is outside A-Z
+
+        Args:
+            color_type: 'empty', 'absent', 'present' or 'correct'
+            letter: Letter on the tile ('' for none)
+        """
+        surface = self._tiles.get((color_type, letter))
+        if surface is None:
+            surface = self._build(color_type, letter.upper())
+            self._tiles[(color_type, letter)] = surface
+        return surface
+
+
+_atlases = OrderedDict()  # tile_size -> TileAtlas
+
+
+def get_atlas(tile_size):
+    """
+    Return the atlas for a tile size, building it only when the size is new
+
+    Args:
+        tile_size: Tile size in pixels
+    """
+    atlas = _atlases.get(tile_size)
+    if atlas is None:
+        atlas = TileAtlas(tile_size)
+        _atlases[tile_size] = atlas
+        if len(_atlases) > MAX_ATLASES:
+            _atlases.popitem(last=False)
+    else:
+        _atlases.move_to_end(tile_size)
+    return atlas
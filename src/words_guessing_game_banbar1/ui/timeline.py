@@ -0,0 +1,156 @@
+"""
+Animation clock and timeline for Word Guessing Game
+Time is sampled once per frame; the timeline owns active animations and runs their callbacks
+"""
+
+import math
+import time
+
+
+class FrameClock:
+    """Clock read by every animation; its time only moves when the frame loop ticks it"""
+
+    def __init__(self, time_source=None):
+        """
+        Args:
+            time_source: Callable returning seconds (defaults to time.monotonic);
+                pass a VirtualTime to fast-forward animations in tests and headless runs
+        """
+        self.time_source = time_source if time_source is not None else time.monotonic
+        self.now = self.time_source()
+
+    def tick(self):
+        """Sample the time source for a new frame and return it"""
+        self.now = self.time_source()
+        return self.now
+
+
+class LiveClock:
+    """Clock that reads its time source on every access, for animations used outside a timeline"""
+
+    def __init__(self, time_source=time.monotonic):
+        self.time_source = time_source
+
+    @property
+    def now(self):
+        return self.time_source()
+
+
+# Default clock of animations not started on a timeline
+REAL_TIME = LiveClock()
+
+
+class VirtualTime:
+    """Time source that stands still until advanced"""
+
+    def __init__(self, start=0.0):
+        self.time = start
+
+    def __call__(self):
+        return self.time
+
+    def advance(self, seconds):
+        """Move time forward"""
+        self.time += seconds
+
+
+class Timeline:
+    """Owns the running animations and calls their completion callbacks
+
+    The frame loop calls tick() once per frame. Animations started on the timeline
+    measure their progress against its clock, so every tile of a frame sees the
+    same time.
+    """
+
+    def __init__(self, clock=None):
+        """
+        Args:
+            clock: FrameClock to run on (defaults to one over time.monotonic)
+        """
+        self.clock = clock if clock is not None else FrameClock()
+        self._entries = []  # [animation, on_done, owner]
+
+    @property
+    def now(self):
+        return self.clock.now
+
+    @property
+    def active(self):
+        """Whether any animation is running"""
+        return bool(self._entries)
+
+    def __contains__(self, animation):
+        return any(entry[0] is animation for entry in self._entries)
+
+    def start(self, animation, on_done=None, owner=None):
+        """
+        Run an animation from the current frame time
+
+        Args:
+            animation: Animation to run (its start time is reset to now)
+            on_done: Optional callback called with the animation once it is complete
+            owner: Optional owner, so cancel_owner() can drop the animation
+
+        Returns:
+            The animation
+        """
+        animation.clock = self.clock
+        animation.start_time = self.clock.now
+        self._entries.append([animation, on_done, owner])
+        return animation
+
+    def cancel(self, animation):
+        """Stop an animation without calling its callback"""
+        self._entries = [entry for entry in self._entries if entry[0] is not animation]
+
+    def cancel_owner(self, owner):
+        """
+        Stop every animation of an owner without calling their callbacks
+
+        Returns:
+            int: Number of animations stopped
+        """
+        kept = [entry for entry in self._entries if entry[2] is not owner]
+        cancelled = len(self._entries) - len(kept)
+        self._entries = kept
+        return cancelled
+
+    def restart_owner(self, owner):
+        """Restart every animation of an owner from the current time (e.g. once its screen is visible)"""
+        for entry in self._entries:
+            if entry[2] is owner:
+                entry[0].start_time = self.clock.now
+
+    def tick(self):
+        """Advance to the current time and finish completed animations"""
+        self.clock.tick()
+        self.update()
+
+    def update(self):
+        """Remove completed animations and call their callbacks (in start order)"""
+        if not self._entries:
+            return
+        running, finished = [], []
+        for entry in self._entries:
+            (finished if entry[0].is_complete else running).append(entry)
+        if not finished:
+            return
+        self._entries = running
+        for animation, on_done, _ in finished:
+            if on_done is not None:
+                on_done(animation)
+
+    def fast_forward(self, seconds, step=1 / 60):
+        """
+        Advance a VirtualTime source, ticking once per step as the frame loop would
+
+        Args:
+            seconds: Time to skip
+            step: Simulated frame interval
+        """
+        source = self.clock.time_source
+        start = source.time
+        frames = max(1, math.ceil(seconds / step))
+        for frame in range(1, frames + 1):
+            source.time = start + seconds * frame / frames  # Ends exactly at start + seconds
+            self.tick()
@@ -0,0 +1,82 @@
+"""
+Screen transition compositor for Word Guessing Game
+Transitions blend two captured frames, so their cost does not depend on the screens
+"""
+
+import pygame
+
+from .animations import ScreenFadeTransition
+
+# Available transitions: through black, direct crossfade, or the new screen pushing the old one left
+TRANSITIONS = ('fade', 'crossfade', 'slide')
+
+
+def capture_screen(screen_obj, surface_size, game_manager):
+    """
+    Render a screen once into an offscreen surface
+
+    Args:
+        screen_obj: SetupScreen, GameScreen or EndScreen
+        surface_size: (width, height) of the window
+        game_manager: GameManager instance
+
+    Returns:
+        pygame.Surface: The captured frame
+    """
+    surface = pygame.Surface(surface_size)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    screen_obj.render(surface, game_manager)
+    # The window does not show what was just drawn, so the screen's next real frame is presented whole
+    screen_obj.dirty.invalidate()
+    return surface
+
+
+class TransitionCompositor:
+    """Blends from a snapshot of the outgoing screen to a snapshot of the incoming one"""
+
+    def __init__(self, kind, outgoing, incoming, timeline):
+        """
+        Args:
+            kind: One of TRANSITIONS
+            outgoing: Last frame of the screen being left
+            incoming: First frame of the screen being shown
+            timeline: Timeline that runs the transition
+        """
+        if kind not in TRANSITIONS:
+            raise ValueError(f"Unknown transition: {kind}")
+        self.kind = kind
+        self.outgoing = outgoing
+        self.incoming = incoming
+        self.animation = timeline.start(ScreenFadeTransition())
+        self._overlay = None
+        if kind == 'fade':
+            self._overlay = pygame.Surface(outgoing.get_size())
+            self._overlay.fill((0, 0, 0))
+
+    @property
+    def active(self):
+        return self.animation.active
+
+    @property
+    def progress(self):
+        """Fraction of the transition done, from 0.0 to 1.0"""
+        return min(self.animation.elapsed / self.animation.duration, 1.0)
+
+    def draw(self, screen):
+        """Draw the current transition frame (two or three full-window blits)"""
+        if self.kind == 'fade':
+            snapshot = self.outgoing if self.animation.phase == 'out' else self.incoming
+            screen.blit(snapshot, (0, 0))
+            self._overlay.set_alpha(self.animation.get_alpha())
+            screen.blit(self._overlay, (0, 0))
+        elif self.kind == 'crossfade':
+            screen.blit(self.outgoing, (0, 0))
+            self.incoming.set_alpha(int(255 * self.progress))
+            screen.blit(self.incoming, (0, 0))
+        else:
+            # Smoothstep easing so the slide starts and stops gently
+            t = self.progress
+            offset = int(screen.get_width() * t * t * (3 - 2 * t))
+            screen.blit(self.outgoing, (-offset, 0))
+            screen.blit(self.incoming, (screen.get_width() - offset, 0))
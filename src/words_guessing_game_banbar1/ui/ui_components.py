@@ -3,15 +3,37 @@ Reusable UI Components for Word Guessing Game
 Contains LetterTile, Button, Grid, VirtualKeyboard, and NumberSelector
 """
 
+import math
 import pygame
-from . import constants
 from .constants import (
-    COLORS, TILE_SPACING, TILE_BORDER_WIDTH, SCREEN_WIDTH,
+    COLORS, TILE_SPACING, TILE_BORDER_WIDTH, SCREEN_WIDTH, SCREEN_HEIGHT,
     BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_BORDER_RADIUS,
-    NUMBER_BUTTON_SIZE, NUMBER_BUTTON_SPACING, GRID_TOP_MARGIN,
-    KEYBOARD_ROWS, KEY_WIDTH, KEY_HEIGHT, KEY_SPACING, KEYBOARD_TOP_MARGIN,
-    calculate_tile_size
+    NUMBER_BUTTON_SIZE, NUMBER_BUTTON_SPACING, NUMBER_BUTTONS_PER_ROW, GRID_TOP_MARGIN,
+    KEY_WIDTH, KEY_HEIGHT, KEYBOARD_TOP_MARGIN,
+    POP_MAX_SCALE, SHAKE_AMPLITUDE, BOUNCE_AMPLITUDE
 )
+from .dirty_rects import ANIMATING
+from .key_atlas import get_key_atlas
+from .layout import GridLayout, get_layout
+from .scene import NO_DAMAGE, Node, Group
+from .text_cache import render_text
+from .tile_atlas import get_atlas
+
+
+def create_screen_layer(size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    """
+    Create a full-window surface cleared to the background color
+
+    Used by the screens to hold content that does not change from frame to frame.
+
+    Args:
+        size: (width, height) of the window
+    """
+    surface = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    surface.fill(COLORS['background'])
+    return surface
 
 
 class LetterTile:
@@ -71,13 +93,16 @@ class LetterTile:
 
         # Draw letter if present and tile is tall enough to show text
         if self.letter and scale_y > 0.5:
-            text_surface = constants.FONTS['tile'].render(self.letter, True, COLORS['text_white'])
+            text_surface = render_text('tile', self.letter, COLORS['text_white'])
             text_rect = text_surface.get_rect(center=(x + size // 2, y + size // 2))
             screen.blit(text_surface, text_rect)
 
 
-class Button:
-    """Interactive button with hover and click states"""
+class Button(Node):
+    """Interactive button with hover and click states
+
+    Both looks are drawn once per label, so hovering only swaps images.
+    """
 
     def __init__(self, text, position, width=BUTTON_WIDTH, height=BUTTON_HEIGHT):
         """
@@ -87,40 +112,126 @@ class Button:
             width: Button width
             height: Button height
         """
+        super().__init__((position[0], position[1], width, height))
         self.text = text
         self.position = position
         self.width = width
         self.height = height
-        self.rect = pygame.Rect(position[0], position[1], width, height)
         self.is_hovered = False
+        self._looks = {}  # text -> (normal surface, hovered surface)
 
     def update(self, mouse_pos):
         """Update hover state based on mouse position"""
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        self.set_hovered(bool(self.rect.collidepoint(mouse_pos)))
+
+    def set_hovered(self, hovered):
+        """Show the hovered or normal look (called by a HitIndex)"""
+        self.set_state(is_hovered=hovered)
+
+    def register(self, hit_index):
+        """Make the button a click and hover target of a HitIndex"""
+        hit_index.add(self)
+
+    def get_look(self, hovered=False):
+        """
+        Return the button image for the current label, drawing both looks the first time
 
-    def is_clicked(self, mouse_pos, mouse_pressed):
-        """Check if button was clicked"""
-        return self.rect.collidepoint(mouse_pos) and mouse_pressed[0]
+        Args:
+            hovered: Whether to return the hovered look
+        """
+        looks = self._looks.get(self.text)
+        if looks is None:
+            looks = []
+            for look_hovered in (False, True):
+                surface = pygame.Surface(self.rect.size)
+                surface.fill(COLORS['background'])
+                self.draw(surface, look_hovered)
+                if pygame.display.get_surface() is not None:
+                    surface = surface.convert()
+                looks.append(surface)
+            looks = self._looks[self.text] = tuple(looks)
+        return looks[hovered]
+
+    def get_surface(self):
+        self.dirty = False
+        return self.get_look(self.is_hovered)
+
+    def draw(self, surface, hovered=False):
+        """Draw the button in one of its looks"""
+        rect = surface.get_rect()
 
-    def render(self, screen):
-        """Render the button"""
         # Determine color based on hover state
-        color = COLORS['button_hover'] if self.is_hovered else COLORS['button_primary']
+        color = COLORS['button_hover'] if hovered else COLORS['button_primary']
 
         # Draw button rectangle with rounded corners
-        pygame.draw.rect(screen, color, self.rect, border_radius=BUTTON_BORDER_RADIUS)
-        pygame.draw.rect(screen, COLORS['border'], self.rect, 2, border_radius=BUTTON_BORDER_RADIUS)
+        pygame.draw.rect(surface, color, rect, border_radius=BUTTON_BORDER_RADIUS)
+        pygame.draw.rect(surface, COLORS['border'], rect, 2, border_radius=BUTTON_BORDER_RADIUS)
 
         # Draw text
-        text_surface = constants.FONTS['normal'].render(self.text, True, COLORS['text_white'])
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_surface = render_text('normal', self.text, COLORS['text_white'])
+        text_rect = text_surface.get_rect(center=rect.center)
+        surface.blit(text_surface, text_rect)
+
+
+class NumberButton(Node):
+    """One number of a NumberSelector"""
+
+    def __init__(self, value, rect):
+        super().__init__(rect)
+        self.value = value
+        self.selected = False
+        self.hovered = False
+
+    def set_hovered(self, hovered):
+        self.set_state(hovered=hovered)
+
+    def draw(self, surface):
+        rect = surface.get_rect()
+
+        # Determine color
+        if self.selected:
+            color = COLORS['button_selected']
+        elif self.hovered:
+            color = COLORS['button_hover']
+        else:
+            color = COLORS['button_primary']
+
+        # Draw button
+        pygame.draw.rect(surface, color, rect, border_radius=5)
+        pygame.draw.rect(surface, COLORS['border'], rect, 2, border_radius=5)
 
+        # Draw number
+        text_surface = render_text('normal', str(self.value), COLORS['text_white'])
+        text_rect = text_surface.get_rect(center=rect.center)
+        surface.blit(text_surface, text_rect)
 
-class NumberSelector:
-    """Row of number buttons for selecting attempts or length"""
 
-    def __init__(self, min_val, max_val, default_val, position, label):
+class ProgressBar(Node):
+    """Thin bar filling up as background loading progresses"""
+
+    def __init__(self, rect):
+        """
+        Args:
+            rect: Screen area of the bar
+        """
+        super().__init__(rect)
+        self.filled = 0  # Width of the filled part in pixels
+
+    def set_progress(self, fraction):
+        """Show a fraction from 0.0 to 1.0; redrawn only when the filled width changes"""
+        self.set_state(filled=round(max(0.0, min(fraction, 1.0)) * (self.rect.width - 4)))
+
+    def draw(self, surface):
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, COLORS['border'], rect, 1, border_radius=3)
+        if self.filled:
+            pygame.draw.rect(surface, COLORS['button_primary'], (2, 2, self.filled, rect.height - 4))
+
+
+class NumberSelector(Group):
+    """Rows of number buttons for selecting attempts or length"""
+
+    def __init__(self, min_val, max_val, default_val, position, label, values=None):
         """
         Args:
             min_val: Minimum value
@@ -128,208 +239,601 @@ class NumberSelector:
             default_val: Default selected value
             position: (x, y) tuple for top-left corner of the selector
             label: Label text to display above buttons
+            values: Optional explicit choices (instead of every number from min_val to max_val)
         """
-        self.min_val = min_val
-        self.max_val = max_val
-        self.selected = default_val
+        if values is None:
+            values = range(min_val, max_val + 1)
+        self.min_val = values[0]
+        self.max_val = values[-1]
         self.position = position
         self.label = label
         self.buttons = []
 
-        # Create buttons for each number
-        total_width = (max_val - min_val + 1) * (NUMBER_BUTTON_SIZE + NUMBER_BUTTON_SPACING) - NUMBER_BUTTON_SPACING
-        start_x = position[0] - total_width // 2
-
-        for i, num in enumerate(range(min_val, max_val + 1)):
-            btn_x = start_x + i * (NUMBER_BUTTON_SIZE + NUMBER_BUTTON_SPACING)
-            btn_y = position[1] + 40  # Below label
-            self.buttons.append({
-                'value': num,
-                'rect': pygame.Rect(btn_x, btn_y, NUMBER_BUTTON_SIZE, NUMBER_BUTTON_SIZE)
-            })
-
-    def handle_click(self, mouse_pos, mouse_pressed):
-        """Handle click events on number buttons"""
-        if mouse_pressed[0]:
-            for btn in self.buttons:
-                if btn['rect'].collidepoint(mouse_pos):
-                    self.selected = btn['value']
-                    return True
+        # Create buttons for each number, NUMBER_BUTTONS_PER_ROW per centered row
+        for row_start in range(0, len(values), NUMBER_BUTTONS_PER_ROW):
+            row_values = values[row_start:row_start + NUMBER_BUTTONS_PER_ROW]
+            total_width = len(row_values) * (NUMBER_BUTTON_SIZE + NUMBER_BUTTON_SPACING) - NUMBER_BUTTON_SPACING
+            start_x = position[0] - total_width // 2
+            btn_y = position[1] + 40 + (row_start // NUMBER_BUTTONS_PER_ROW) * (NUMBER_BUTTON_SIZE + NUMBER_BUTTON_SPACING)
+
+            for i, num in enumerate(row_values):
+                btn_x = start_x + i * (NUMBER_BUTTON_SIZE + NUMBER_BUTTON_SPACING)
+                self.buttons.append({
+                    'value': num,
+                    'rect': pygame.Rect(btn_x, btn_y, NUMBER_BUTTON_SIZE, NUMBER_BUTTON_SIZE)
+                })
+
+        super().__init__(self.buttons[0]['rect'].unionall([btn['rect'] for btn in self.buttons]))
+        self._nodes = [self.add(NumberButton(btn['value'], btn['rect'])) for btn in self.buttons]
+        self.selected = None
+        self.select(default_val)
+
+    def select(self, value):
+        """Select a number"""
+        self.selected = value
+        for node in self._nodes:
+            node.set_state(selected=node.value == value)
+
+    def register(self, hit_index):
+        """Make every number button a click and hover target of a HitIndex"""
+        for node in self._nodes:
+            hit_index.add(node)
+
+    def handle_hit(self, target):
+        """
+        Select the number of a clicked button if it belongs to this selector
+
+        Args:
+            target: Widget found under the click by a HitIndex
+
+        Returns:
+            bool: True if the click selected a number here
+        """
+        if target is not None and target.parent is self:
+            self.select(target.value)
+            return True
         return False
 
-    def render(self, screen):
-        """Render the number selector"""
-        # Draw label
-        label_surface = constants.FONTS['normal'].render(self.label, True, COLORS['text_white'])
+    def render_label(self, screen):
+        """Render the label above the buttons"""
+        label_surface = render_text('normal', self.label, COLORS['text_white'])
         label_rect = label_surface.get_rect(center=(self.position[0], self.position[1]))
         screen.blit(label_surface, label_rect)
 
-        # Draw number buttons
-        mouse_pos = pygame.mouse.get_pos()
-        for btn in self.buttons:
-            # Determine color
-            if btn['value'] == self.selected:
-                color = COLORS['button_selected']
-            elif btn['rect'].collidepoint(mouse_pos):
-                color = COLORS['button_hover']
-            else:
-                color = COLORS['button_primary']
-
-            # Draw button
-            pygame.draw.rect(screen, color, btn['rect'], border_radius=5)
-            pygame.draw.rect(screen, COLORS['border'], btn['rect'], 2, border_radius=5)
-
-            # Draw number
-            text_surface = constants.FONTS['normal'].render(str(btn['value']), True, COLORS['text_white'])
-            text_rect = text_surface.get_rect(center=btn['rect'].center)
-            screen.blit(text_surface, text_rect)
+    def render(self, screen, with_label=True):
+        """
+        Render the number selector
+
+        Args:
+            screen: Pygame screen surface
+            with_label: Also draw the label (False when it is part of a static layer)
+
+        Returns:
+            list: Screen rectangles of the buttons that changed
+        """
+        if with_label:
+            self.render_label(screen)
+        return super().render(screen)
+
+
+class TileNode(Node):
+    """One grid tile; its letter and color live in the grid's flat arrays"""
+
+    def __init__(self, grid, index, rect):
+        super().__init__(rect)
+        self.grid = grid
+        self.index = index
+        self.visible = False  # Empty tiles are already part of the grid's base image
+
+    @property
+    def letter(self):
+        return self.grid.letters[self.index]
+
+    @property
+    def color_type(self):
+        return self.grid.color_types[self.index]
+
+    def get_surface(self):
+        self.dirty = False
+        return self.grid.atlas.get(self.grid.color_types[self.index], self.grid.letters[self.index])
+
+
+# Animation kinds a row can have, and the anim_state keys naming their row
+ROW_ANIMATIONS = ('flip', 'shake', 'pop', 'bounce')
+
 
+class Grid(Group):
+    """Grid displaying all guess rows with color-coded tiles
 
-class Grid:
-    """Grid displaying all guess rows with color-coded tiles"""
+    Tile positions are computed once. Letters and colors are kept in flat
+    per-tile arrays (index row * word_length + col) and only written when a row
+    can have changed, so drawing an unchanged grid allocates nothing.
+    """
 
-    def __init__(self, max_attempts, word_length):
+    # Boards too tall for the window use ScrollingGrid (see create_grid)
+    scrolls = False
+    scroll_y = 0
+    # Area animated rows are clipped to (None: not clipped)
+    animation_clip = None
+
+    def __init__(self, max_attempts, word_length, start_y=GRID_TOP_MARGIN, layout=None):
         """
         Args:
             max_attempts: Maximum number of attempts (rows)
             word_length: Length of the word (columns)
+            start_y: Top of the grid on screen (when no layout is given)
+            layout: Optional GridLayout from the layout engine (defaults to the design window)
         """
+        if layout is None:
+            layout = GridLayout(SCREEN_WIDTH, word_length, max_attempts, start_y, SCREEN_WIDTH, KEYBOARD_TOP_MARGIN)
         self.max_attempts = max_attempts
         self.word_length = word_length
-        self.tile_size = calculate_tile_size(word_length, max_attempts)
-
-        # Calculate grid position (centered)
-        grid_width = word_length * (self.tile_size + TILE_SPACING) - TILE_SPACING
-        self.start_x = (SCREEN_WIDTH - grid_width) // 2
-        self.start_y = GRID_TOP_MARGIN
-
-    def render(self, screen, guesses, current_input, anim_state=None):
+        self.layout = layout
+        self.tile_size = layout.tile_size
+
+        # Grid position (centered by the layout)
+        self.grid_width = layout.width
+        self.grid_height = layout.height
+        self.start_x = layout.start_x
+        self.start_y = layout.start_y
+
+        # One pixel of slack: tiles are placed at truncated absolute positions
+        super().__init__((self.start_x, self.start_y, math.ceil(self.grid_width) + 1, math.ceil(self.grid_height) + 1))
+
+        # Pre-rendered tiles for this tile size (shared between grids of the same size)
+        self.atlas = None
+        # All-empty grid, the base image under the tiles that hold a letter
+        self._empty_surface = None
+
+        # Exact tile positions per column and row (animated tiles are drawn from these)
+        self.col_x = [self.start_x + col * (self.tile_size + TILE_SPACING) for col in range(word_length)]
+        self.row_y = [self.start_y + row * (self.tile_size + TILE_SPACING) for row in range(max_attempts)]
+
+        # Per-tile state
+        count = max_attempts * word_length
+        self.letters = [''] * count
+        self.color_types = ['empty'] * count
+
+        self.tiles = self._create_tiles()
+
+        # Guess count and input currently shown by the tiles
+        self._guess_count = -1
+        self._input = None
+        # Reused for drawing tiles that an animation scales
+        self._anim_tile = LetterTile('', 'empty', self.tile_size, (0, 0))
+
+    def _create_tiles(self):
+        """Add a TileNode per tile and return them as rows"""
+        size = int(self.tile_size)
+        tiles = []
+        for row in range(self.max_attempts):
+            tiles.append([self.add(TileNode(self, row * self.word_length + col,
+                                            (int(self.col_x[col]), int(self.row_y[row]), size, size)))
+                          for col in range(self.word_length)])
+        return tiles
+
+    def prerender_empty(self):
+        """Draw the grid with every tile empty into an offscreen surface"""
+        if self.atlas is None:
+            self.atlas = get_atlas(self.tile_size)
+        empty_tile = self.atlas.get('empty', '')
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(COLORS['background'])
+        for row in range(self.max_attempts):
+            for col in range(self.word_length):
+                x = col * (self.tile_size + TILE_SPACING)
+                y = row * (self.tile_size + TILE_SPACING)
+                surface.blit(empty_tile, (int(x), int(y)))
+        self._empty_surface = surface
+        self.set_base(surface)
+
+    def _set_tile(self, row, col, letter, color_type):
+        """Write one tile's state, invalidating it only if it changed"""
+        tile = self.tiles[row][col]
+        index = tile.index
+        visible = letter != ''
+        if self.letters[index] != letter or self.color_types[index] != color_type or tile.visible != visible:
+            self.letters[index] = letter
+            self.color_types[index] = color_type
+            tile.visible = visible
+            tile.invalidate()
+
+    def set_contents(self, guesses, current_input):
         """
-        Render the grid with all guesses and current input
+        Update the tiles to show the guesses and the current input
+
+        Only rows from the first one that can have changed up to the input row (or
+        the last row shown before) are touched; rows below them stay empty. Only
+        tiles whose letter or color differs are invalidated.
 
         Args:
             guesses: List of dicts with 'word', 'match_indexes', 'right_indexes'
             current_input: Current input string being typed
-            anim_state: Optional dict with active animation data
         """
-        if anim_state is None:
-            anim_state = {}
-
-        for row in range(self.max_attempts):
+        guess_count = len(guesses)
+        if guess_count == self._guess_count and current_input == self._input:
+            return
+        first_row = 0 if self._guess_count < 0 else min(self._guess_count, guess_count)
+        last_row = min(self.max_attempts, max(self._guess_count, guess_count) + 1)
+        self._guess_count = guess_count
+        self._input = current_input
+
+        for row in range(first_row, last_row):
             for col in range(self.word_length):
-                x = self.start_x + col * (self.tile_size + TILE_SPACING)
-                y = self.start_y + row * (self.tile_size + TILE_SPACING)
-
-                # Determine letter and color for this tile
-                letter = ''
-                color_type = 'empty'
-
-                if row < len(guesses):
+                if row < guess_count:
                     # Previous guess
                     guess_data = guesses[row]
-                    letter = guess_data['word'][col]
-
                     if col in guess_data['match_indexes']:
                         color_type = 'correct'
                     elif col in guess_data['right_indexes']:
                         color_type = 'present'
                     else:
                         color_type = 'absent'
-
-                elif row == len(guesses) and col < len(current_input):
+                    self._set_tile(row, col, guess_data['word'][col], color_type)
+                elif row == guess_count and col < len(current_input):
                     # Current input being typed
-                    letter = current_input[col]
-                    color_type = 'empty'
+                    self._set_tile(row, col, current_input[col], 'empty')
+                else:
+                    self._set_tile(row, col, '', 'empty')
 
-                # Compute animation transforms for this tile
+    def composite(self):
+        if self._empty_surface is None:
+            self.prerender_empty()
+        return Group.composite(self)  # Not super(): no proxy object per frame
+
+    def render(self, screen, guesses, current_input, anim_state=None):
+        """
+        Render the grid with all guesses and current input
+
+        Args:
+            guesses: List of dicts with 'word', 'match_indexes', 'right_indexes'
+            current_input: Current input string being typed
+            anim_state: Optional dict with active animation data
+
+        Returns:
+            Sequence of screen rectangles of tiles that changed (animated rows excluded)
+        """
+        self.set_contents(guesses, current_input)
+        damaged = Group.render(self, screen)
+        if anim_state:
+            self.render_animations(screen, anim_state)
+        return damaged
+
+    def _animated_rows(self, anim_state):
+        """Return {row: {kind: animation}} for the rows with an active animation"""
+        rows = {}
+        for kind in ROW_ANIMATIONS:
+            animation = anim_state.get(kind)
+            if animation:
+                rows.setdefault(anim_state.get(kind + '_row'), {})[kind] = animation
+        return rows
+
+    def render_animations(self, screen, anim_state):
+        """
+        Draw the rows that are animating on top of the composited grid
+
+        Animations are resolved once per row; each animated row is cleared and redrawn
+        in full from the tile state arrays. Every other row is already correct in the
+        cached grid image.
+
+        Args:
+            screen: Pygame screen surface
+            anim_state: Dict with active animation data
+        """
+        if not anim_state:
+            return
+        clip = screen.get_clip()
+        if self.animation_clip is not None:
+            screen.set_clip(self.animation_clip.clip(clip))
+        for row, animations in self._animated_rows(anim_state).items():
+            row_y = self.row_y[row] - self.scroll_y
+            pygame.draw.rect(screen, COLORS['background'],
+                             (self.start_x, row_y, self.grid_width, self.tile_size))
+
+            flip_anim = animations.get('flip')
+            bounce_anim = animations.get('bounce')
+            pop_anim = animations.get('pop')
+            pop_col = anim_state.get('pop_col') if pop_anim else -1
+
+            # Shake moves the whole row (applies to the current input row)
+            offset_x = 0
+            shake_anim = animations.get('shake')
+            if shake_anim:
+                offset_x = shake_anim.get_offset_x() or 0
+
+            first = row * self.word_length
+            for col in range(self.word_length):
+                letter = self.letters[first + col]
+                color_type = self.color_types[first + col]
                 scale_y = 1.0
-                offset_x = 0
                 offset_y = 0
                 pop_scale = 1.0
 
                 # Flip animation (applies to the row that just flipped)
-                flip_anim = anim_state.get('flip')
-                if flip_anim and row == anim_state.get('flip_row'):
-                    sy, show_color = flip_anim.get_tile_state(col)
-                    scale_y = sy
+                if flip_anim:
+                    scale_y, show_color = flip_anim.get_tile_state(col)
                     if not show_color:
                         color_type = 'empty'  # Hide color during first half
 
-                # Shake animation (applies to the current input row)
-                shake_anim = anim_state.get('shake')
-                if shake_anim and row == anim_state.get('shake_row'):
-                    ox = shake_anim.get_offset_x()
-                    if ox is not None:
-                        offset_x = ox
-
                 # Pop animation (applies to a single tile)
-                pop_anim = anim_state.get('pop')
-                if (pop_anim
-                        and row == anim_state.get('pop_row')
-                        and col == anim_state.get('pop_col')):
-                    ps = pop_anim.get_scale()
-                    if ps is not None:
-                        pop_scale = ps
+                if col == pop_col:
+                    pop_scale = pop_anim.get_scale() or 1.0
 
                 # Bounce animation (applies to a row on win)
-                bounce_anim = anim_state.get('bounce')
-                if bounce_anim and row == anim_state.get('bounce_row'):
+                if bounce_anim:
                     offset_y = bounce_anim.get_tile_offset_y(col)
 
-                # Render tile with transforms
-                tile = LetterTile(letter, color_type, self.tile_size, (x, y))
-                tile.render(screen, scale_y=scale_y, offset_x=offset_x,
-                            offset_y=offset_y, pop_scale=pop_scale)
+                # Unscaled tiles are a single blit from the atlas; flip and pop
+                # change the tile's shape and are drawn directly
+                if scale_y == 1.0 and pop_scale == 1.0:
+                    screen.blit(self.atlas.get(color_type, letter),
+                                (int(self.col_x[col]) + offset_x, int(row_y) + offset_y))
+                else:
+                    tile = self._anim_tile
+                    tile.letter = letter.upper() if letter else None
+                    tile.color_type = color_type
+                    tile.position = (self.col_x[col], row_y)
+                    tile.render(screen, scale_y=scale_y, offset_x=offset_x,
+                                offset_y=offset_y, pop_scale=pop_scale)
+        screen.set_clip(clip)
+
+    def track_dirty(self, tracker, anim_state=None):
+        """
+        Report the animated rows to a DirtyTracker
 
+        Animated rows are always dirty, with their area widened by the furthest a
+        shaking, popping or bouncing tile can reach. Other tiles report their own
+        changes through the scene graph.
+        """
+        if not anim_state:
+            return
+        pop_margin = math.ceil(self.tile_size * (POP_MAX_SCALE - 1) / 2) + 1
+        x_margin = SHAKE_AMPLITUDE + pop_margin
 
-class VirtualKeyboard:
-    """On-screen keyboard with letter status tracking"""
+        for row in self._animated_rows(anim_state):
+            rect = pygame.Rect(int(self.start_x) - x_margin,
+                               int(self.row_y[row]) - self.scroll_y - BOUNCE_AMPLITUDE - pop_margin,
+                               math.ceil(self.grid_width) + 1 + 2 * x_margin,
+                               math.ceil(self.tile_size) + 1 + BOUNCE_AMPLITUDE + 2 * pop_margin)
+            if self.animation_clip is not None:
+                rect = rect.clip(self.animation_clip)
+            tracker.track(('grid', row), ANIMATING, rect)
 
-    def __init__(self):
-        """Initialize keyboard with default letter states"""
-        self.letter_states = {letter: 'unused' for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'}
-        self.keys = []
-        self._create_keys()
 
-    def _create_keys(self):
-        """Create key rectangles based on keyboard layout"""
-        self.keys = []
-        y_offset = KEYBOARD_TOP_MARGIN
+class ScrollingGrid(Grid):
+    """Grid showing a window of its rows, for boards too tall to fit with readable tiles
 
-        for row_idx, row in enumerate(KEYBOARD_ROWS):
-            # Calculate row width and starting x position
-            row_width = len(row) * (KEY_WIDTH + KEY_SPACING) - KEY_SPACING
-            x_offset = (SCREEN_WIDTH - row_width) // 2
+    Only the rows inside the viewport are drawn, each from its own cached surface
+    that is redrawn when one of its tiles changes. Rows left without letters share
+    one empty row image. Scrolling re-blits the visible row surfaces, so the cost of
+    a frame depends on the viewport, not on the number of attempts.
+    """
 
-            for col_idx, letter in enumerate(row):
-                x = x_offset + col_idx * (KEY_WIDTH + KEY_SPACING)
-                y = y_offset + row_idx * (KEY_HEIGHT + KEY_SPACING)
+    scrolls = True
 
-                self.keys.append({
-                    'letter': letter,
-                    'rect': pygame.Rect(x, y, KEY_WIDTH, KEY_HEIGHT)
-                })
+    def __init__(self, max_attempts, word_length, layout):
+        """
+        Args:
+            max_attempts: Maximum number of attempts (rows)
+            word_length: Length of the word (columns)
+            layout: GridLayout from the layout engine (with scrolls set)
+        """
+        super().__init__(max_attempts, word_length, layout=layout)
+        self.row_pitch = self.tile_size + TILE_SPACING
+        self.max_scroll = math.ceil(layout.content_height - layout.height)
+        # Rows that animate may reach sideways past the grid, but not above or below the viewport
+        x_margin = SHAKE_AMPLITUDE + math.ceil(self.tile_size * (POP_MAX_SCALE - 1) / 2) + 1
+        self.animation_clip = self.rect.inflate(2 * x_margin, 0)
+
+        self._row_surfaces = {}     # row -> cached image of a row holding letters
+        self._damaged_rows = []     # Visible rows changed since the last composite
+        self._drawn_scroll = None
+
+    def _create_tiles(self):
+        # Tiles live only in the state arrays; rows are drawn as whole surfaces
+        return []
+
+    def prerender_empty(self):
+        """Draw one row of empty tiles, shared by every row without letters"""
+        if self.atlas is None:
+            self.atlas = get_atlas(self.tile_size)
+        empty_tile = self.atlas.get('empty', '')
+        surface = pygame.Surface((self.rect.width, math.ceil(self.tile_size) + 1))
+        surface.fill(COLORS['background'])
+        for col in range(self.word_length):
+            surface.blit(empty_tile, (int(self.col_x[col]) - self.rect.x, 0))
+        self._empty_surface = surface
+        self._full = True
+        self.invalidate()
+
+    def _set_tile(self, row, col, letter, color_type):
+        """Write one tile's state; the row's cached image is dropped if it changed"""
+        index = row * self.word_length + col
+        if self.letters[index] != letter or self.color_types[index] != color_type:
+            self.letters[index] = letter
+            self.color_types[index] = color_type
+            self._row_surfaces.pop(row, None)
+            if row not in self._damaged_rows:
+                self._damaged_rows.append(row)
+            self.invalidate()
+
+    def clamp_scroll(self, offset):
+        """Limit a scroll offset (pixels from the top of the first row) to the content"""
+        return max(0, min(self.max_scroll, int(offset)))
+
+    def set_scroll(self, offset):
+        """Scroll the viewport, redrawing it on the next composite if the offset changed"""
+        offset = self.clamp_scroll(offset)
+        if offset != self.scroll_y:
+            self.scroll_y = offset
+            self.invalidate()
+
+    def offset_showing(self, row, offset):
+        """
+        Return the scroll offset closest to offset that shows the whole of a row
 
-        # Add backspace and submit buttons on the same row as ZXCVBNM
-        last_letter_row = KEYBOARD_ROWS[-1]  # ZXCVBNM
-        last_row_y = y_offset + (len(KEYBOARD_ROWS) - 1) * (KEY_HEIGHT + KEY_SPACING)
+        Args:
+            row: Row that has to be visible
+            offset: Scroll offset to start from
+        """
+        top = int(row * self.row_pitch)
+        bottom = top + math.ceil(self.tile_size)
+        if top < offset:
+            offset = top
+        elif bottom > offset + self.rect.height - 1:
+            offset = bottom - self.rect.height + 1
+        return self.clamp_scroll(offset)
+
+    def visible_rows(self):
+        """Range of the rows inside the viewport"""
+        first = int(self.scroll_y // self.row_pitch)
+        last = min(self.max_attempts, int((self.scroll_y + self.rect.height) // self.row_pitch) + 1)
+        return range(first, last)
+
+    def _row_surface(self, row):
+        """Return the image of a row, drawing it if it holds letters and is not cached"""
+        surface = self._row_surfaces.get(row)
+        if surface is not None:
+            return surface
+        first = row * self.word_length
+        if not any(self.letters[first:first + self.word_length]):
+            return self._empty_surface
+        surface = self._empty_surface.copy()
+        for col in range(self.word_length):
+            surface.blit(self.atlas.get(self.color_types[first + col], self.letters[first + col]),
+                         (int(self.col_x[col]) - self.rect.x, 0))
+        self._row_surfaces[row] = surface
+        return surface
+
+    def _draw_row(self, row):
+        """Paint a row into the viewport image and return its area there"""
+        top = int(self.row_y[row]) - self.rect.y - self.scroll_y
+        area = pygame.Rect(0, top, self.rect.width, math.ceil(self.tile_size) + 1).clip(self._surface.get_rect())
+        self._surface.set_clip(area)
+        self._surface.fill(COLORS['background'], area)
+        self._surface.blit(self._row_surface(row), (0, top))
+        self._surface.set_clip(None)
+        return area
+
+    def composite(self):
+        if self._empty_surface is None:
+            self.prerender_empty()
+        if not self.dirty and not self._full:
+            return NO_DAMAGE
+        if self._surface is None:
+            self._surface = pygame.Surface(self.rect.size)
+            self._full = True
+
+        visible = self.visible_rows()
+        if self._full or self.scroll_y != self._drawn_scroll:
+            # Scrolled: redraw the viewport from the row images, dropping rows that left it
+            self._surface.fill(COLORS['background'])
+            for row in visible:
+                self._draw_row(row)
+            for row in [row for row in self._row_surfaces if row not in visible]:
+                del self._row_surfaces[row]
+            damaged = [self.rect.copy()]
+        else:
+            damaged = [self._draw_row(row).move(self.rect.topleft) for row in self._damaged_rows if row in visible]
+
+        self._damaged_rows.clear()
+        self._drawn_scroll = self.scroll_y
+        self._full = False
+        self.dirty = False
+        return damaged
+
+
+def create_grid(max_attempts, word_length, layout):
+    """
+    Create the grid for a game setting: a ScrollingGrid if the layout cannot show every row
+
+    Args:
+        max_attempts: Maximum number of attempts (rows)
+        word_length: Length of the word (columns)
+        layout: GridLayout from the layout engine
+    """
+    if layout.scrolls:
+        return ScrollingGrid(max_attempts, word_length, layout)
+    return Grid(max_attempts, word_length, layout=layout)
+
+
+class KeyNode(Node):
+    """One virtual keyboard key, shown only while it differs from the pre-rendered keyboard"""
+
+    def __init__(self, keyboard, letter, rect):
+        """
+        Args:
+            keyboard: VirtualKeyboard the key belongs to
+            letter: Letter on the key (None for backspace)
+            rect: Key area
+        """
+        super().__init__(rect)
+        self.keyboard = keyboard
+        self.letter = letter
+        self.state = 'unused'
+        self.look = 'normal'
+        self.hovered = False  # Set by the HitIndex; the keyboard derives the look from it
+        self.visible = False
+
+    def set_hovered(self, hovered):
+        self.hovered = hovered
+
+    def get_surface(self):
+        # Every look is pre-rendered in the key atlas; no private surface is kept
+        self.dirty = False
+        if self.letter is None:
+            return self.keyboard.key_atlas.backspace(self.look == 'hover')
+        return self.keyboard.key_atlas.key(self.letter, self.state, self.look)
+
+
+class VirtualKeyboard(Group):
+    """On-screen keyboard with letter status tracking"""
+
+    def __init__(self, layout=None):
+        """
+        Initialize keyboard with default letter states
 
-        # Calculate the width of the letter keys in the last row
-        last_row_width = len(last_letter_row) * (KEY_WIDTH + KEY_SPACING) - KEY_SPACING
-        last_row_start_x = (SCREEN_WIDTH - last_row_width) // 2
-        last_row_end_x = last_row_start_x + last_row_width
+        Args:
+            layout: Optional ScreenLayout giving the key rectangles (defaults to the design window)
+        """
+        self.letter_states = {letter: 'unused' for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'}
+        self.keys = []
+        self._create_keys(layout if layout is not None else get_layout())
 
-        # Submit button (left side of last row)
-        submit_width = 65
-        submit_x = last_row_start_x - submit_width - KEY_SPACING
-        self.submit_button = Button("OK", (submit_x, last_row_y), width=submit_width, height=KEY_HEIGHT)
+        super().__init__(self.bounds)
+        self._key_nodes = [self.add(KeyNode(self, key['letter'], key['rect'])) for key in self.keys]
+        self._backspace_node = self.add(KeyNode(self, None, self.backspace_rect))
+        self.add(self.submit_button)
 
-        # Backspace button (right side of last row) - custom rect, no text
-        backspace_width = 65
-        backspace_x = last_row_end_x + KEY_SPACING
-        self.backspace_rect = pygame.Rect(backspace_x, last_row_y, backspace_width, KEY_HEIGHT)
+    def _create_keys(self, layout):
+        """Create the keys at the rectangles computed by the layout engine"""
+        self.keys = [{'letter': letter, 'rect': rect.copy()} for letter, rect in layout.keys]
+
+        # Submit button (left side of last row) and backspace (right side) - custom rect, no text
+        submit_rect = layout.submit_key
+        self.submit_button = Button("OK", submit_rect.topleft, width=submit_rect.width, height=submit_rect.height)
+        self.backspace_rect = layout.backspace_key.copy()
         self.backspace_hovered = False
 
+        # Area covered by the whole keyboard, and its pre-rendered idle image
+        self.bounds = layout.keyboard_bounds.copy()
+        self._base_surface = None
+        self.key_atlas = None
+
+    def prerender(self):
+        """Build the key images and compose the keyboard with every key unused and nothing hovered"""
+        self.key_atlas = get_key_atlas((KEY_WIDTH, KEY_HEIGHT), self.backspace_rect.size)
+        surface = pygame.Surface(self.bounds.size)
+        surface.fill(COLORS['background'])
+        offset = (-self.bounds.x, -self.bounds.y)
+
+        for key in self.keys:
+            surface.blit(self.key_atlas.key(key['letter'], 'unused'), key['rect'].move(offset))
+        surface.blit(self.key_atlas.backspace(), self.backspace_rect.move(offset))
+        surface.blit(self.submit_button.get_look(), self.submit_button.rect.move(offset))
+        self._base_surface = surface
+        self.set_base(surface)
+
     def reset(self):
         """Reset all letter states for a new game"""
         self.letter_states = {letter: 'unused' for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'}
@@ -367,96 +871,77 @@ class VirtualKeyboard:
                 elif current_state == 'present' and new_state == 'correct':
                     self.letter_states[letter] = new_state
 
-    def handle_click(self, mouse_pos, mouse_pressed):
+    def register(self, hit_index):
+        """Make every key, backspace and the submit button click and hover targets of a HitIndex"""
+        for node in self._key_nodes:
+            hit_index.add(node)
+        hit_index.add(self._backspace_node)
+        self.submit_button.register(hit_index)
+
+    def action_for(self, target):
         """
-        Handle click events on keyboard keys
+        Return what a click on a widget does
+
+        Args:
+            target: Widget found under the click by a HitIndex (or None)
+
         Returns: Tuple (action_type, value) where action_type is 'letter', 'backspace', or 'submit'
         """
-        if mouse_pressed[0]:
-            # Check letter keys
-            for key in self.keys:
-                if key['rect'].collidepoint(mouse_pos):
-                    return ('letter', key['letter'])
+        if target is self.submit_button:
+            return ('submit', None)
+        if target is self._backspace_node:
+            return ('backspace', None)
+        if target is not None and target.parent is self:
+            return ('letter', target.letter)
+        return (None, None)
 
-            # Check backspace
-            if self.backspace_rect.collidepoint(mouse_pos):
-                return ('backspace', None)
+    def _key_look(self, node, pressed_letter):
+        """
+        Return the interaction look of a letter key (one of KEY_LOOKS)
 
-            # Check submit
-            if self.submit_button.rect.collidepoint(mouse_pos):
-                return ('submit', None)
+        Args:
+            node: KeyNode of the key
+            pressed_letter: Letter whose key press is animating, or None
+        """
+        pressed = node.letter == pressed_letter
+        if node.hovered:
+            return 'pressed_hover' if pressed else 'hover'
+        return 'pressed' if pressed else 'normal'
 
-        return (None, None)
+    def update_keys(self, key_press_anim=None):
+        """
+        Bring every key's look up to date; only keys whose image changed are redrawn
 
-    def render(self, screen, key_press_anim=None):
-        """Render the virtual keyboard
+        Hover comes from the HitIndex the keyboard is registered in.
 
         Args:
             key_press_anim: Optional KeyPressAnimation for visual feedback
         """
-        mouse_pos = pygame.mouse.get_pos()
+        pressed_letter = None
+        if key_press_anim is not None and key_press_anim.get_darken_amount() is not None:
+            pressed_letter = key_press_anim.key
+        for node in self._key_nodes:
+            state = self.letter_states.get(node.letter, 'unused')
+            look = self._key_look(node, pressed_letter)
+            node.set_state(state=state, look=look, visible=state != 'unused' or look != 'normal')
+
+        self.backspace_hovered = self._backspace_node.hovered
+        self._backspace_node.set_state(look='hover' if self.backspace_hovered else 'normal',
+                                       visible=self.backspace_hovered)
+
+    def composite(self):
+        if self._base_surface is None:
+            self.prerender()
+        return super().composite()
 
-        # Render letter keys
-        for key in self.keys:
-            letter = key['letter']
-            state = self.letter_states.get(letter, 'unused')
-
-            # Determine color based on state
-            if state == 'correct':
-                color = COLORS['tile_correct']
-            elif state == 'present':
-                color = COLORS['tile_present']
-            elif state == 'absent':
-                color = COLORS['tile_absent']
-            else:  # unused
-                color = COLORS['key_unused']
-
-            # Key press darkening effect
-            if key_press_anim and letter == key_press_anim.key:
-                darken = key_press_anim.get_darken_amount()
-                if darken is not None:
-                    color = tuple(max(c - darken, 0) for c in color)
-
-            # Highlight on hover
-            if key['rect'].collidepoint(mouse_pos):
-                # Brighten the color
-                color = tuple(min(c + 30, 255) for c in color)
-
-            # Draw key
-            pygame.draw.rect(screen, color, key['rect'], border_radius=4)
-            pygame.draw.rect(screen, COLORS['border'], key['rect'], 2, border_radius=4)
-
-            # Draw letter
-            text_surface = constants.FONTS['key'].render(letter, True, COLORS['text_white'])
-            text_rect = text_surface.get_rect(center=key['rect'].center)
-            screen.blit(text_surface, text_rect)
+    def render(self, screen, key_press_anim=None):
+        """Render the virtual keyboard
 
-        # Render backspace button with arrow icon
-        self.backspace_hovered = self.backspace_rect.collidepoint(mouse_pos)
-        backspace_color = COLORS['button_hover'] if  self.backspace_hovered else COLORS['button_primary']
-        pygame.draw.rect(screen, backspace_color, self.backspace_rect, border_radius=4)
-        pygame.draw.rect(screen, COLORS['border'], self.backspace_rect, 2, border_radius=4)
-
-        # Draw backspace arrow icon (← with X)
-        cx, cy = self.backspace_rect.center
-        arrow_size = 12
-        # Draw arrow pointing left with tail
-        arrow_points = [
-            (cx - arrow_size, cy),           # Arrow tip (left)
-            (cx - arrow_size + 8, cy - 8),   # Top of arrow head
-            (cx - arrow_size + 8, cy - 4),   # Top inner
-            (cx + arrow_size - 4, cy - 4),   # Top right
-            (cx + arrow_size - 4, cy + 4),   # Bottom right
-            (cx - arrow_size + 8, cy + 4),   # Bottom inner
-            (cx - arrow_size + 8, cy + 8),   # Bottom of arrow head
-        ]
-        pygame.draw.polygon(screen, COLORS['text_white'], arrow_points)
-        # Draw small X on the arrow body
-        x_offset = 6
-        x_size = 4
-        pygame.draw.line(screen, backspace_color, ((cx + x_offset - x_size)-5, cy - x_size), ((cx + x_offset + x_size)-5, cy + x_size), 2)
-        pygame.draw.line(screen, backspace_color, ((cx + x_offset + x_size)-5, cy - x_size), ((cx + x_offset - x_size)-5, cy + x_size), 2)
-
-        # Update and render submit button
-        self.submit_button.update(mouse_pos)
-        self.submit_button.render(screen)
+        Args:
+            key_press_anim: Optional KeyPressAnimation for visual feedback
+
+        Returns:
+            list: Screen rectangles of the keys that changed
+        """
+        self.update_keys(key_press_anim)
+        return super().render(screen)
@@ -0,0 +1,155 @@
+"""
+Tests for background asset loading and the setup screen's loading gate
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+import time
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.assets import AssetLoader, create_asset_loader, required_assets
+from words_guessing_game_banbar1.ui.setup_screen import SetupScreen
+from words_guessing_game_banbar1.functions.jobs import JobExecutor
+from words_guessing_game_banbar1.main_game_func import GameManager, GameState
+
+constants.init_fonts()
+
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def run_until_done(loader, executor, timeout=5.0):
+    """Step and poll like the frame loop until everything is loaded"""
+    deadline = time.monotonic() + timeout
+    while not loader.done and time.monotonic() < deadline:
+        executor.poll()
+        loader.step()
+        time.sleep(0.001)
+
+
+class TestAssetLoader:
+    """Tests for AssetLoader"""
+
+    def test_nothing_loads_before_first_step(self):
+        """Registering assets does no work"""
+        calls = []
+        loader = AssetLoader()
+        loader.add('a', lambda: calls.append('a'), background=True)
+        loader.add('b', lambda: calls.append('b'))
+        assert calls == []
+        assert loader.progress == 0.0
+        assert not loader.done
+
+    def test_one_main_thread_asset_per_step(self):
+        """Surface work is spread over frames; background work goes first"""
+        calls = []
+        loader = AssetLoader()
+        loader.add('surface1', lambda: calls.append('surface1'))
+        loader.add('surface2', lambda: calls.append('surface2'))
+        loader.add('data', lambda: calls.append('data'), background=True)
+
+        loader.step()
+        assert calls == ['data', 'surface1']
+        assert loader.is_loaded('data', 'surface1')
+        assert not loader.is_loaded('surface2')
+        loader.step()
+        assert loader.done
+        assert loader.progress == 1.0
+
+    def test_background_dependencies(self):
+        """An asset registered after another is submitted once that one is delivered"""
+        executor = JobExecutor()
+        order = []
+        loader = AssetLoader(executor)
+        loader.add('index', lambda: order.append('index'), background=True, after='dictionary')
+        loader.add('dictionary', lambda: order.append('dictionary'), background=True)
+        try:
+            run_until_done(loader, executor)
+        finally:
+            executor.shutdown()
+        assert loader.done
+        assert order == ['dictionary', 'index']
+
+    def test_default_assets(self):
+        """The default loader covers the dictionary, every word length, fonts and images"""
+        executor = JobExecutor()
+        loader = create_asset_loader(executor)
+        try:
+            run_until_done(loader, executor)
+        finally:
+            executor.shutdown()
+        assert loader.done
+        for length in constants.LENGTH_CHOICES:
+            assert loader.is_loaded(*required_assets(length))
+        assert loader.is_loaded('keys', 'tiles', *(f'font:{name}' for name in constants.FONT_SIZES))
+
+
+class TestSetupScreenLoading:
+    """Tests for the progress bar and START GAME gating"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.loader = AssetLoader()
+        for name in required_assets(5):
+            self.loader.add(name, lambda: None, background=True)
+        self.loader.add('later', lambda: None)
+        self.loader.add('much later', lambda: None)
+        self.screen = SetupScreen(assets=self.loader)
+        self.gm = GameManager()
+
+    def test_start_waits_for_required_assets(self):
+        """A click while the words are loading starts the game as soon as they are in"""
+        self.screen.update(self.gm)
+        assert self.screen.start_button.text == "LOADING..."
+        self.screen.handle_event(click(self.screen.start_button.rect.center), self.gm)
+        assert self.gm.state == GameState.SETUP
+        assert self.screen.start_requested
+
+        self.loader.step()
+        self.screen.update(self.gm)
+        assert self.gm.state == GameState.PLAYING
+        assert self.gm.word_length == 5
+        assert not self.screen.start_requested
+
+    def test_only_needed_assets_gate_start(self):
+        """Assets the game does not need yet do not hold the start back"""
+        self.loader.step()
+        assert not self.loader.done
+        self.screen.update(self.gm)
+        assert self.screen.start_button.text == "START GAME"
+        self.screen.handle_event(click(self.screen.start_button.rect.center), self.gm)
+        assert self.gm.state == GameState.PLAYING
+
+    def test_progress_bar(self):
+        """The bar fills while loading and disappears when everything is loaded"""
+        self.screen.update(self.gm)
+        assert self.screen.progress_bar.visible
+        assert self.screen.progress_bar.filled == 0
+        self.loader.step()
+        self.screen.update(self.gm)
+        assert self.screen.progress_bar.filled > 0
+        self.loader.step()
+        self.loader.step()
+        self.screen.update(self.gm)
+        assert not self.screen.progress_bar.visible
+
+    def test_without_loader(self):
+        """Without a loader the screen starts games immediately and shows no bar"""
+        screen = SetupScreen()
+        screen.update(self.gm)
+        assert not screen.progress_bar.visible
+        screen.handle_event(click(screen.start_button.rect.center), self.gm)
+        assert self.gm.state == GameState.PLAYING
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,109 @@
+"""
+Tests for the baked bitmap font atlas
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.bitmap_font import BitmapFont, build, load, load_fonts
+from words_guessing_game_banbar1.ui.text_cache import TEXT_CACHE
+from words_guessing_game_banbar1.ui.setup_screen import SetupScreen
+
+constants.init_fonts()
+
+WHITE = (255, 255, 255)
+
+
+def alpha_bytes(surface):
+    return pygame.image.tobytes(surface, 'RGBA')[3::4]
+
+
+class TestBitmapFont:
+    """Tests for text composed from the shipped atlas"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.fonts = load(constants.FONT_SIZES.values())
+        self.freetype = {size: pygame.font.Font(None, size) for size in self.fonts}
+
+    def test_atlas_has_every_ui_size(self):
+        """The shipped atlas matches FONT_SIZES"""
+        assert set(self.fonts) == set(constants.FONT_SIZES.values())
+        for size, font in self.fonts.items():
+            assert font.get_height() == self.freetype[size].get_height()
+
+    def test_single_glyphs_match_freetype(self):
+        """A glyph drawn from the atlas is the FreeType glyph, in any color"""
+        for size in (48, 20):
+            font, reference = self.fonts[size], self.freetype[size]
+            for char in "AQgj7?":
+                ours = font.render(char, True, constants.COLORS['tile_present'])
+                theirs = reference.render(char, True, constants.COLORS['tile_present'])
+                assert ours.get_size() == theirs.get_size()
+                assert alpha_bytes(ours) == alpha_bytes(theirs)
+                assert ours.get_at((ours.get_width() // 2, ours.get_height() // 2))[:3] == \
+                    constants.COLORS['tile_present']
+
+    def test_pairs_keep_kerning(self):
+        """Two-letter strings are as wide as FreeType makes them"""
+        font, reference = self.fonts[48], self.freetype[48]
+        for text in ("AV", "To", "gy", "10"):
+            assert font.size(text) == reference.size(text)
+            assert font.render(text, True, WHITE).get_size() == reference.size(text)
+
+    def test_empty_string(self):
+        """An empty string has no width and the line height"""
+        font = self.fonts[28]
+        assert font.size("") == (0, font.get_height())
+        assert font.render("", True, WHITE).get_size() == (0, font.get_height())
+
+    def test_falls_back_outside_atlas(self):
+        """Characters not in the atlas and aliased text are drawn by FreeType"""
+        font, reference = self.fonts[28], self.freetype[28]
+        assert not font.covers("café")
+        assert font.size("café") == reference.size("café")
+        aliased = font.render("HELLO", False, WHITE)
+        assert aliased.get_size() == reference.render("HELLO", False, WHITE).get_size()
+
+
+class TestAtlasFiles:
+    """Tests for building and loading the atlas files"""
+
+    def test_build_roundtrip(self, tmp_path):
+        """A freshly baked atlas loads with the sizes it was built for"""
+        metrics_path, data_path = tmp_path / "atlas.json", tmp_path / "atlas.bin"
+        metrics = build([24, 40], str(metrics_path), str(data_path))
+        assert set(metrics['sizes']) == {'24', '40'}
+
+        fonts = load([40], str(metrics_path), str(data_path))
+        assert isinstance(fonts[40], BitmapFont)
+        assert fonts[40].size("WORD") == pygame.font.Font(None, 40).size("WORD")
+        assert load([36], str(metrics_path), str(data_path)) is None
+
+    def test_missing_atlas_uses_freetype(self, tmp_path):
+        """Without the atlas files the named fonts are plain pygame fonts"""
+        fonts = load_fonts({'title': 48}, str(tmp_path / "missing.json"), str(tmp_path / "missing.bin"))
+        assert isinstance(fonts['title'], pygame.font.Font)
+
+    def test_screens_draw_with_bitmap_fonts(self, monkeypatch):
+        """The UI renders through render_text with the atlas fonts"""
+        monkeypatch.setattr(constants, 'FONTS', load_fonts(constants.FONT_SIZES))
+        TEXT_CACHE.clear()
+        try:
+            assert isinstance(constants.FONTS['title'], BitmapFont)
+            SetupScreen().render(pygame.Surface((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)), None)
+        finally:
+            TEXT_CACHE.clear()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
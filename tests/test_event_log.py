@@ -0,0 +1,148 @@
+"""
+Tests for the append-only event log and replayer
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+import time
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+# Add inner package directory for bare imports (main_game_func, etc.)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "words_guessing_game_banbar1"))
+
+import pygame
+pygame.init()
+
+from main_game_func import GameManager, GameState
+from functions.event_log import EventLogWriter, EventReplayer, ReplayError, iter_events, replay_games
+from functions.find import words_of_length
+
+
+def play_logged_game(path, seed=1234):
+    """Play one winning game with a typo and an invalid guess, logging to path"""
+    writer = EventLogWriter(str(path))
+    manager = GameManager(event_log=writer)
+    manager.start_game(attempts=6, length=5, seed=seed)
+    for letter in "helpx":
+        manager.add_letter(letter)
+    manager.remove_letter()
+    manager.add_letter("s")
+    manager.submit_guess(manager.current_input)
+    manager.submit_guess("xxxxx")
+    manager.submit_guess(manager.guess_word)
+    writer.close()
+    return manager
+
+
+class TestEventLogWriter:
+    """Tests for EventLogWriter"""
+
+    def test_close_flushes_all_events(self, tmp_path):
+        """Every logged event should be on disk after close"""
+        path = tmp_path / "events.log"
+        play_logged_game(path)
+
+        types = [event['type'] for event in iter_events(str(path))]
+        assert types[0] == 'start'
+        assert types.count('key') == 7
+        assert types.count('guess') == 3
+        assert types[-1] == 'state'
+
+    def test_appends_to_existing_log(self, tmp_path):
+        """Reopening a log should append rather than truncate"""
+        path = tmp_path / "events.log"
+        play_logged_game(path)
+        play_logged_game(path)
+
+        starts = [event for event in iter_events(str(path)) if event['type'] == 'start']
+        assert len(starts) == 2
+
+    def test_flushes_under_steady_traffic(self, tmp_path):
+        """Events arriving faster than the flush interval should still reach the disk on time"""
+        path = tmp_path / "events.log"
+        writer = EventLogWriter(str(path), flush_interval=0.05)
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            writer.log('key', action='backspace')
+            time.sleep(0.01)
+        try:
+            assert path.stat().st_size > 0
+        finally:
+            writer.close()
+
+    def test_log_after_close_is_ignored(self, tmp_path):
+        """Logging on a closed writer should not raise"""
+        writer = EventLogWriter(str(tmp_path / "events.log"))
+        writer.close()
+        writer.log('key', action='backspace')
+
+
+class TestReplay:
+    """Tests for rebuilding GameManager state from a log"""
+
+    def test_replay_rebuilds_final_state(self, tmp_path):
+        """Replayed manager should match the original game exactly"""
+        path = tmp_path / "events.log"
+        original = play_logged_game(path)
+
+        replayed = list(replay_games(iter_events(str(path)), manager_factory=GameManager))
+
+        assert len(replayed) == 1
+        manager = replayed[0]
+        assert manager.state == GameState.WIN
+        assert manager.guess_word == original.guess_word
+        assert manager.guesses == original.guesses
+        assert manager.attempts_remaining == original.attempts_remaining
+
+    def test_replay_input_after_guesses(self, tmp_path):
+        """Keystrokes after several accepted guesses should replay onto an empty input"""
+        path = tmp_path / "events.log"
+        writer = EventLogWriter(str(path))
+        original = GameManager(event_log=writer)
+        original.start_game(attempts=6, length=5, seed=7)
+        wrong = [word for word in words_of_length(5) if word != original.guess_word.lower()][:2]
+        for word in wrong:
+            for letter in word:
+                original.add_letter(letter)
+            original.submit_guess(original.current_input)
+        original.add_letter("a")
+        original.add_letter("b")
+        writer.close()
+
+        replayer = EventReplayer(manager_factory=GameManager)
+        for event in iter_events(str(path)):
+            replayer.apply(event)
+        manager = replayer.manager
+        assert original.current_input == "AB"
+        assert manager.current_input == original.current_input
+        assert manager.guesses == original.guesses
+
+    def test_same_seed_picks_same_word(self):
+        """start_game should be deterministic for a given seed"""
+        first = GameManager()
+        second = GameManager()
+        first.start_game(6, 7, seed=99)
+        second.start_game(6, 7, seed=99)
+        assert first.guess_word == second.guess_word
+
+    def test_mismatch_raises(self, tmp_path):
+        """Tampered feedback should be reported during verification"""
+        path = tmp_path / "events.log"
+        play_logged_game(path)
+        events = list(iter_events(str(path)))
+        for event in events:
+            if event['type'] == 'guess' and event['ok']:
+                event['match_indexes'] = [9]
+                break
+
+        replayer = EventReplayer(manager_factory=GameManager)
+        with pytest.raises(ReplayError):
+            for event in events:
+                replayer.apply(event)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
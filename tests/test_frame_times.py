@@ -0,0 +1,101 @@
+"""
+Tests for the frame-time benchmark
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+# The benchmarks are scripts, not a package
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+import frame_times
+
+constants.init_fonts()
+
+
+def results(**means):
+    return {"scenarios": {name: {"mean_ms": mean, "p95_ms": mean * 2, "p99_ms": mean * 3}
+                          for name, mean in means.items()}}
+
+
+class TestScenarios:
+    """Tests for the rendered scenarios"""
+
+    def test_every_setting_is_covered(self):
+        """There is a game scenario for every length and attempts choice"""
+        names = frame_times.scenarios()
+        for length in constants.LENGTH_CHOICES:
+            for attempts in constants.ATTEMPT_CHOICES:
+                assert f"game:{length}x{attempts}" in names
+        assert {"setup", "game:flip", "game:shake", "end:bounce"} <= set(names)
+        assert {f"transition:{kind}" for kind in ("fade", "crossfade", "slide")} <= set(names)
+
+    @pytest.mark.parametrize("pattern", ["setup", "game:5x100", "game:11x1", "game:flip", "game:shake",
+                                         "end:bounce", "transition:*"])
+    def test_scenarios_render(self, pattern):
+        """Scenarios run for the requested number of frames, restarting animations as needed"""
+        measured = frame_times.measure(frames=100, pattern=pattern)
+        assert measured["scenarios"]
+        for summary in measured["scenarios"].values():
+            assert summary["frames"] == 100
+            assert 0 < summary["mean_ms"] <= summary["p99_ms"]
+            assert summary["p95_ms"] <= summary["p99_ms"]
+
+    def test_animations_are_running(self):
+        """The animated scenarios measure frames while their animation plays"""
+        bench = frame_times.Bench()
+        for setup, attr in ((frame_times.flip, 'flip_animation'), (frame_times.shake, 'shake_animation')):
+            draw, running = setup(bench)
+            draw()
+            assert running()
+            assert getattr(bench.screens[frame_times.GameState.PLAYING], attr) is not None
+        draw, running = frame_times.end_bounce(bench)
+        draw()
+        assert bench.screens[frame_times.GameState.WIN].bounce_animation is not None
+
+
+class TestReport:
+    """Tests for summaries and the baseline comparison"""
+
+    def test_summarize(self):
+        """Frame times in seconds are summarized in milliseconds"""
+        summary = frame_times.summarize([0.001] * 98 + [0.005, 0.010])
+        assert summary["frames"] == 100
+        assert summary["mean_ms"] == pytest.approx(1.13)
+        assert summary["p95_ms"] == pytest.approx(1.0)
+        assert 5.0 <= summary["p99_ms"] <= 10.0
+
+    def test_compare(self):
+        """Only slowdowns beyond the threshold of scenarios in the baseline are regressions"""
+        baseline = results(setup=1.0, fade=1.0)
+        assert frame_times.compare(results(setup=1.2, fade=0.5, new=9.0), baseline, threshold=0.25) == []
+        regressions = frame_times.compare(results(setup=1.5, fade=1.0), baseline, threshold=0.25)
+        assert regressions == [("setup", "mean_ms", 1.0, 1.5), ("setup", "p95_ms", 2.0, 3.0)]
+
+    def test_tiny_differences_are_noise(self):
+        """Fast scenarios do not fail on timer noise"""
+        assert frame_times.compare(results(setup=0.06), results(setup=0.01)) == []
+
+    def test_best_of(self):
+        """Each metric keeps its lowest value across rounds"""
+        first, second = results(setup=2.0, fade=1.0), results(setup=1.0, fade=3.0)
+        second["scenarios"]["setup"]["p99_ms"] = 7.0
+        merged = frame_times.best_of([first, second])
+        assert merged["rounds"] == 2
+        assert merged["scenarios"]["setup"] == {"mean_ms": 1.0, "p95_ms": 2.0, "p99_ms": 6.0}
+        assert merged["scenarios"]["fade"]["mean_ms"] == 1.0
+        assert first["scenarios"]["setup"]["mean_ms"] == 2.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
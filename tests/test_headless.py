@@ -0,0 +1,174 @@
+"""
+Tests for headless runs, scripted input and frame capture
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import json
+import subprocess
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.headless import (InputScript, click, type_word, render_state,
+                                                     frame_bytes, frame_array)
+from words_guessing_game_banbar1.ui.input_context import InputContext
+from words_guessing_game_banbar1.main_game_func import GameManager, GameState, ScreenSet
+
+constants.init_fonts()
+
+SIZE = (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)
+
+
+class TestInputScript:
+    """Tests for per-frame scripted input"""
+
+    def test_events_by_frame(self):
+        """Each frame gets its own steps, then QUIT follows the last one"""
+        start = click((10, 20))
+        script = InputScript().at(1, start).at(3, lambda gm: type_word("AB", submit=False))
+        gm = GameManager()
+
+        assert script.events(gm) == [start]
+        assert script.events(gm) == []
+        assert [event.unicode for event in script.events(gm)] == ["A", "B"]
+        assert [event.type for event in script.events(gm)] == [pygame.QUIT]
+        assert script.game_manager is gm
+
+    def test_virtual_time(self):
+        """Every frame advances the clock by one frame interval"""
+        script = InputScript(frame_time=0.5).at(10)
+        script.events(None)
+        script.events(None)
+        assert script.time() == 1.0
+
+    def test_type_word(self):
+        """Typing a word presses its letters, then Enter"""
+        events = type_word("crane")
+        assert [event.unicode for event in events[:-1]] == list("crane")
+        assert events[0].key == pygame.K_c
+        assert events[-1].key == pygame.K_RETURN
+
+    def test_mouse_follows_events(self):
+        """Without a real mouse, the frame's mouse events give the hover position"""
+        context = InputContext(follow_events=True)
+        context.sample([click((5, 6)), pygame.event.Event(pygame.MOUSEMOTION, pos=(7, 8))])
+        assert context.mouse_pos == (7, 8)
+        context.sample([])
+        assert context.mouse_pos == (7, 8)
+
+
+class TestFrameCapture:
+    """Tests for rendering states offscreen and reading their pixels"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.gm = GameManager()
+        self.screens = ScreenSet()
+
+    def test_render_every_state(self):
+        """Setup, playing, won and lost states each render a different frame"""
+        frames = [bytes(frame_bytes(render_state(self.gm, self.screens)))]
+        self.gm.start_game(6, 5, word="CRANE")
+        frames.append(bytes(frame_bytes(render_state(self.gm, self.screens))))
+        self.gm.submit_guess("SLATE")
+        frames.append(bytes(frame_bytes(render_state(self.gm, self.screens))))
+        self.gm.submit_guess("CRANE")
+        frames.append(bytes(frame_bytes(render_state(self.gm, self.screens))))
+        assert self.gm.state == GameState.WIN
+        assert len(set(frames)) == 4
+
+    def test_render_size(self):
+        """The frame has the size of the screens"""
+        assert render_state(self.gm, size=(700, 900)).get_size() == (700, 900)
+
+    def test_bytes_view_does_not_copy(self):
+        """The bytes view writes through to the surface"""
+        surface = render_state(self.gm, self.screens)
+        view = frame_bytes(surface)
+        assert view.nbytes == surface.get_pitch() * surface.get_height()
+        pixel = surface.map_rgb((9, 8, 7)).to_bytes(surface.get_bytesize(), sys.byteorder)
+        view[:surface.get_bytesize()] = pixel
+        view.release()
+        assert tuple(surface.get_at((0, 0)))[:3] == (9, 8, 7)
+
+    def test_array_view_does_not_copy(self):
+        """The NumPy view writes through to the surface"""
+        pytest.importorskip("numpy")
+        surface = render_state(self.gm, self.screens)
+        pixels = frame_array(surface)
+        assert pixels.shape == SIZE + (3,)
+        assert tuple(pixels[0, 0]) == tuple(surface.get_at((0, 0)))[:3]
+        pixels[0, 0] = (9, 8, 7)
+        del pixels
+        assert tuple(surface.get_at((0, 0)))[:3] == (9, 8, 7)
+
+
+class TestHeadlessMain:
+    """Tests for main() on the dummy video driver"""
+
+    def test_scripted_game(self, tmp_path):
+        """A scripted game is won without a window and every frame is handed to the script"""
+        code = (
+            "import pygame\n"
+            "from words_guessing_game_banbar1.main_game_func import main\n"
+            "from words_guessing_game_banbar1.ui.headless import InputScript, click, type_word\n"
+            "frames = []\n"
+            "script = InputScript(on_frame=lambda frame, surface, gm: frames.append(surface.get_size()))\n"
+            "script.at(5, click((300, 555)))\n"
+            "script.at(40, lambda gm: type_word(gm.guess_word))\n"
+            "script.at(150)\n"
+            f"main(stats_path={str(tmp_path / 'stats.json')!r}, leaderboard_path={str(tmp_path / 'lb.db')!r},\n"
+            "     headless=True, input_script=script)\n"
+            "print(pygame.display.get_driver() if pygame.display.get_init() else 'quit',\n"
+            "      script.game_manager.state.name, len(frames), set(frames))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src"), PYGAME_HIDE_SUPPORT_PROMPT="1",
+                   SDL_VIDEODRIVER="x11", DISPLAY="")
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                                timeout=60)
+        assert result.stdout.strip().split(maxsplit=3) == ["quit", "WIN", "151", str({SIZE})], result.stderr
+
+    @pytest.mark.parametrize("dirty_rects", [False, True])
+    def test_idle_timeout_presents_nothing(self, tmp_path, dirty_rects):
+        """An idle wait that times out without input neither flips nor updates the window"""
+        code = (
+            "import json\n"
+            "import pygame\n"
+            "from words_guessing_game_banbar1.main_game_func import main\n"
+            "presented, seen = [0], []\n"
+            "def count(real):\n"
+            "    def present(*args):\n"
+            "        presented[0] += 1\n"
+            "        return real(*args)\n"
+            "    return present\n"
+            "pygame.display.flip = count(pygame.display.flip)\n"
+            "pygame.display.update = count(pygame.display.update)\n"
+            "def wait(timeout=0):\n"
+            "    seen.append(presented[0])\n"
+            "    return pygame.event.Event(pygame.QUIT if len(seen) > 3 else pygame.NOEVENT)\n"
+            "pygame.event.wait = wait\n"
+            f"main(stats_path={str(tmp_path / 'stats.json')!r}, leaderboard_path={str(tmp_path / 'lb.db')!r},\n"
+            f"     headless=True, dirty_rects={dirty_rects})\n"
+            "print(json.dumps(seen))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src"), PYGAME_HIDE_SUPPORT_PROMPT="1")
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                                timeout=60)
+        assert result.returncode == 0, result.stderr
+        seen = json.loads(result.stdout)
+        assert len(seen) == 4 and seen[0] > 0
+        assert len(set(seen)) == 1
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
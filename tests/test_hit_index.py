@@ -0,0 +1,114 @@
+"""
+Tests for spatial hit testing and the per-frame input context
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.hit_index import HitIndex
+from words_guessing_game_banbar1.ui.input_context import InputContext
+from words_guessing_game_banbar1.ui.setup_screen import SetupScreen
+from words_guessing_game_banbar1.ui.game_screen import GameScreen
+from words_guessing_game_banbar1.main_game_func import GameManager
+
+constants.init_fonts()
+
+SIZE = (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)
+
+
+class Target:
+    """Minimal hit target recording its hover changes"""
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.changes = []
+
+    def set_hovered(self, hovered):
+        self.changes.append(hovered)
+
+
+def click(pos, button=1):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)
+
+
+class TestHitIndex:
+    """Tests for HitIndex"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.hits = HitIndex(SIZE)
+        self.small = Target((10, 10, 20, 20))
+        self.wide = Target((100, 100, 300, 60))  # Spans several cells
+        self.hits.add(self.small)
+        self.hits.add(self.wide)
+
+    def test_hit(self):
+        """Points inside a target find it; points in gaps or outside the window find nothing"""
+        assert self.hits.hit((15, 15)) is self.small
+        assert self.hits.hit((105, 105)) is self.wide
+        assert self.hits.hit((395, 155)) is self.wide
+        assert self.hits.hit((35, 15)) is None
+        assert self.hits.hit((-5, 900)) is None
+
+    def test_hover_notifies_changes_only(self):
+        """Only the targets losing and gaining the hover are told"""
+        self.hits.hover((15, 15))
+        self.hits.hover((16, 16))
+        self.hits.hover((200, 120))
+        self.hits.hover((5, 5))
+        assert self.small.changes == [True, False]
+        assert self.wide.changes == [True, False]
+        assert self.hits.hovered is None
+
+
+class TestScreenInput:
+    """Tests for screens dispatching through the index and the input context"""
+
+    def test_click_uses_event_position(self, monkeypatch):
+        """A click types the key under event.pos, wherever the mouse is reported now"""
+        monkeypatch.setattr(pygame.mouse, 'get_pos', lambda: (0, 0))
+        gm = GameManager()
+        gm.start_game(6, 5, word="hello")
+        screen = GameScreen()
+        screen.initialize_grid(6, 5)
+        q_key = screen.virtual_keyboard.keys[0]['rect']
+
+        screen.handle_event(click(q_key.center, button=3), gm)
+        assert gm.current_input == ""
+        screen.handle_event(click(q_key.center), gm)
+        assert gm.current_input == "Q"
+
+    def test_setup_clicks(self):
+        """Number buttons and toggles are found by the index"""
+        gm = GameManager()
+        screen = SetupScreen()
+        eight = next(node for node in screen.attempts_selector.children if node.value == 8)
+        screen.handle_event(click(eight.rect.center), gm)
+        screen.handle_event(click(screen.timed_button.rect.center), gm)
+        assert screen.attempts_selector.selected == 8
+        assert screen.timed
+
+    def test_hover_from_context(self):
+        """Screens hover with the position sampled for the frame"""
+        context = InputContext()
+        screen = SetupScreen(input_context=context)
+        context.mouse_pos = screen.start_button.rect.center
+        screen.update(None)
+        assert screen.start_button.is_hovered
+
+        context.mouse_pos = (0, 0)
+        screen.update(None)
+        assert not screen.start_button.is_hovered
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+"""
+Tests for input recording and replays
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import json
+import random
+import subprocess
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.input_recording import (InputRecorder, InputReplay, encode_event, decode_event,
+                                                            load_recording, game_summary, _event_types)
+from words_guessing_game_banbar1.functions.event_log import ReplayError
+from words_guessing_game_banbar1.main_game_func import GameManager
+
+constants.init_fonts()
+
+
+def key(char):
+    return pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char, mod=0, window=None)
+
+
+class TestEventEncoding:
+    """Tests for events in recordings"""
+
+    def test_roundtrip(self):
+        """Events come back with their type and plain attributes"""
+        events = [
+            key("a"),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(3, 4), button=1),
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(5, 6), rel=(1, 1), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.VIDEORESIZE, size=(700, 900), w=700, h=900),
+            pygame.event.Event(pygame.QUIT),
+        ]
+        types = _event_types()
+        for event in events:
+            encoded = json.loads(json.dumps(encode_event(event)))
+            decoded = decode_event(encoded, types)
+            assert decoded.type == event.type
+            assert decoded.dict == {name: value for name, value in event.dict.items() if name != 'window'}
+
+
+class TestInputRecorder:
+    """Tests for InputRecorder"""
+
+    def test_recording_file(self, tmp_path):
+        """The header, the frames that had input and the final state are written"""
+        path = str(tmp_path / "session.jsonl")
+        gm = GameManager()
+        recorder = InputRecorder(path, seed=7, transition='slide')
+        recorder.record(10.0, [], gm)
+        recorder.record(10.5, [key("a"), key("b")], gm)
+        recorder.record(11.0, [], gm)
+        gm.start_game(6, 5, word="CRANE")
+        recorder.close()
+        recorder.close()
+
+        header, frames, final_state = load_recording(path)
+        assert header['seed'] == 7 and header['transition'] == 'slide'
+        assert [(t, [event.unicode for event in events]) for t, events in frames] == [(0.5, ["a", "b"])]
+        assert final_state == game_summary(gm)
+        assert final_state['state'] == 'PLAYING'
+
+    def test_seeds_the_words(self, tmp_path):
+        """Words picked after the recorder is created follow from the recorded seed"""
+        InputRecorder(str(tmp_path / "a.jsonl"), seed=42).close()
+        first = random.getrandbits(32)
+        InputRecorder(str(tmp_path / "b.jsonl"), seed=42).close()
+        assert random.getrandbits(32) == first
+
+    def test_not_a_recording(self, tmp_path):
+        """Loading another file fails clearly"""
+        path = tmp_path / "other.jsonl"
+        path.write_text('{"type":"start"}\n')
+        with pytest.raises(ReplayError):
+            load_recording(str(path))
+
+
+class TestInputReplay:
+    """Tests for the replay script"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.gm = GameManager()
+
+    def make_replay(self, tmp_path, frames):
+        path = str(tmp_path / "session.jsonl")
+        recorder = InputRecorder(path, seed=1)
+        for t, events in frames:
+            recorder.record(t, events, self.gm)
+        recorder.close()
+        return InputReplay(path)
+
+    def test_events_at_their_time(self, tmp_path):
+        """Recorded input is handed over on the frame that reaches its time"""
+        replay = self.make_replay(tmp_path, [(0.0, []), (0.05, [key("a")])])
+        assert [replay.events(self.gm) for _ in range(3)] == [[], [], []]
+        assert [event.unicode for event in replay.events(self.gm)] == ["a"]
+        assert [event.type for event in replay.events(self.gm)] == [pygame.QUIT]
+
+    def test_one_recorded_frame_per_frame(self, tmp_path):
+        """Input of separate recorded frames stays on separate frames"""
+        replay = self.make_replay(tmp_path, [(0.0, [key("a")]), (0.001, [key("b")])])
+        assert [event.unicode for event in replay.events(self.gm)] == ["a"]
+        assert [event.unicode for event in replay.events(self.gm)] == ["b"]
+
+    def test_idle_skips_to_next_input(self, tmp_path):
+        """While the game is idle, a long pause passes in a single frame"""
+        replay = self.make_replay(tmp_path, [(0.0, []), (30.0, [key("a")])])
+        replay.events(self.gm)
+        assert [event.unicode for event in replay.events(self.gm, idle=True)] == ["a"]
+        assert replay.elapsed == pytest.approx(30.0)
+
+
+class TestReplay:
+    """Tests for replaying a recorded session into a headless main()"""
+
+    def test_record_and_replay(self, tmp_path):
+        """A recorded game replays to the same final state, drawing the same frames every time"""
+        recording = str(tmp_path / "session.jsonl")
+        code = (
+            "import json\n"
+            "import pygame\n"
+            "from words_guessing_game_banbar1.main_game_func import main\n"
+            "from words_guessing_game_banbar1.ui.headless import InputScript, click, key, type_word\n"
+            "from words_guessing_game_banbar1.ui.input_recording import replay\n"
+            "script = InputScript()\n"
+            "script.at(5, click((300, 555)))\n"
+            "script.at(40, lambda gm: type_word('ZZZZZ'))\n"
+            "script.at(100, lambda gm: [key(pygame.K_BACKSPACE)] * 5 + type_word(gm.guess_word))\n"
+            "script.at(300)\n"
+            f"main(stats_path={str(tmp_path / 'stats.json')!r}, leaderboard_path={str(tmp_path / 'lb.db')!r},\n"
+            f"     headless=True, input_script=script, record_input_path={recording!r})\n"
+            f"first = replay({recording!r})\n"
+            f"second = replay({recording!r}, first['checksums'])\n"
+            "print(json.dumps([script.frame, first['frames'], first['state']]))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src"), PYGAME_HIDE_SUPPORT_PROMPT="1")
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        played, replayed, state = json.loads(result.stdout)
+        assert state['state'] == 'WIN'
+        assert state['guesses'] == [state['word'].upper()]
+        # Idle stretches are skipped, not redrawn
+        assert replayed < played
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+"""
+Tests for the background job executor
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+# Add inner package directory for bare imports (main_game_func, etc.)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "words_guessing_game_banbar1"))
+
+from functions.jobs import JobExecutor
+from functions.stats import PlayerStats
+
+
+def poll_until(executor, predicate, timeout=5.0):
+    """Poll like the main loop does until predicate() holds"""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        executor.poll()
+        time.sleep(0.001)
+    return predicate()
+
+
+class TestJobExecutor:
+    """Tests for JobExecutor"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.executor = JobExecutor(max_workers=1)
+
+    def teardown_method(self):
+        self.executor.shutdown(wait=True)
+
+    def test_callback_runs_on_polling_thread(self):
+        """on_done should run inside poll(), on the caller's thread"""
+        results = []
+        self.executor.submit(sum, [1, 2, 3], on_done=lambda job: results.append((job.result(), threading.get_ident())))
+
+        assert poll_until(self.executor, lambda: results)
+        assert results == [(6, threading.get_ident())]
+        assert self.executor.pending == 0
+
+    def test_cancel_owner(self):
+        """Queued jobs of an owner are cancelled and their callbacks dropped"""
+        gate = threading.Event()
+        owner = object()
+        results = []
+        self.executor.submit(gate.wait)  # Occupies the only worker
+        job = self.executor.submit(lambda: 1, owner=owner, on_done=results.append)
+
+        assert self.executor.cancel_owner(owner) == 1
+        gate.set()
+        assert poll_until(self.executor, lambda: self.executor.pending == 0)
+        assert job.cancelled
+        assert results == []
+
+    def test_other_owners_unaffected(self):
+        """cancel_owner only touches the given owner's jobs"""
+        results = []
+        self.executor.submit(lambda: 2, owner="game", on_done=lambda job: results.append(job.result()))
+        self.executor.cancel_owner("setup")
+
+        assert poll_until(self.executor, lambda: results)
+        assert results == [2]
+
+    def test_poll_wait(self):
+        """A waiting poll delivers jobs however long they take"""
+        results = []
+        self.executor.submit(time.sleep, 0.05, on_done=lambda job: results.append('slept'))
+
+        assert self.executor.poll(wait=True) == 1
+        assert results == ['slept']
+        assert self.executor.pending == 0
+
+
+class TestBackgroundStatsSave:
+    """Tests for PlayerStats writing through the executor"""
+
+    def test_latest_snapshot_wins(self, tmp_path):
+        """After several background saves the file holds the newest aggregates"""
+        executor = JobExecutor(max_workers=2)
+        path = str(tmp_path / "stats.json")
+        stats = PlayerStats(path, executor)
+        for guesses in [1, 2, 3, 4]:
+            stats.record_game(5, 6, won=True, guesses_used=guesses)
+        executor.shutdown(wait=True)
+
+        assert PlayerStats.load(path).games_played == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,96 @@
+"""
+Tests for the pre-rendered virtual keyboard keys
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.animations import KeyPressAnimation
+from words_guessing_game_banbar1.ui.key_atlas import get_key_atlas, key_color, KEY_STATES, KEY_LOOKS
+from words_guessing_game_banbar1.ui.tile_atlas import LETTERS
+from words_guessing_game_banbar1.ui.ui_components import Button, VirtualKeyboard
+from words_guessing_game_banbar1.ui.hit_index import HitIndex
+
+constants.init_fonts()
+
+
+class TestKeyAtlas:
+    """Tests for KeyAtlas and get_key_atlas"""
+
+    def test_all_keys_prebuilt(self):
+        """Every letter is built in every state and look up front"""
+        atlas = get_key_atlas((45, 58), (65, 58))
+        assert len(atlas._keys) == len(LETTERS) * len(KEY_STATES) * len(KEY_LOOKS)
+        assert atlas.key('Q', 'correct', 'pressed_hover').get_size() == (45, 58)
+        assert atlas.backspace(hovered=True).get_size() == (65, 58)
+
+    def test_same_size_reuses_atlas(self):
+        """Keyboards share one atlas"""
+        first = VirtualKeyboard()
+        second = VirtualKeyboard()
+        first.prerender()
+        second.prerender()
+        assert first.key_atlas is second.key_atlas
+
+    def test_key_colors(self):
+        """Pressing darkens and hovering brightens the state color"""
+        base = key_color('present', 'normal')
+        assert key_color('present', 'hover') == tuple(min(c + 30, 255) for c in base)
+        assert key_color('present', 'pressed') == tuple(max(c - 50, 0) for c in base)
+
+
+class TestKeyboardLooks:
+    """Tests for VirtualKeyboard drawing from the key atlas"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.keyboard = VirtualKeyboard()
+        self.keyboard.composite()
+        self.q_node = self.keyboard._key_nodes[0]
+
+    def test_key_shows_atlas_image(self):
+        """A key in a non-idle look is drawn straight from the atlas"""
+        self.keyboard.letter_states['Q'] = 'absent'
+        hits = HitIndex((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
+        self.keyboard.register(hits)
+        hits.hover(self.keyboard.keys[0]['rect'].center)
+        self.keyboard.update_keys()
+        assert self.q_node.look == 'hover' and self.q_node.visible
+        assert self.q_node.get_surface() is self.keyboard.key_atlas.key('Q', 'absent', 'hover')
+
+    def test_pressed_look_while_animating(self):
+        """A key press shows the pressed look until the animation ends"""
+        anim = KeyPressAnimation('q')
+        self.keyboard.update_keys(anim)
+        assert self.q_node.look == 'pressed'
+
+        anim.start_time -= 1.0
+        self.keyboard.update_keys(anim)
+        assert self.q_node.look == 'normal' and not self.q_node.visible
+
+
+class TestButtonLooks:
+    """Tests for Button's pre-rendered looks"""
+
+    def test_hover_swaps_images(self):
+        """Both looks are built once and hovering only selects the other one"""
+        button = Button("OK", (0, 0))
+        normal = button.get_surface()
+        button.update((5, 5))
+        hovered = button.get_surface()
+        assert hovered is not normal
+        button.update((500, 500))
+        assert button.get_surface() is normal
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
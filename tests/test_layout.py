@@ -0,0 +1,115 @@
+"""
+Tests for the layout engine and resizable screens
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.layout import get_layout, get_grid_layout, fit_window_size, MIN_WINDOW_SIZE
+from words_guessing_game_banbar1.ui.setup_screen import SetupScreen
+from words_guessing_game_banbar1.ui.game_screen import GameScreen
+from words_guessing_game_banbar1.ui.end_screen import EndScreen
+from words_guessing_game_banbar1.main_game_func import GameManager
+
+constants.init_fonts()
+
+DESIGN = (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)
+LARGE = (900, 1100)
+
+
+class TestLayout:
+    """Tests for get_layout and get_grid_layout"""
+
+    def test_memoized_per_size(self):
+        """A layout is computed once per window size and setting"""
+        assert get_layout(LARGE) is get_layout(LARGE)
+        assert get_layout(LARGE) is not get_layout(DESIGN)
+        assert get_grid_layout(LARGE, 5, 6) is get_grid_layout(LARGE, 5, 6)
+
+    def test_design_size_positions(self):
+        """At the design size the keyboard and grid sit where they always have"""
+        layout = get_layout(DESIGN)
+        assert layout.keys[0] == ('Q', pygame.Rect(48, 520, 45, 58))
+        grid = get_grid_layout(DESIGN, 5, 6)
+        assert grid.tile_size == constants.calculate_tile_size(5, 6)
+        assert grid.start_y == constants.GRID_TOP_MARGIN
+
+    def test_larger_window(self):
+        """The keyboard stays at the bottom, the grid grows into the extra height, content is centered"""
+        small, large = get_layout(DESIGN), get_layout(LARGE)
+        assert LARGE[1] - large.keyboard_bounds.bottom == DESIGN[1] - small.keyboard_bounds.bottom
+        assert large.keyboard_bounds.centerx == small.keyboard_bounds.centerx + (LARGE[0] - DESIGN[0]) // 2
+        assert get_grid_layout(LARGE, 5, 6).tile_size > get_grid_layout(DESIGN, 5, 6).tile_size
+
+    def test_stats_chart_follows_window(self):
+        """The end screen's bars are centered in the window and spread over its width"""
+        for size in (DESIGN, LARGE, (1600, 800)):
+            layout = get_layout(fit_window_size(size))
+            for count in (1, 4, 10):
+                start_x, slot_width = layout.stats_slots(count)
+                assert start_x + slot_width * count // 2 == layout.center_x
+                assert slot_width * count <= layout.stats_width
+        assert get_layout(DESIGN).stats_slots(10) == (50, 50)
+
+    def test_window_never_below_design_size(self):
+        """Requested sizes are clamped to MIN_WINDOW_SIZE"""
+        assert fit_window_size((300, 2000)) == (MIN_WINDOW_SIZE[0], 2000)
+
+
+class TestResize:
+    """Tests for laying screens out again after a resize"""
+
+    def test_game_screen_keeps_state(self):
+        """Resizing mid-game keeps the typed letters and keyboard colors"""
+        gm = GameManager()
+        gm.start_game(6, 5, word="hello")
+        gm.submit_guess("world")
+        gm.add_letter('h')
+        screen = GameScreen()
+        screen.initialize_grid(6, 5)
+        screen.virtual_keyboard.update_letter_states(gm.guesses, gm.guess_word)
+        screen.render(pygame.Surface(DESIGN), gm)
+
+        screen.resize(LARGE)
+        surface = pygame.Surface(LARGE)
+        screen.render(surface, gm)
+
+        assert screen.background.get_size() == LARGE
+        assert screen.virtual_keyboard.letter_states['W'] == 'absent'
+        assert screen.grid.letters[:6] == ['W', 'O', 'R', 'L', 'D', 'H']
+        assert screen.dirty.take() is None
+
+    def test_setup_screen_keeps_selection(self):
+        """Selections survive a resize and the widgets move with the layout"""
+        screen = SetupScreen()
+        screen.attempts_selector.select(8)
+        screen.resize(LARGE)
+        assert screen.attempts_selector.selected == 8
+        assert screen.start_button.rect.centerx == LARGE[0] // 2
+
+    def test_end_screen_drops_prewarm(self):
+        """The next game prepared for the old size is not reused"""
+        gm = GameManager()
+        gm.start_game(6, 5, word="hello")
+        gm.submit_guess("hello")
+        screen = EndScreen()
+        screen.initialize_grid(6, 5)
+        screen.update(gm)
+        assert screen.prewarm is not None
+
+        screen.resize(LARGE)
+        assert screen.prewarm is None
+        assert screen.grid.rect.centerx == pytest.approx(LARGE[0] // 2, abs=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
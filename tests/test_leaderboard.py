@@ -0,0 +1,124 @@
+"""
+Tests for timed mode and the SQLite speedrun leaderboard
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+import time
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+# Add inner package directory for bare imports (main_game_func, etc.)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "words_guessing_game_banbar1"))
+
+import pygame
+pygame.init()
+
+from main_game_func import GameManager
+from functions.leaderboard import Leaderboard, LeaderboardDB, format_time
+
+
+def wait_done(entry, timeout=5.0):
+    """Poll a LeaderboardEntry the way EndScreen does"""
+    deadline = time.monotonic() + timeout
+    while not entry.done and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return entry.done
+
+
+class TestLeaderboardDB:
+    """Tests for the synchronous leaderboard queries"""
+
+    def setup_method(self):
+        """Set up an in-memory board"""
+        self.db = LeaderboardDB(":memory:")
+
+    def teardown_method(self):
+        self.db.close()
+
+    def test_top_times_sorted(self):
+        """Top times should be fastest first and per setting"""
+        for t in [5_000_000, 2_000_000, 9_000_000, 3_500_000]:
+            self.db.add_result(5, 6, t)
+        self.db.add_result(7, 6, 1_000_000)
+
+        assert self.db.top_times(5, 6, 3) == [2_000_000, 3_500_000, 5_000_000]
+
+    def test_rank_across_buckets(self):
+        """Rank should count faster times in earlier buckets and the same bucket"""
+        for t in [1_200_000, 2_100_000, 2_400_000, 2_900_000, 7_000_000]:
+            self.db.add_result(5, 6, t)
+
+        assert self.db.rank_of(5, 6, 1_000_000) == 1
+        assert self.db.rank_of(5, 6, 2_400_000) == 3
+        assert self.db.rank_of(5, 6, 2_500_000) == 4
+        assert self.db.rank_of(5, 6, 60_000_000) == 6
+        assert self.db.count(5, 6) == 5
+
+    def test_rank_matches_naive_count(self):
+        """Histogram rank should equal a plain COUNT of faster rows"""
+        times = [(i * 7919) % 30_000_000 for i in range(500)]
+        for t in times:
+            self.db.add_result(4, 4, t)
+
+        for probe in [0, 999_999, 1_000_000, 12_345_678, 29_999_999]:
+            expected = sum(1 for t in times if t < probe) + 1
+            assert self.db.rank_of(4, 4, probe) == expected
+
+
+class TestTimedGame:
+    """Tests for timed mode in GameManager"""
+
+    def test_timer_starts_on_first_keystroke(self):
+        """No time accumulates before the first keystroke"""
+        manager = GameManager()
+        manager.start_game(6, 5, timed=True)
+        assert manager.get_elapsed_us() == 0
+
+        manager.start_timer()
+        first_start = manager.timer_start_ns
+        manager.start_timer()
+        assert manager.timer_start_ns == first_start
+
+    def test_timer_starts_with_first_letter(self):
+        """Only a letter that is actually added starts the clock"""
+        manager = GameManager()
+        manager.start_game(6, 5, timed=True)
+        manager.remove_letter()
+        manager.submit_guess("")
+        assert manager.timer_start_ns is None
+
+        manager.add_letter("a")
+        assert manager.timer_start_ns is not None
+
+    def test_untimed_game_has_no_timer(self):
+        """start_timer should be a no-op outside timed mode"""
+        manager = GameManager()
+        manager.start_game(6, 5)
+        manager.start_timer()
+        assert manager.timer_start_ns is None
+
+    def test_win_submits_to_leaderboard(self, tmp_path):
+        """A timed win should be inserted and ranked off the calling thread"""
+        leaderboard = Leaderboard(str(tmp_path / "board.db"))
+        manager = GameManager(leaderboard=leaderboard)
+        manager.start_game(6, 5, timed=True)
+        manager.start_timer()
+        manager.submit_guess(manager.guess_word)
+
+        entry = manager.leaderboard_entry
+        assert manager.solve_time_us is not None
+        assert wait_done(entry)
+        assert entry.rank == 1
+        assert entry.top_times == [manager.solve_time_us]
+        leaderboard.close()
+
+    def test_format_time(self):
+        """Times are shown in seconds with two decimals"""
+        assert format_time(12_345_678) == "12.35s"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
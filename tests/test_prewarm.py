@@ -0,0 +1,83 @@
+"""
+Tests for preparing the next game on the end screen
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.prewarm import NextGamePrewarm
+from words_guessing_game_banbar1.ui.end_screen import EndScreen
+from words_guessing_game_banbar1.ui.game_screen import GameScreen
+from words_guessing_game_banbar1.main_game_func import GameManager, GameState
+
+constants.init_fonts()
+
+
+class TestNextGamePrewarm:
+    """Tests for NextGamePrewarm"""
+
+    def test_steps_build_everything(self):
+        """Stepping once per frame should end with a ready grid and keyboard"""
+        prewarm = NextGamePrewarm(6, 5)
+        for _ in range(10):
+            prewarm.step()
+        prewarm.finish()
+
+        assert prewarm.ready
+        assert len(prewarm.word) == 5
+        assert prewarm.grid.max_attempts == 6
+        assert prewarm.grid._empty_surface is not None
+        assert prewarm.keyboard._base_surface is not None
+
+    def test_word_matches_seed(self):
+        """The prepared word is the one start_game would pick for the seed"""
+        prewarm = NextGamePrewarm(4, 7)
+        prewarm.finish()
+
+        manager = GameManager()
+        manager.start_game(4, 7, seed=prewarm.seed)
+        assert manager.guess_word == prewarm.word
+
+
+class TestEndScreenPrewarm:
+    """Tests for handing the prepared game to the game screen"""
+
+    def setup_method(self):
+        """Finish a game and show the end screen for a few frames"""
+        self.manager = GameManager()
+        self.manager.start_game(6, 5)
+        self.manager.submit_guess(self.manager.guess_word)
+        self.end_screen = EndScreen()
+        self.end_screen.initialize_grid(6, 5)
+        for _ in range(5):
+            self.end_screen.update(self.manager)
+
+    def test_play_again_uses_prewarm(self):
+        """PLAY AGAIN starts the prepared word and the game screen adopts its grid"""
+        prewarm = self.end_screen.prewarm
+        self.end_screen.play_again(self.manager)
+
+        assert self.manager.state == GameState.PLAYING
+        assert self.manager.guess_word == prewarm.word
+
+        game_screen = GameScreen()
+        game_screen.initialize_grid(6, 5, self.end_screen.take_prewarm(6, 5))
+        assert game_screen.grid is prewarm.grid
+
+    def test_changed_settings_discard_prewarm(self):
+        """A prewarm for other settings is not handed over"""
+        assert self.end_screen.take_prewarm(6, 7) is None
+        assert self.end_screen.prewarm is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,164 @@
+"""
+Tests for the retained scene graph
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+import tracemalloc
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.scene import Node, Group, TextNode
+from words_guessing_game_banbar1.ui.text_cache import TEXT_CACHE
+from words_guessing_game_banbar1.ui.ui_components import Button, Grid, VirtualKeyboard
+
+constants.init_fonts()
+
+
+class Box(Node):
+    """Solid rectangle counting how often it is drawn"""
+
+    def __init__(self, rect, color):
+        super().__init__(rect)
+        self.color = color
+        self.draws = 0
+
+    def draw(self, surface):
+        self.draws += 1
+        surface.fill(self.color)
+
+
+class TestNode:
+    """Tests for Node"""
+
+    def test_set_state_only_invalidates_on_change(self):
+        """Setting the same value again leaves the cached surface alone"""
+        box = Box((0, 0, 10, 10), (255, 0, 0))
+        box.get_surface()
+        assert not box.set_state(color=(255, 0, 0))
+        box.get_surface()
+        assert box.draws == 1
+
+        assert box.set_state(color=(0, 255, 0))
+        box.get_surface()
+        assert box.draws == 2
+
+
+class TestGroup:
+    """Tests for Group compositing"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.group = Group((0, 0, 100, 50))
+        self.left = self.group.add(Box((10, 10, 20, 20), (255, 0, 0)))
+        self.right = self.group.add(Box((60, 10, 20, 20), (0, 0, 255)))
+
+    def test_only_changed_children_are_redrawn(self):
+        """After the first full composite, a change damages and redraws just that child"""
+        assert self.group.composite() == [pygame.Rect(0, 0, 100, 50)]
+        assert not self.group.composite()
+
+        self.left.set_state(color=(0, 255, 0))
+        assert self.group.composite() == [pygame.Rect(10, 10, 20, 20)]
+        assert self.left.draws == 2
+        assert self.right.draws == 1
+        assert self.group.get_surface().get_at((15, 15))[:3] == (0, 255, 0)
+
+    def test_hidden_child_uncovers_base(self):
+        """Hiding a child restores what lies under it"""
+        self.group.composite()
+        self.right.set_state(visible=False)
+
+        assert self.group.composite() == [pygame.Rect(60, 10, 20, 20)]
+        assert self.group.get_surface().get_at((65, 15))[:3] == constants.COLORS['background']
+
+    def test_nested_group_reports_inner_damage(self):
+        """A change deep inside a nested group damages only its own area"""
+        outer = Group((0, 0, 200, 100))
+        outer.add(self.group)
+        outer.composite()
+
+        self.right.set_state(color=(255, 255, 0))
+        assert outer.composite() == [pygame.Rect(60, 10, 20, 20)]
+        assert outer.get_surface().get_at((65, 15))[:3] == (255, 255, 0)
+
+    def test_text_node_moves_with_its_text(self):
+        """Longer text re-centers the node; old and new areas are both damaged"""
+        text = self.group.add(TextNode('small', "a", (255, 255, 255), position=(50, 40)))
+        self.group.composite()
+        old_rect = text.rect.copy()
+
+        text.set_text("a longer line")
+        damaged = self.group.composite()
+        assert old_rect in damaged and text.rect in damaged
+
+    def test_uncached_text_node_skips_the_cache(self):
+        """Text that changes every frame is rendered without filling the shared cache"""
+        text = self.group.add(TextNode('small', "", (255, 255, 255), position=(50, 40), cached=False))
+        entries, misses = len(TEXT_CACHE), TEXT_CACHE.misses
+        for frame in range(50):
+            text.set_text(f"Time: {frame / 100:.2f}s")
+            self.group.composite()
+        assert (len(TEXT_CACHE), TEXT_CACHE.misses) == (entries, misses)
+        assert text.get_surface().get_size() == text.rect.size
+
+
+class TestWidgets:
+    """Tests for widgets built on the scene graph"""
+
+    def test_hover_redraws_one_button(self):
+        """Hovering a button invalidates it, moving within it does not"""
+        button = Button("OK", (0, 0))
+        button.get_surface()
+        button.update((5, 5))
+        assert button.dirty
+        button.get_surface()
+        button.update((6, 6))
+        assert not button.dirty
+
+    def test_keyboard_redraws_changed_keys_only(self):
+        """Changing one letter's state damages that key alone"""
+        keyboard = VirtualKeyboard()
+        keyboard.update_keys()
+        keyboard.composite()
+
+        keyboard.letter_states['Q'] = 'correct'
+        keyboard.update_keys()
+        assert keyboard.composite() == [keyboard.keys[0]['rect']]
+
+
+class TestGridAllocations:
+    """Tests for the steady-state grid render path"""
+
+    def test_steady_render_allocates_nothing(self):
+        """Redrawing an unchanged grid leaves no memory behind and holds no per-tile objects"""
+        grid = Grid(6, 5)
+        surface = pygame.Surface((600, 800))
+        guesses = [{'word': 'world', 'match_indexes': [3], 'right_indexes': [1]}]
+        for _ in range(3):
+            grid.render(surface, guesses, "ab")
+
+        tracemalloc.start()
+        try:
+            grid.render(surface, guesses, "ab")
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for _ in range(500):
+                grid.render(surface, guesses, "ab")
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert current - base < 100  # The measured ints themselves; a per-frame leak would be 500x
+        assert peak - base < 256  # Far below one small object per tile
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,195 @@
+"""
+Tests for screen rendering
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.setup_screen import SetupScreen
+from words_guessing_game_banbar1.ui.game_screen import GameScreen
+from words_guessing_game_banbar1.ui.end_screen import EndScreen
+from words_guessing_game_banbar1.ui.dirty_rects import DirtyTracker, ANIMATING
+from words_guessing_game_banbar1.main_game_func import GameManager
+
+constants.init_fonts()
+
+
+def new_surface():
+    return pygame.Surface((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
+
+
+class TestStaticLayers:
+    """Tests for the per-screen static background layers"""
+
+    def test_setup_layer_built_once(self):
+        """The setup screen draws its static content on the first frame only"""
+        screen = SetupScreen()
+        surface = new_surface()
+        screen.render(surface, GameManager())
+        layer = screen.background
+        screen.render(surface, GameManager())
+
+        assert layer is not None
+        assert screen.background is layer
+
+    def test_game_layer_rebuilt_per_game(self):
+        """A new game gets a fresh layer, frames within a game reuse it"""
+        gm = GameManager()
+        gm.start_game(6, 5, seed=1)
+        screen = GameScreen()
+        screen.initialize_grid(6, 5)
+        surface = new_surface()
+        screen.render(surface, gm)
+        layer = screen.background
+        screen.render(surface, gm)
+        assert screen.background is layer
+
+        screen.initialize_grid(6, 5)
+        assert screen.background is None
+
+    def test_end_layer_covers_previous_frame(self):
+        """The end screen is drawn correctly over whatever was on screen before"""
+        gm = GameManager()
+        gm.start_game(1, 5, word="hello")
+        gm.submit_guess("world")  # Lost, so no bounce animation moves between frames
+        screen = EndScreen()
+        screen.initialize_grid(1, 5)
+
+        clean = new_surface()
+        clean.fill(constants.COLORS['background'])
+        dirty = new_surface()
+        dirty.fill((255, 0, 255))
+        screen.render(clean, gm)
+        screen.render(dirty, gm)
+
+        assert pygame.image.tobytes(clean, 'RGB') == pygame.image.tobytes(dirty, 'RGB')
+
+
+class TestDirtyTracker:
+    """Tests for DirtyTracker"""
+
+    def test_first_frame_is_full(self):
+        """Nothing has been presented yet, so the first frame is flipped whole"""
+        tracker = DirtyTracker()
+        tracker.track('a', 1, (0, 0, 10, 10))
+        assert tracker.take() is None
+
+    def test_only_changes_are_reported(self):
+        """Unchanged elements are clean; changed and removed ones report their areas"""
+        tracker = DirtyTracker()
+        tracker.track('same', 1, (0, 0, 10, 10))
+        tracker.track('text', 'a', (20, 0, 10, 10))
+        tracker.track('gone', 1, (40, 0, 10, 10))
+        tracker.take()
+
+        tracker.track('same', 1, (0, 0, 10, 10))
+        tracker.track('text', 'ab', (20, 0, 20, 10))
+        assert tracker.take() == [pygame.Rect(20, 0, 20, 10), pygame.Rect(40, 0, 10, 10)]
+
+        tracker.track('same', 1, (0, 0, 10, 10))
+        tracker.track('text', 'ab', (20, 0, 20, 10))
+        assert tracker.take() == []
+
+    def test_animating_always_dirty(self):
+        """ANIMATING elements are reported every frame, and once more when they settle"""
+        tracker = DirtyTracker()
+        tracker.take()
+        for state in (ANIMATING, ANIMATING, 'done'):
+            tracker.track('row', state, (0, 0, 10, 10))
+            assert tracker.take() == [pygame.Rect(0, 0, 10, 10)]
+
+    def test_invalidate(self):
+        """invalidate() turns the next frame into a full flip"""
+        tracker = DirtyTracker()
+        tracker.take()
+        tracker.invalidate()
+        assert tracker.take() is None
+
+
+class TestScreenDirtyRects:
+    """Tests for the regions screens report as changed"""
+
+    def test_typed_letter_dirties_its_row(self):
+        """An idle frame changes nothing; typing a letter dirties its tile and the input text"""
+        gm = GameManager()
+        gm.start_game(6, 5, seed=1)
+        screen = GameScreen()
+        screen.initialize_grid(6, 5)
+        surface = new_surface()
+        screen.render(surface, gm)
+        screen.dirty.take()
+        screen.render(surface, gm)
+        assert screen.dirty.take() == []
+
+        gm.add_letter('a')
+        screen.render(surface, gm)
+        changed = screen.dirty.take()
+        assert changed
+        assert any(rect.contains(screen.grid.tiles[0][0].rect) for rect in changed)
+        assert any(rect.contains(screen.input_node.rect) for rect in changed)
+        assert sum(rect.width * rect.height for rect in changed) < surface.get_width() * surface.get_height() * 0.1
+
+
+class TestIdleDetection:
+    """Tests for is_animating, which lets the main loop sleep between inputs"""
+
+    def test_game_screen_idle_until_input(self):
+        """A fresh game is idle; a typed letter animates until its pop and key press end"""
+        gm = GameManager()
+        gm.start_game(6, 5, seed=1)
+        screen = GameScreen()
+        screen.initialize_grid(6, 5)
+        assert not screen.is_animating(gm)
+
+        screen.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode='a'), gm)
+        assert screen.is_animating(gm)
+
+    def test_running_clock_keeps_frames_coming(self):
+        """The timer display of a timed game changes every frame once started"""
+        gm = GameManager()
+        gm.start_game(6, 5, seed=1, timed=True)
+        screen = GameScreen()
+        screen.initialize_grid(6, 5)
+        assert not screen.is_animating(gm)
+
+        gm.start_timer()
+        assert screen.is_animating(gm)
+
+    def test_clock_waits_for_a_letter(self):
+        """Modifier keys and clicks beside the keyboard do not start the clock"""
+        gm = GameManager()
+        gm.start_game(6, 5, seed=1, timed=True)
+        screen = GameScreen()
+        screen.initialize_grid(6, 5)
+        screen.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LSHIFT, unicode=""), gm)
+        screen.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(1, 1), button=1), gm)
+        assert gm.timer_start_ns is None
+
+        screen.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="a"), gm)
+        assert gm.timer_start_ns is not None
+
+    def test_end_screen_busy_while_preparing(self):
+        """The end screen needs frames until the next game has been prepared"""
+        gm = GameManager()
+        gm.start_game(1, 5, word="hello")
+        gm.submit_guess("world")
+        screen = EndScreen()
+        screen.initialize_grid(1, 5)
+        assert screen.is_animating(gm)
+
+        screen.update(gm)
+        screen.prewarm.finish()
+        assert not screen.is_animating(gm)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
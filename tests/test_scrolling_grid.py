@@ -0,0 +1,149 @@
+"""
+Tests for the virtualized scrolling grid
+Run with: pytest tests/ -v
+"""
+
+import math
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.layout import get_grid_layout
+from words_guessing_game_banbar1.ui.ui_components import Grid, ScrollingGrid, NumberSelector, create_grid
+from words_guessing_game_banbar1.ui.timeline import FrameClock, Timeline, VirtualTime
+from words_guessing_game_banbar1.ui.game_screen import GameScreen
+from words_guessing_game_banbar1.main_game_func import GameManager
+
+constants.init_fonts()
+
+DESIGN = (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)
+GUESS = {'word': 'world', 'match_indexes': [3], 'right_indexes': [1]}
+
+
+def key_event(char, key=0):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char)
+
+
+def make_grid(attempts):
+    return create_grid(attempts, 5, get_grid_layout(DESIGN, 5, attempts))
+
+
+class TestScrollingGrid:
+    """Tests for ScrollingGrid"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.screen = pygame.Surface(DESIGN)
+
+    def test_only_tall_boards_scroll(self):
+        """Boards that fit keep the plain grid; taller ones scroll with readable tiles"""
+        assert type(make_grid(6)) is Grid
+        grid = make_grid(100)
+        assert isinstance(grid, ScrollingGrid)
+        assert grid.tile_size >= constants.MIN_TILE_SIZE
+        assert grid.rect.bottom < constants.KEYBOARD_TOP_MARGIN
+
+    def test_renders_visible_rows_only(self):
+        """Only rows in the viewport get a cached surface, however many rows hold letters"""
+        grid = make_grid(1000)
+        guesses = [GUESS] * 999
+        grid.render(self.screen, guesses, "")
+        assert len(grid._row_surfaces) <= len(grid.visible_rows())
+
+        grid.set_scroll(500 * grid.row_pitch)
+        grid.render(self.screen, guesses, "")
+        assert len(grid._row_surfaces) <= len(grid.visible_rows())
+        assert 500 in grid.visible_rows()
+
+    def test_typing_damages_one_row(self):
+        """A change to a visible row redraws only that row"""
+        grid = make_grid(40)
+        grid.render(self.screen, [GUESS], "")
+        assert grid.render(self.screen, [GUESS], "") == ()
+
+        damaged = grid.render(self.screen, [GUESS], "h")
+        assert len(damaged) == 1
+        assert damaged[0].height == math.ceil(grid.tile_size) + 1
+
+    def test_offset_showing(self):
+        """Rows are scrolled into view by the shortest distance, within the content"""
+        grid = make_grid(40)
+        assert grid.offset_showing(0, 0) == 0
+        below = grid.offset_showing(20, 0)
+        assert below > 0
+        assert grid.offset_showing(20, below) == below
+        assert grid.offset_showing(39, 0) == grid.max_scroll
+
+
+class TestGameScreenScrolling:
+    """Tests for the game screen keeping the active row in view"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.time = VirtualTime()
+        self.timeline = Timeline(FrameClock(self.time))
+        self.gm = GameManager()
+        self.gm.start_game(40, 5, word="hello")
+        self.screen = GameScreen(timeline=self.timeline)
+        self.screen.initialize_grid(40, 5)
+        self.surface = pygame.Surface(DESIGN)
+
+    def frames(self, seconds):
+        """Run the timeline and render at 60 frames per second"""
+        for _ in range(round(seconds * 60)):
+            self.timeline.fast_forward(1 / 60)
+            self.screen.render(self.surface, self.gm)
+
+    def test_follows_active_row(self):
+        """Submitting past the viewport scrolls smoothly to the new input row"""
+        self.screen.render(self.surface, self.gm)
+        for _ in range(15):
+            for char in "world":
+                self.screen.handle_event(key_event(char), self.gm)
+            self.screen.handle_event(key_event('\r', pygame.K_RETURN), self.gm)
+            self.frames(2.0)
+
+        grid = self.screen.grid
+        assert 15 in grid.visible_rows()
+        assert grid.scroll_y == self.screen.scroll_target > 0
+        assert self.screen.scroll_animation is None
+
+    def test_wheel_then_typing(self):
+        """The wheel scrolls away from the input row until the next keystroke"""
+        for _ in range(15):
+            self.gm.submit_guess("world")
+        self.screen.render(self.surface, self.gm)
+        bottom = self.screen.grid.scroll_y
+
+        self.screen.handle_event(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=3, flipped=False), self.gm)
+        assert self.screen.is_animating(self.gm)
+        self.frames(constants.SCROLL_DURATION + 0.1)
+        assert self.screen.grid.scroll_y < bottom
+
+        self.screen.handle_event(key_event('h'), self.gm)
+        self.frames(constants.SCROLL_DURATION + 0.1)
+        assert self.screen.grid.scroll_y == bottom
+
+
+class TestNumberSelectorRows:
+    """Tests for selectors with more choices than fit in one row"""
+
+    def test_wraps_choices(self):
+        """Choices wrap into centered rows of NUMBER_BUTTONS_PER_ROW"""
+        selector = NumberSelector(1, 100, 6, (300, 150), "Attempts", values=constants.ATTEMPT_CHOICES)
+        rows = {btn['rect'].y for btn in selector.buttons}
+        assert len(rows) == 2
+        assert selector.max_val == 100
+        assert selector.handle_hit(selector.children[-1])
+        assert selector.selected == 100
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,162 @@
+"""
+Tests for the asyncio game server and load generator
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import json
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+# Add inner package directory for bare imports (main_game_func, etc.)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "words_guessing_game_banbar1"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.server.game_server import GameServer
+from words_guessing_game_banbar1.server.loadgen import run_load, percentile
+
+
+class TestHandleRequest:
+    """Tests for request dispatch without sockets"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.server = GameServer(max_sessions=3, session_timeout=10.0)
+
+    def new_session(self, now=0.0, **extra):
+        request = {'op': 'new', 'attempts': 2, 'length': 5}
+        request.update(extra)
+        return self.server.handle_request(request, now)['session']
+
+    def test_new_and_winning_guess(self):
+        """A correct guess should win and reveal the word"""
+        session = self.new_session()
+        word = self.server.sessions[session].manager.guess_word
+
+        response = self.server.handle_request({'op': 'guess', 'session': session, 'word': word}, 1.0)
+
+        assert response['valid'] == True
+        assert response['state'] == 'WIN'
+        assert response['word'] == word
+        assert response['match_indexes'] == [0, 1, 2, 3, 4]
+
+    def test_invalid_guess_keeps_playing(self):
+        """Dictionary errors are reported without using an attempt"""
+        session = self.new_session()
+        response = self.server.handle_request({'op': 'guess', 'session': session, 'word': 'xxxxx'}, 1.0)
+
+        assert response['valid'] == False
+        assert "dictionary" in response['error']
+        assert response['attempts_remaining'] == 2
+        assert 'word' not in response
+
+    def test_request_id_is_echoed(self):
+        """Responses carry the request id"""
+        response = self.server.handle_request({'op': 'stats', 'id': 42})
+        assert response['id'] == 42
+
+    def test_bad_requests(self):
+        """Unknown ops, sessions and settings are rejected"""
+        assert self.server.handle_request({'op': 'fly'})['ok'] == False
+        assert self.server.handle_request({'op': 'guess', 'session': 'nope', 'word': 'hello'})['ok'] == False
+        assert self.server.handle_request({'op': 'guess'})['ok'] == False
+        assert self.server.handle_request({'op': 'new', 'attempts': 0, 'length': 5})['ok'] == False
+        for timeout in ("nan", "inf", -5, 0, "soon", None, [1]):
+            response = self.server.handle_request({'op': 'new', 'timeout': timeout})
+            assert response['ok'] == False and response['error'].startswith("timeout")
+        assert len(self.server.sessions) == 0
+        for op in ([], {}, None, 3):
+            assert self.server.handle_request({'op': op})['ok'] == False
+
+    def test_lru_eviction(self):
+        """The least recently used session is dropped above max_sessions"""
+        first = self.new_session(now=0.0)
+        second = self.new_session(now=1.0)
+        self.new_session(now=2.0)
+        self.server.handle_request({'op': 'state', 'session': first}, 3.0)  # touch first
+        self.new_session(now=4.0)
+
+        assert first in self.server.sessions
+        assert second not in self.server.sessions
+        assert self.server.evicted == 1
+
+    def test_idle_timeout(self):
+        """Sessions idle past their own timeout are evicted"""
+        short = self.new_session(now=0.0, timeout=1.0)
+        default = self.new_session(now=0.0)
+
+        assert self.server.evict_idle(now=5.0) == 1
+        assert short not in self.server.sessions
+        assert default in self.server.sessions
+
+
+class TestServerSockets:
+    """End-to-end tests over TCP"""
+
+    def test_json_lines_roundtrip(self):
+        """Requests and responses are single JSON lines"""
+        async def scenario():
+            server = GameServer()
+            listener = await server.start("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+            writer.write(b'{"op": "new", "attempts": 6, "length": 4}\n')
+            created = json.loads(await reader.readline())
+            writer.write(b'not json\n')
+            broken = json.loads(await reader.readline())
+            writer.write(b'{"op": []}\n')
+            unhashable = json.loads(await reader.readline())
+
+            writer.close()
+            await server.stop()
+            return created, broken, unhashable
+
+        created, broken, unhashable = asyncio.run(scenario())
+        assert created['ok'] == True
+        assert created['length'] == 4
+        assert broken['ok'] == False
+        assert unhashable['ok'] == False
+
+    def test_load_generator(self):
+        """The load generator should complete games and report latencies"""
+        async def scenario():
+            server = GameServer()
+            listener = await server.start("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+
+            async def connect():
+                return await asyncio.open_connection("127.0.0.1", port)
+
+            report = await run_load(connect, clients=4, games=3, attempts=3, seed=1)
+            await server.stop()
+            return server, report
+
+        server, report = asyncio.run(scenario())
+        summary = report.summary()
+        assert summary['errors'] == 0
+        assert summary['new']['count'] == 12
+        assert summary['guess']['count'] >= 12
+        assert summary['rps'] > 0
+        assert len(server.sessions) == 0
+
+    def test_percentile(self):
+        """Nearest-rank percentiles"""
+        values = list(range(1, 101))
+        assert percentile(values, 0.50) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile(values, 0.07) == 7
+        assert percentile([1, 2, 3, 4, 5], 0.5) == 3
+        assert percentile(list(range(1, 151)), 0.99) == 149
+        assert percentile(list(range(1, 151)), 0.95) == 143
+        assert percentile([7], 0.99) == 7
+        assert percentile([], 0.5) == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
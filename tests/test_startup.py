@@ -0,0 +1,111 @@
+"""
+Tests for deferred construction at startup and the cold-start benchmark
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import subprocess
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+# The benchmarks are scripts, not a package
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.setup_screen import SetupScreen
+from words_guessing_game_banbar1.main_game_func import ScreenSet, GameState
+import cold_start
+
+constants.init_fonts()
+
+LARGE = (900, 1100)
+
+
+class TestScreenSet:
+    """Tests for screens built on first use"""
+
+    def test_builds_on_first_use(self):
+        """Only the screens of states that were shown exist"""
+        screens = ScreenSet()
+        assert screens.built(GameState.PLAYING) is None
+        assert isinstance(screens[GameState.SETUP], SetupScreen)
+        assert screens.built(GameState.PLAYING) is None
+        assert screens[GameState.SETUP] is screens[GameState.SETUP]
+
+    def test_win_and_lose_share_the_end_screen(self):
+        """Both end states show the same screen"""
+        screens = ScreenSet()
+        assert screens[GameState.WIN] is screens[GameState.LOSE]
+
+    def test_later_screens_use_current_size(self):
+        """A screen built after a resize is laid out for the resized window"""
+        screens = ScreenSet()
+        screens[GameState.SETUP]
+        screens.resize(LARGE)
+        assert screens[GameState.SETUP].start_button.rect.centerx == LARGE[0] // 2
+        assert screens[GameState.PLAYING].layout.size == LARGE
+
+
+class TestDeferredImports:
+    """Tests for work left out of the import of the game module"""
+
+    def test_import_defers_screens_and_dictionary(self):
+        """Importing main_game_func neither imports the later screens nor reads the dictionary"""
+        code = (
+            "import sys\n"
+            "from words_guessing_game_banbar1 import main_game_func\n"
+            "from words_guessing_game_banbar1.functions import word_loader\n"
+            "late = [m for m in ('words_guessing_game_banbar1.ui.game_screen',\n"
+            "                    'words_guessing_game_banbar1.ui.end_screen',\n"
+            "                    'concurrent.futures.process') if m in sys.modules]\n"
+            "print(late, word_loader._english_words is None)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, "src"), PYGAME_HIDE_SUPPORT_PROMPT="1")
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+        assert result.stdout.strip() == "[] True", result.stderr
+
+    def test_fonts_open_on_first_use(self):
+        """A font table opens each named font once, when it is first drawn with"""
+        fonts = constants.FontTable()
+        assert 'key' not in fonts
+        assert fonts['key'] is fonts['key']
+        assert fonts['key'].get_height() == pygame.font.Font(None, constants.FONT_SIZES['key']).get_height()
+        with pytest.raises(KeyError):
+            fonts['missing']
+
+
+class TestColdStartBenchmark:
+    """Tests for benchmarks/cold_start.py"""
+
+    def test_first_frame(self):
+        """A headless cold start presents a frame and is timed"""
+        ms, report = cold_start.run_once(import_time=True)
+        assert 0 < ms < 60_000
+        breakdown = cold_start.import_breakdown(report)
+        assert breakdown["groups"]["pygame"] > 0
+        assert any(name.endswith("main_game_func") for name, _ in breakdown["modules"])
+
+    def test_import_breakdown(self):
+        """Top-level imports are grouped; package modules are ranked by self time"""
+        report = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:      1000 |       1000 |   pygame.base",
+            "import time:       500 |       3000 | pygame",
+            "import time:      2000 |       2000 |   words_guessing_game_banbar1.ui.scene",
+            "import time:       100 |       4000 | words_guessing_game_banbar1.main_game_func",
+            "import time:       300 |        300 | json",
+        ])
+        breakdown = cold_start.import_breakdown(report)
+        assert breakdown["groups"] == {"pygame": 3.0, "words_guessing_game_banbar1": 4.0, "other": 0.3}
+        assert breakdown["modules"][0] == ("words_guessing_game_banbar1.ui.scene", 2.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""
+Tests for persistent player statistics
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+# Add inner package directory for bare imports (main_game_func, etc.)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "words_guessing_game_banbar1"))
+
+import pygame
+pygame.init()
+
+from main_game_func import GameManager
+from functions.stats import PlayerStats
+
+
+class TestPlayerStats:
+    """Tests for PlayerStats aggregates"""
+
+    def test_initial_stats(self):
+        """Fresh stats should be empty"""
+        stats = PlayerStats()
+        assert stats.games_played == 0
+        assert stats.win_rate == 0
+        assert stats.get_distribution(5, 6) == [0] * 6
+
+    def test_win_updates_aggregates(self):
+        """A win should bump played, wins, streak and distribution"""
+        stats = PlayerStats()
+        stats.record_game(5, 6, won=True, guesses_used=3)
+
+        assert stats.games_played == 1
+        assert stats.wins == 1
+        assert stats.current_streak == 1
+        assert stats.max_streak == 1
+        assert stats.get_distribution(5, 6) == [0, 0, 1, 0, 0, 0]
+
+    def test_loss_resets_streak(self):
+        """A loss should reset the current streak but keep the max"""
+        stats = PlayerStats()
+        stats.record_game(5, 6, won=True, guesses_used=2)
+        stats.record_game(5, 6, won=True, guesses_used=4)
+        stats.record_game(5, 6, won=False, guesses_used=6)
+
+        assert stats.current_streak == 0
+        assert stats.max_streak == 2
+        assert stats.win_rate == 67
+
+    def test_settings_are_separate(self):
+        """Each (length, attempts) setting has its own distribution"""
+        stats = PlayerStats()
+        stats.record_game(5, 6, won=True, guesses_used=1)
+        stats.record_game(7, 3, won=True, guesses_used=3)
+
+        assert stats.get_distribution(5, 6) == [1, 0, 0, 0, 0, 0]
+        assert stats.get_distribution(7, 3) == [0, 0, 1]
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Stats written to disk should load back identically"""
+        path = str(tmp_path / "stats.json")
+        stats = PlayerStats(path)
+        stats.record_game(5, 6, won=True, guesses_used=2)
+
+        loaded = PlayerStats.load(path)
+        assert loaded.to_dict() == stats.to_dict()
+        assert not [name for name in os.listdir(tmp_path) if name.startswith(".tmp-")]
+
+    def test_corrupt_file_starts_fresh(self, tmp_path):
+        """A corrupt stats file should not crash loading"""
+        path = tmp_path / "stats.json"
+        path.write_text("{not json")
+
+        stats = PlayerStats.load(str(path))
+        assert stats.games_played == 0
+
+
+class TestGameManagerStats:
+    """Tests for GameManager feeding PlayerStats"""
+
+    def test_win_is_recorded(self):
+        """Winning a game should record it once"""
+        stats = PlayerStats()
+        manager = GameManager(stats=stats)
+        manager.start_game(attempts=6, length=5)
+        manager.submit_guess(manager.guess_word)
+
+        assert stats.games_played == 1
+        assert stats.get_distribution(5, 6)[0] == 1
+
+    def test_loss_is_recorded(self):
+        """Running out of attempts should record a loss"""
+        stats = PlayerStats()
+        manager = GameManager(stats=stats)
+        manager.start_game(attempts=1, length=5)
+        manager.guess_word = "zzzzz"
+        manager.submit_guess("hello")
+
+        assert stats.games_played == 1
+        assert stats.wins == 0
+
+    def test_invalid_guess_not_recorded(self):
+        """Rejected guesses should not touch the stats"""
+        stats = PlayerStats()
+        manager = GameManager(stats=stats)
+        manager.start_game(attempts=1, length=5)
+        manager.submit_guess("xxxxx")
+
+        assert stats.games_played == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""
+Tests for the rendered text cache
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import subprocess
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.text_cache import TextCache
+
+constants.init_fonts()
+WHITE = (255, 255, 255)
+
+
+class TestTextCache:
+    """Tests for TextCache"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.cache = TextCache(max_entries=2)
+        self.font = constants.FONTS['normal']
+
+    def test_hit_returns_same_surface(self):
+        """A repeated lookup should not rasterize again"""
+        first = self.cache.render(self.font, "HELLO", WHITE)
+        second = self.cache.render(self.font, "HELLO", WHITE)
+
+        assert first is second
+        assert self.cache.hits == 1
+        assert self.cache.misses == 1
+
+    def test_key_includes_font_color_and_antialias(self):
+        """Different fonts, colors or antialias settings are separate entries"""
+        cache = TextCache()
+        cache.render(self.font, "A", WHITE)
+        cache.render(constants.FONTS['small'], "A", WHITE)
+        cache.render(self.font, "A", (255, 0, 0))
+        cache.render(self.font, "A", WHITE, antialias=False)
+
+        assert cache.misses == 4
+        assert len(cache) == 4
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        a = self.cache.render(self.font, "A", WHITE)
+        self.cache.render(self.font, "B", WHITE)
+        self.cache.render(self.font, "A", WHITE)   # A is now most recent
+        self.cache.render(self.font, "C", WHITE)   # evicts B
+
+        assert len(self.cache) == 2
+        assert self.cache.evictions == 1
+        assert self.cache.render(self.font, "A", WHITE) is a
+        misses = self.cache.misses
+        self.cache.render(self.font, "B", WHITE)
+        assert self.cache.misses == misses + 1
+
+    def test_summary_reports_counters(self):
+        """summary() mentions hits and misses"""
+        self.cache.render(self.font, "A", WHITE)
+        self.cache.render(self.font, "A", WHITE)
+        assert "1 hits, 1 misses" in self.cache.summary()
+
+
+class TestReport:
+    """Tests for the exit-time report"""
+
+    def test_main_prints_summary(self, tmp_path):
+        """main(text_cache_stats=True) prints the counters when the game exits"""
+        code = (
+            "from words_guessing_game_banbar1.main_game_func import main\n"
+            "from words_guessing_game_banbar1.ui.headless import InputScript\n"
+            f"main(stats_path={str(tmp_path / 'stats.json')!r}, leaderboard_path={str(tmp_path / 'lb.db')!r},\n"
+            "     headless=True, input_script=InputScript().at(20), text_cache_stats=True)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=os.path.join(root, "src"), PYGAME_HIDE_SUPPORT_PROMPT="1")
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().startswith("text cache: ")
+        assert "0 hits" not in result.stdout
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,53 @@
+"""
+Tests for the pre-rendered tile atlas
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.tile_atlas import get_atlas, COLOR_TYPES, LETTERS
+from words_guessing_game_banbar1.ui.ui_components import Grid
+
+constants.init_fonts()
+
+
+class TestTileAtlas:
+    """Tests for TileAtlas and get_atlas"""
+
+    def test_all_tiles_prebuilt(self):
+        """Every color type and letter (plus blank) is built up front"""
+        atlas = get_atlas(40)
+        assert len(atlas._tiles) == len(COLOR_TYPES) * (len(LETTERS) + 1)
+        assert atlas.get('correct', 'Q').get_size() == (40, 40)
+
+    def test_same_size_reuses_atlas(self):
+        """The atlas is only rebuilt when the tile size changes"""
+        assert get_atlas(52) is get_atlas(52)
+        assert get_atlas(52) is not get_atlas(53)
+
+    def test_grids_of_same_size_share_atlas(self):
+        """Two grids with the same settings render from one atlas"""
+        first = Grid(6, 5)
+        second = Grid(6, 5)
+        first.prerender_empty()
+        second.prerender_empty()
+        assert first.atlas is second.atlas
+
+    def test_fractional_size_and_unusual_letters(self):
+        """Fractional sizes are truncated and letters outside A-Z are drawn on demand"""
+        atlas = get_atlas(54.5)
+        assert atlas.get('empty', '').get_size() == (54, 54)
+        assert atlas.get('absent', 'É').get_size() == (54, 54)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,148 @@
+"""
+Tests for the animation clock and timeline
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.animations import Delay, TilePopAnimation, ScreenFadeTransition
+from words_guessing_game_banbar1.ui.timeline import FrameClock, Timeline, VirtualTime
+from words_guessing_game_banbar1.ui.game_screen import GameScreen
+from words_guessing_game_banbar1.ui.end_screen import EndScreen
+from words_guessing_game_banbar1.main_game_func import GameManager, GameState
+
+constants.init_fonts()
+
+
+def key_event(char):
+    return pygame.event.Event(pygame.KEYDOWN, key=0, unicode=char)
+
+
+class TestTimeline:
+    """Tests for FrameClock and Timeline"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.time = VirtualTime(100.0)
+        self.timeline = Timeline(FrameClock(self.time))
+
+    def test_time_sampled_once_per_frame(self):
+        """Animations see the frame time, not the time source, until the next tick"""
+        pop = self.timeline.start(TilePopAnimation())
+        self.time.advance(constants.POP_DURATION / 2)
+        assert pop.get_scale() == 1.0
+
+        self.timeline.tick()
+        assert pop.get_scale() == pytest.approx(constants.POP_MAX_SCALE)
+
+    def test_callbacks_run_once_on_completion(self):
+        """on_done runs on the tick that completes the animation and the animation is dropped"""
+        done = []
+        delay = self.timeline.start(Delay(1.0), on_done=done.append)
+        self.timeline.fast_forward(0.5)
+        assert done == [] and delay in self.timeline
+
+        self.timeline.fast_forward(0.5)
+        assert done == [delay]
+        assert not self.timeline.active
+
+        self.timeline.fast_forward(1.0)
+        assert done == [delay]
+
+    def test_cancel_owner(self):
+        """Cancelled animations are dropped without their callbacks"""
+        done = []
+        self.timeline.start(Delay(1.0), on_done=done.append, owner='a')
+        kept = self.timeline.start(Delay(1.0), on_done=done.append, owner='b')
+
+        assert self.timeline.cancel_owner('a') == 1
+        self.timeline.fast_forward(2.0)
+        assert done == [kept]
+
+    def test_fade_phases(self):
+        """The fade goes out to black, reaches its midpoint, then back in"""
+        fade = self.timeline.start(ScreenFadeTransition())
+        assert fade.phase == 'out' and fade.get_alpha() == 0
+        self.timeline.fast_forward(constants.FADE_DURATION)
+        assert fade.midpoint_reached and fade.get_alpha() == 255
+        self.timeline.fast_forward(constants.FADE_DURATION)
+        assert not fade.active and not self.timeline.active
+
+
+class TestScreenTimelines:
+    """Tests for screens running their animations on an injected timeline"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.time = VirtualTime()
+        self.timeline = Timeline(FrameClock(self.time))
+
+    def test_win_applied_after_flip(self):
+        """A winning guess keeps the game screen up until its row has flipped"""
+        gm = GameManager()
+        gm.start_game(6, 5, word="hello")
+        screen = GameScreen(timeline=self.timeline)
+        screen.initialize_grid(6, 5)
+        for char in "hello":
+            screen.handle_event(key_event(char), gm)
+        screen.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode='\r'), gm)
+
+        assert gm.state == GameState.PLAYING and screen.animating
+        self.timeline.fast_forward(2.0)
+        assert gm.state == GameState.WIN
+        assert not screen.animating and screen.flip_animation is None
+
+    def test_error_message_expires(self):
+        """An invalid guess shows its error for ERROR_DURATION"""
+        gm = GameManager()
+        gm.start_game(6, 5, word="hello")
+        screen = GameScreen(timeline=self.timeline)
+        screen.initialize_grid(6, 5)
+        for char in "zzzzz":
+            screen.handle_event(key_event(char), gm)
+        screen.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode='\r'), gm)
+
+        assert screen.error_message
+        self.timeline.fast_forward(constants.ERROR_DURATION - 0.1)
+        assert screen.error_message
+        self.timeline.fast_forward(0.2)
+        assert screen.error_message == ""
+        assert not screen.is_animating(gm)
+
+    def test_new_game_cancels_animations(self):
+        """Starting a new grid drops the animations of the previous game"""
+        gm = GameManager()
+        gm.start_game(6, 5, word="hello")
+        screen = GameScreen(timeline=self.timeline)
+        screen.initialize_grid(6, 5)
+        screen.handle_event(key_event('h'), gm)
+        assert self.timeline.active
+
+        screen.initialize_grid(6, 5)
+        assert not self.timeline.active
+
+    def test_end_screen_bounce(self):
+        """The win bounce runs on the shared timeline and clears itself"""
+        gm = GameManager()
+        gm.start_game(6, 5, word="hello")
+        gm.submit_guess("hello")
+        screen = EndScreen(timeline=self.timeline)
+        screen.initialize_grid(6, 5)
+        screen.start_win_bounce(gm)
+        assert screen.bounce_animation in self.timeline
+
+        self.timeline.fast_forward(2.0)
+        assert screen.bounce_animation is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,107 @@
+"""
+Tests for the screen transition compositor
+Run with: pytest tests/ -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for package imports (words_guessing_game_banbar1.*)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+pygame.init()
+
+from words_guessing_game_banbar1.ui import constants
+from words_guessing_game_banbar1.ui.timeline import FrameClock, Timeline, VirtualTime
+from words_guessing_game_banbar1.ui.transitions import TransitionCompositor, capture_screen
+from words_guessing_game_banbar1.ui.end_screen import EndScreen
+from words_guessing_game_banbar1.main_game_func import GameManager
+
+constants.init_fonts()
+
+SIZE = (60, 40)
+RED = (200, 0, 0)
+BLUE = (0, 0, 200)
+
+
+def solid(color):
+    surface = pygame.Surface(SIZE)
+    surface.fill(color)
+    return surface
+
+
+class TestTransitionCompositor:
+    """Tests for TransitionCompositor"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.time = VirtualTime()
+        self.timeline = Timeline(FrameClock(self.time))
+        self.screen = pygame.Surface(SIZE)
+
+    def start(self, kind):
+        return TransitionCompositor(kind, solid(RED), solid(BLUE), self.timeline)
+
+    def test_fade_goes_through_black(self):
+        """The fade shows the old frame, black at the midpoint, then the new frame"""
+        transition = self.start('fade')
+        transition.draw(self.screen)
+        assert self.screen.get_at((0, 0))[:3] == RED
+
+        self.timeline.fast_forward(constants.FADE_DURATION)
+        transition.draw(self.screen)
+        assert self.screen.get_at((0, 0))[:3] == (0, 0, 0)
+
+        self.timeline.fast_forward(constants.FADE_DURATION)
+        transition.draw(self.screen)
+        assert self.screen.get_at((0, 0))[:3] == BLUE
+        assert not transition.active
+
+    def test_crossfade_blends(self):
+        """Halfway through a crossfade both frames contribute"""
+        transition = self.start('crossfade')
+        self.timeline.fast_forward(constants.FADE_DURATION)
+        transition.draw(self.screen)
+        red, _, blue = self.screen.get_at((0, 0))[:3]
+        assert 80 < red < 120 and 80 < blue < 120
+
+    def test_slide_moves_new_frame_in(self):
+        """The new frame enters from the right"""
+        transition = self.start('slide')
+        self.timeline.fast_forward(constants.FADE_DURATION)
+        transition.draw(self.screen)
+        assert self.screen.get_at((0, 0))[:3] == RED
+        assert self.screen.get_at((SIZE[0] - 1, 0))[:3] == BLUE
+
+    def test_unknown_kind(self):
+        """Unknown transitions are rejected"""
+        with pytest.raises(ValueError):
+            self.start('wipe')
+
+
+class TestCaptureScreen:
+    """Tests for capturing the incoming screen"""
+
+    def test_capture_defers_animations(self):
+        """A screen captured for a transition is presented in full and its bounce can restart later"""
+        time = VirtualTime()
+        timeline = Timeline(FrameClock(time))
+        gm = GameManager()
+        gm.start_game(6, 5, word="hello")
+        gm.submit_guess("hello")
+        screen = EndScreen(timeline=timeline)
+        screen.initialize_grid(6, 5)
+
+        capture_screen(screen, (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT), gm)
+        assert screen.dirty.take() is None
+
+        time.advance(0.5)  # Spent in the transition
+        timeline.tick()
+        timeline.restart_owner(screen)
+        assert screen.bounce_animation.elapsed == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])